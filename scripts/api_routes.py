@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for extracting the Express API routes of the server
+#
+# COMMON CUSTOMIZATIONS:
+# - API_SOURCE_DIRECTORY: Directory scanned for route definitions (default: 'server')
+# - API_ENTRY_FILE: File that creates the Express app; routes are resolved by following its mounts (default: 'server/server.js')
+# - API_SOURCE_EXTENSIONS: Source file extensions scanned for routes; .d.ts files are skipped (default: ['.js', '.ts'])
+# - DIRECTORIES_TO_EXCLUDE: Directories to exclude from scanning (default: ['node_modules', 'dist', '.git', 'tests', '__tests__', 'coverage'])
+# - MOUNT_FUNCTIONS: Helper functions called like router.use(path, routes) to mount a router (default: ['safelyRegisterRoutes'])
+# - ROUTE_CACHE_PATH: Path to the per-file route extraction cache, relative to the project root (default: '.cache/api-routes.json')
+#   Related to: generate_documentation_diagrams.py:DIAGRAMS (api_endpoints)
+# ===================================================
+
+import os
+import re
+from collections import namedtuple
+
+from file_cache import FileCache
+from file_tree_index import get_tree_index
+from script_profiler import get_profiler
+
+# Configuration
+API_SOURCE_DIRECTORY = 'server'
+API_ENTRY_FILE = 'server/server.js'
+API_SOURCE_EXTENSIONS = ['.js', '.ts']
+DIRECTORIES_TO_EXCLUDE = ['node_modules', 'dist', '.git', 'tests', '__tests__', 'coverage']
+MOUNT_FUNCTIONS = ['safelyRegisterRoutes']
+ROUTE_CACHE_PATH = '.cache/api-routes.json'
+
+# HTTP methods in the order endpoints of the same path are listed
+HTTP_METHODS = ['get', 'post', 'put', 'patch', 'delete', 'options', 'head', 'all']
+
+# Comments that start a line; commented-out routes are not routes. Comments after
+# code are left alone, since '//' and '/*' also occur inside path strings.
+COMMENT_PATTERN = re.compile(r'^[ \t]*(?:/\*.*?\*/|//[^\n]*)', re.MULTILINE | re.DOTALL)
+
+# Routers and apps: const router = express.Router(), Router(), express()
+ROUTER_PATTERN = re.compile(r'\b(?:const|let|var)\s+(\w+)\s*(?::\s*[\w.<>]+\s*)?=\s*(?:express\s*\.\s*Router|Router|express)\s*\(')
+
+# Route definitions: router.get('/path', ...)
+ROUTE_PATTERN = re.compile(r'\b(\w+)\s*\.\s*(' + '|'.join(HTTP_METHODS) + r')\(\s*([\'"`])(/[^\'"`]*)\3')
+
+# Mounted routers: router.use('/prefix', [middleware, ...] routes) or a MOUNT_FUNCTIONS call
+MOUNT_PATTERN = re.compile(r'(?:\b(\w+)\s*\.\s*use|\b(?:' + '|'.join(map(re.escape, MOUNT_FUNCTIONS)) + r'))'
+                           r'\(\s*([\'"`])(/[^\'"`]*)\2\s*,\s*(?:[\w.]+\s*,\s*)*(\w+)\s*\)')
+
+# Default imports of local modules, as ES modules or CommonJS
+IMPORT_PATTERN = re.compile(r'^[ \t]*import\s+(\w+)\s*(?:,\s*\{[^}]*\}\s*)?from\s+([\'"])(\.{1,2}/[^\'"]+)\2', re.MULTILINE)
+REQUIRE_PATTERN = re.compile(r'\b(?:const|let|var)\s+(\w+)\s*=\s*require\(\s*([\'"])(\.{1,2}/[^\'"]+)\2\s*\)')
+
+# An API endpoint: group is the path the defining router is mounted at, file is relative to the project root
+Endpoint = namedtuple('Endpoint', ['method', 'path', 'group', 'file'])
+
+class RouteExtractionCache(FileCache):
+    """
+    On-disk cache of the routes and mounts extracted from each server source file.
+    """
+    version = 1
+    description = 'route'
+
+    def get_routes(self, file_path, st):
+        """
+        Return (result, content) for a file.
+
+        On a cache hit, result is the cached extraction and content is None.
+        On a miss, result is None and content is the decoded file.
+        """
+        entry, data = self.get(file_path, st, {'result': {'routes': [], 'mounts': []}})
+        if entry is not None:
+            return entry['result'], None
+        return None, data.decode('utf-8')
+
+    def store_routes(self, file_path, result):
+        """Record the extraction result of a re-read file."""
+        self.entry(file_path)['result'] = result
+
+def extract_routes_from_content(content):
+    """
+    Extract the routes and mounted routers defined in a source file.
+
+    Returns {'routes': [[METHOD, path], ...], 'mounts': [[prefix, import path], ...]}.
+    Only calls on routers and apps created in the file count, and a mount is only
+    recorded when the mounted router is a default import of a local module.
+    """
+    content = COMMENT_PATTERN.sub('', content)
+    routers = set(ROUTER_PATTERN.findall(content))
+    imports = {name: module for name, _, module in IMPORT_PATTERN.findall(content)}
+    imports.update((name, module) for name, _, module in REQUIRE_PATTERN.findall(content))
+
+    routes = [[method.upper(), path] for receiver, method, _, path in ROUTE_PATTERN.findall(content)
+              if receiver in routers]
+    mounts = [[prefix, imports[name]] for receiver, _, prefix, name in MOUNT_PATTERN.findall(content)
+              if (not receiver or receiver in routers) and name in imports]
+    return {'routes': routes, 'mounts': mounts}
+
+def scan_route_sources(project_root, cache=None):
+    """
+    Extract the routes and mounts of every source file under API_SOURCE_DIRECTORY.
+
+    Returns {file path: result}. When a cache is given, unchanged files are served
+    from it and only changed files are read.
+    """
+    source_directory = os.path.join(project_root, API_SOURCE_DIRECTORY)
+    if not os.path.isdir(source_directory):
+        return {}
+
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    profiler = get_profiler()
+    results = {}
+    for file_path, st in index.walk(source_directory, API_SOURCE_EXTENSIONS):
+        if file_path.endswith('.d.ts'):
+            continue
+        try:
+            if cache is None:
+                result, content = None, None
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+                    profiler.record_read(f)
+            else:
+                result, content = cache.get_routes(file_path, st)
+            if result is None:
+                result = extract_routes_from_content(content)
+                if cache is not None:
+                    cache.store_routes(file_path, result)
+                profiler.count('route_files_extracted')
+        except Exception as e:
+            print(f"Error reading file {file_path}: {e}")
+            continue
+        results[file_path] = result
+    return results
+
+def resolve_module(module, file_path, results):
+    """
+    Return the scanned source file a relative import refers to, or None.
+
+    TypeScript sources import their siblings as .js, and imports may leave out the
+    extension or name a directory with an index file.
+    """
+    base = os.path.normpath(os.path.join(os.path.dirname(file_path), module))
+    stem, extension = os.path.splitext(base)
+    candidates = [base]
+    if extension == '.js':
+        candidates.append(stem + '.ts')
+    elif extension not in API_SOURCE_EXTENSIONS:
+        candidates.extend(base + ext for ext in API_SOURCE_EXTENSIONS)
+        candidates.extend(os.path.join(base, 'index' + ext) for ext in API_SOURCE_EXTENSIONS)
+    return next((candidate for candidate in candidates if candidate in results), None)
+
+def join_route(prefix, path):
+    """
+    Join a mount prefix and a route path the way Express does.
+    """
+    return (prefix.rstrip('/') + '/' + path.lstrip('/')).rstrip('/') or '/'
+
+def resolve_endpoints(results, project_root, entry_file=API_ENTRY_FILE):
+    """
+    Resolve the full paths of the routes reachable from the entry file through its mounts.
+
+    Returns (endpoints, unmounted): the sorted, unique endpoints and the number of
+    files that define routes but are not mounted from the entry file.
+    """
+    entry_path = os.path.join(project_root, entry_file)
+    if entry_path not in results:
+        return [], sum(1 for result in results.values() if result['routes'])
+
+    endpoints = set()
+    mounted = set()
+    stack = [(entry_path, '', (entry_path,))]
+    while stack:
+        file_path, prefix, chain = stack.pop()
+        mounted.add(file_path)
+        result = results[file_path]
+        group = prefix or '/'
+        relative_path = os.path.relpath(file_path, project_root)
+        for method, path in result['routes']:
+            endpoints.add(Endpoint(method, join_route(prefix, path), group, relative_path))
+        for mount_prefix, module in result['mounts']:
+            target = resolve_module(module, file_path, results)
+            # A router mounted inside itself would never end
+            if target is not None and target not in chain:
+                stack.append((target, join_route(prefix, mount_prefix), chain + (target,)))
+
+    method_order = {method.upper(): position for position, method in enumerate(HTTP_METHODS)}
+    ordered = sorted(endpoints, key=lambda e: (e.group, e.path, method_order.get(e.method, len(method_order)), e.file))
+    unmounted = sum(1 for file_path, result in results.items() if result['routes'] and file_path not in mounted)
+    return ordered, unmounted
+
+def mermaid_label(text):
+    """
+    Quote a node label so paths such as /api/v1 are not read as Mermaid shape syntax.
+    """
+    return '"' + text.replace('"', '#quot;') + '"'
+
+def build_endpoints_diagram(endpoints):
+    """
+    Build a Mermaid graph of the endpoints, grouped by the path their router is mounted at.
+    """
+    lines = ["", "graph TD", "    API[API]"]
+    groups = {}
+    for endpoint in endpoints:
+        groups.setdefault(endpoint.group, []).append(endpoint)
+
+    for group_number, (group, group_endpoints) in enumerate(groups.items(), 1):
+        group_id = f"G{group_number}"
+        lines.append("    ")
+        lines.append(f"    API --> {group_id}[{mermaid_label(group)}]")
+        for endpoint_number, endpoint in enumerate(group_endpoints, 1):
+            lines.append(f"    {group_id} --> {group_id}E{endpoint_number}"
+                         f"[{mermaid_label(f'{endpoint.method} {endpoint.path}')}]")
+    return '\n'.join(lines) + '\n'
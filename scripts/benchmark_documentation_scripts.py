@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the documentation scripts benchmark
+#
+# COMMON CUSTOMIZATIONS:
+# - DEFAULT_SIZES: Size of the synthetic tree (default: 200 docs, 20 links per doc, 400 sources, half with headers, 4 settings per header)
+# - BENCHMARK_REPEAT: Runs per measurement; the fastest is kept (default: 3)
+# - BENCHMARK_OUTPUT: Path of the JSON results file (default: 'benchmark-results.json')
+# - EXPECTED_EXIT_CODES: Exit codes of a completed run per script; any other fails the benchmark (default: 0, and 1 for check_documentation_links)
+# - REGRESSION_THRESHOLD: Fractional throughput drop that fails --compare (default: 0.10)
+#   Related to: check_documentation_links.py:DIRECTORIES_TO_SCAN, update_config_index.py:DIRECTORIES_TO_SCAN
+# ===================================================
+
+import argparse
+import contextlib
+import glob
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import generate_documentation_diagrams
+import update_customization_headers
+from script_profiler import PROFILE_TRACE_DIRECTORY
+
+# Configuration
+DEFAULT_SIZES = {
+    'docs': 200,
+    'links_per_doc': 20,
+    'sources': 400,
+    'header_ratio': 0.5,
+    'settings_per_header': 4,
+}
+BENCHMARK_REPEAT = 3
+BENCHMARK_OUTPUT = 'benchmark-results.json'
+REGRESSION_THRESHOLD = 0.10
+RESULTS_VERSION = 2
+
+# Exit codes of a completed run, per script (default: 0 only); the link checker
+# exits with 1 when it finds broken links, which the synthetic tree always has
+EXPECTED_EXIT_CODES = {
+    'check_documentation_links': (0, 1),
+}
+
+BENCHMARKED_SCRIPTS = [
+    'check_documentation_links',
+    'fix_documentation_links',
+    'update_customization_headers',
+    'update_config_index',
+    'generate_documentation_diagrams',
+]
+
+# Source directories of the synthetic tree, spread over several index categories
+SOURCE_DIRECTORIES = [
+    ('server/config', '.js'),
+    ('server/services', '.js'),
+    ('server/middleware', '.js'),
+    ('client-angular/src/environments', '.ts'),
+    ('client-angular/src/app/services', '.ts'),
+    ('client-angular/src/app/features/ads', '.ts'),
+    ('client-angular/src/app/shared/ui', '.scss'),
+    ('client-angular/src/app/features/chat', '.html'),
+]
+
+def synthetic_header(ext, file_index, settings_per_header):
+    """
+    Return a customization header listing synthetic settings, for a file type.
+    """
+    template = update_customization_headers.HEADER_TEMPLATES[ext]
+    lines = template.format(module_purpose=f"module {file_index}", setting_example='SETTING_0').split('\n')
+    setting_line = next(i for i, line in enumerate(lines) if '- SETTING_0:' in line)
+    prefix = lines[setting_line].split('- SETTING_0:')[0]
+    settings = [f"{prefix}- SETTING_{i}: Setting {i} of module {file_index} (default: {i})"
+                for i in range(settings_per_header)]
+    return '\n'.join(lines[:setting_line] + settings + lines[setting_line + 1:])
+
+def synthetic_source(ext, file_index, has_header, settings_per_header):
+    """
+    Return the content of a synthetic source file, with or without a customization header.
+    """
+    header = synthetic_header(ext, file_index, settings_per_header) if has_header else ''
+    if ext in ('.js', '.ts'):
+        body = ''.join(f"const VALUE_{i} = {{ id: {i}, enabled: true }};\n" for i in range(40))
+        body += "module.exports = { VALUE_0 };\n"
+    elif ext == '.html':
+        body = ''.join(f'<div class="row-{i}">{{{{ item{i} }}}}</div>\n' for i in range(40))
+    else:
+        body = ''.join(f".row-{i} {{ margin: {i}px; }}\n" for i in range(40))
+    return header + body
+
+def synthetic_doc(doc_index, docs, links_per_doc, rng):
+    """
+    Return the content of a synthetic markdown file with a mix of link kinds.
+    """
+    lines = [f"# Page {doc_index}\n"]
+    for section in range(max(1, links_per_doc // 4)):
+        lines.append(f"\n## Section {section}\n\nSome prose about section {section} of page {doc_index}.\n")
+    lines.append("\n```bash\ncd /Users/oivindlund/date-night-app/docs && ls\n```\n\n")
+
+    for i in range(links_per_doc):
+        target = rng.randrange(docs)
+        kind = i % 8
+        if kind == 0:
+            url = f"page{target}.md"
+        elif kind == 1:
+            url = f"page{target}.md#section-{rng.randrange(max(1, links_per_doc // 4))}"
+        elif kind == 2:
+            url = f"#section-{i % max(1, links_per_doc // 4)}"
+        elif kind == 3:
+            url = f"missing{target}.md"
+        elif kind == 4:
+            url = f"https://example.com/page{target}"
+        elif kind == 5:
+            url = f"/Users/oivindlund/date-night-app/docs/page{target}.md"
+        elif kind == 6:
+            url = f"docs/page{target}.md"
+        else:
+            url = f"#missing-{i}"
+        lines.append(f"- See [link {i} of\n  page {doc_index}]({url}) for details.\n")
+    return ''.join(lines)
+
+def generate_synthetic_tree(root, sizes=None, seed=0):
+    """
+    Generate a synthetic repository under root and copy the documentation scripts into it.
+
+    Return the number of markdown files and source files written.
+    """
+    sizes = dict(DEFAULT_SIZES, **(sizes or {}))
+    rng = random.Random(seed)
+
+    docs_dir = os.path.join(root, 'docs')
+    os.makedirs(docs_dir, exist_ok=True)
+    for doc_index in range(sizes['docs']):
+        with open(os.path.join(docs_dir, f"page{doc_index}.md"), 'w', encoding='utf-8') as f:
+            f.write(synthetic_doc(doc_index, sizes['docs'], sizes['links_per_doc'], rng))
+    with open(os.path.join(root, 'README.md'), 'w', encoding='utf-8') as f:
+        f.write("# Synthetic Repository\n\n- [Docs](docs/page0.md)\n")
+
+    for file_index in range(sizes['sources']):
+        directory, ext = SOURCE_DIRECTORIES[file_index % len(SOURCE_DIRECTORIES)]
+        path = os.path.join(root, directory, f"module{file_index}{ext}")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        has_header = rng.random() < sizes['header_ratio']
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(synthetic_source(ext, file_index, has_header, sizes['settings_per_header']))
+
+    # The scripts find the project root from their own location
+    scripts_dir = os.path.join(root, 'scripts')
+    os.makedirs(scripts_dir, exist_ok=True)
+    for script in glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py')):
+        shutil.copy2(script, scripts_dir)
+
+    return sizes['docs'] + 1, sizes['sources']
+
+def script_items(script, doc_count, source_count):
+    """
+    Return the number of inputs a script processes, for throughput.
+    """
+    if script in ('check_documentation_links', 'fix_documentation_links'):
+        return doc_count
+    if script == 'generate_documentation_diagrams':
+        return len(generate_documentation_diagrams.DIAGRAMS_TO_GENERATE)
+    return source_count
+
+@contextlib.contextmanager
+def synthetic_tree(sizes, seed):
+    """
+    Create a fresh synthetic tree in a temporary directory; yield (root, doc_count, source_count).
+    """
+    root = os.path.realpath(tempfile.mkdtemp(prefix='doc-scripts-benchmark-'))
+    try:
+        doc_count, source_count = generate_synthetic_tree(root, sizes, seed)
+        yield root, doc_count, source_count
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+def run_script(script, root, *options):
+    """
+    Run a script as its own process against a synthetic tree; return the elapsed seconds.
+
+    Raise RuntimeError, with the script's stderr, if it exits with a code it does
+    not use for a completed run.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, os.path.join(root, 'scripts', f"{script}.py"), *options], cwd=root,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+    seconds = time.perf_counter() - start
+    if completed.returncode not in EXPECTED_EXIT_CODES.get(script, (0,)):
+        raise RuntimeError(f"{script} exited with code {completed.returncode}:\n{completed.stderr.rstrip()}")
+    return seconds
+
+def run_end_to_end(script, root):
+    """
+    Run a script against a synthetic tree without profiling; return the elapsed seconds.
+    """
+    return run_script(script, root)
+
+def run_phases(script, root):
+    """
+    Run a script with --profile against a synthetic tree; return the seconds of each of its phases.
+
+    Memory tracing is turned off, since it slows every phase down.
+    """
+    trace_path = os.path.join(root, PROFILE_TRACE_DIRECTORY, f"{script}.trace.json")
+    run_script(script, root, '--profile', '--no-profile-memory', '--profile-output', trace_path)
+    with open(trace_path, 'r', encoding='utf-8') as f:
+        phases = json.load(f)['otherData']['phases']
+    return {name: phase['seconds'] for name, phase in phases.items()}
+
+def benchmark(scripts=None, sizes=None, repeat=BENCHMARK_REPEAT, seed=0):
+    """
+    Benchmark scripts on fresh synthetic trees and return the results as a dict.
+
+    Every measurement runs on its own copy of the tree, since the scripts modify it,
+    and the fastest of `repeat` runs is kept.
+    """
+    sizes = dict(DEFAULT_SIZES, **(sizes or {}))
+    results = {
+        'version': RESULTS_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'sizes': sizes,
+        'repeat': repeat,
+        'seed': seed,
+        'scripts': {},
+    }
+
+    for script in scripts or BENCHMARKED_SCRIPTS:
+        end_to_end = []
+        phases = {}
+        for _ in range(repeat):
+            with synthetic_tree(sizes, seed) as (root, doc_count, source_count):
+                end_to_end.append(run_end_to_end(script, root))
+            with synthetic_tree(sizes, seed) as (root, doc_count, source_count):
+                for name, seconds in run_phases(script, root).items():
+                    phases[name] = min(seconds, phases.get(name, seconds))
+
+        items = script_items(script, doc_count, source_count)
+        seconds = min(end_to_end)
+        results['scripts'][script] = {
+            'items': items,
+            'end_to_end_seconds': round(seconds, 6),
+            'throughput': round(items / seconds, 3) if seconds else None,
+            'phases': {name: round(value, 6) for name, value in phases.items()},
+        }
+    return results
+
+def compare_results(baseline, current, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare end-to-end throughput against a baseline.
+
+    Return a list of (script, baseline_throughput, current_throughput, change, regressed).
+    """
+    rows = []
+    for script, result in current['scripts'].items():
+        previous = baseline.get('scripts', {}).get(script)
+        if not previous or not previous.get('throughput') or not result.get('throughput'):
+            continue
+        change = result['throughput'] / previous['throughput'] - 1
+        rows.append((script, previous['throughput'], result['throughput'], change, change < -threshold))
+    return rows
+
+def format_results(results):
+    """
+    Format results as a plain-text table.
+    """
+    lines = [f"{'Script':32} {'Items':>6} {'Seconds':>9} {'Items/s':>9}  Phases"]
+    for script, result in results['scripts'].items():
+        phases = ', '.join(f"{name} {seconds * 1000:.1f}ms" for name, seconds in result['phases'].items())
+        lines.append(f"{script:32} {result['items']:>6} {result['end_to_end_seconds']:>9.3f} "
+                     f"{result['throughput'] or 0:>9.1f}  {phases}")
+    return '\n'.join(lines)
+
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the documentation scripts on a synthetic tree.")
+    parser.add_argument('--script', dest='scripts', action='append', choices=BENCHMARKED_SCRIPTS,
+                        help="Script to benchmark; repeat for several (default: all)")
+    parser.add_argument('--docs', type=int, default=DEFAULT_SIZES['docs'],
+                        help=f"Markdown files in the synthetic tree (default: {DEFAULT_SIZES['docs']})")
+    parser.add_argument('--links-per-doc', type=int, default=DEFAULT_SIZES['links_per_doc'],
+                        help=f"Links per markdown file (default: {DEFAULT_SIZES['links_per_doc']})")
+    parser.add_argument('--sources', type=int, default=DEFAULT_SIZES['sources'],
+                        help=f"Source files in the synthetic tree (default: {DEFAULT_SIZES['sources']})")
+    parser.add_argument('--header-ratio', type=float, default=DEFAULT_SIZES['header_ratio'],
+                        help=f"Fraction of source files with a customization header (default: {DEFAULT_SIZES['header_ratio']})")
+    parser.add_argument('--settings-per-header', type=int, default=DEFAULT_SIZES['settings_per_header'],
+                        help=f"Settings listed in each header (default: {DEFAULT_SIZES['settings_per_header']})")
+    parser.add_argument('--repeat', type=int, default=BENCHMARK_REPEAT,
+                        help=f"Runs per measurement, keeping the fastest (default: {BENCHMARK_REPEAT})")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed for the synthetic tree (default: 0)")
+    parser.add_argument('--output', default=BENCHMARK_OUTPUT,
+                        help=f"JSON results file (default: {BENCHMARK_OUTPUT})")
+    parser.add_argument('--compare', metavar='BASELINE',
+                        help="Fail if throughput dropped against a baseline results file")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help=f"Throughput drop that counts as a regression (default: {REGRESSION_THRESHOLD})")
+    args = parser.parse_args(argv if argv is not None else [])
+    if args.repeat < 1:
+        parser.error("--repeat must be a positive number")
+    return args
+
+def main(argv=None):
+    """
+    Main function to benchmark the documentation scripts.
+    """
+    args = parse_args(argv)
+    sizes = {
+        'docs': args.docs,
+        'links_per_doc': args.links_per_doc,
+        'sources': args.sources,
+        'header_ratio': args.header_ratio,
+        'settings_per_header': args.settings_per_header,
+    }
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        except Exception as e:
+            print(f"Error reading baseline {args.compare}: {e}")
+            return 2
+
+    print("Benchmarking documentation scripts...")
+    try:
+        results = benchmark(args.scripts, sizes, args.repeat, args.seed)
+    except RuntimeError as e:
+        print(f"Error running benchmark: {e}")
+        return 1
+    print(format_results(results))
+
+    try:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+        print(f"Results written to {args.output}")
+    except Exception as e:
+        print(f"Error writing results: {e}")
+        return 1
+
+    if baseline is None:
+        return 0
+
+    if baseline.get('sizes') != results['sizes']:
+        print("Warning: the baseline was measured on a different tree size.")
+    regressed = False
+    print(f"\nComparison with {args.compare} (threshold {args.threshold:.0%}):")
+    for script, previous, current, change, is_regression in compare_results(baseline, results, args.threshold):
+        marker = 'REGRESSION' if is_regression else 'ok'
+        print(f"  {script:32} {previous:>9.1f} -> {current:>9.1f} items/s ({change:+.1%}) {marker}")
+        regressed = regressed or is_regression
+    return 1 if regressed else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -9,25 +9,116 @@
 # - DIRECTORIES_TO_EXCLUDE: Directories to exclude from scanning (default: ['node_modules', 'dist', '.git'])
 # - FILE_EXTENSIONS: File extensions to scan for links (default: ['.md'])
 # - LINK_PATTERNS: Regex patterns to identify links in documentation files
+# - CACHE_PATH: Path to the incremental link cache, relative to the project root (default: '.cache/documentation-link-check.json')
+# - REFERRER_INDEX_PATH: Path to the target-to-referrers index used by --since, relative to the project root (default: '.cache/documentation-link-referrers.json')
+#   Related to: git_changes.py:INCLUDE_UNTRACKED
+# - Link store (--link-store) and its queries: see link_store.py:LINK_STORE_PATH
+# - REPORT_FORMATS: Report formats written by default (default: ['markdown'])
+#   Related to: link_report.py:REPORT_PATHS
+# - EXTRACT_BATCH_SIZE: Files per worker batch when running with --jobs (default: 32)
+# - VALIDATE_BATCH_SIZE: Links per worker batch when running with --jobs (default: 500)
+# - MMAP_MIN_SIZE: Files at least this many bytes are memory-mapped and only the paragraphs containing a link marker are decoded (default: 256 KB)
+# - MAX_SCAN_FILE_SIZE: Files larger than this many bytes are skipped with a warning (default: 64 MB)
+#   Related to: external_link_checker.py:EXTERNAL_CACHE_TTL (used with --check-external)
 # ===================================================
 
+import argparse
+import bisect
+import json
+import mmap
 import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import unquote, urldefrag, urlparse
+
+from external_link_checker import EXTERNAL_CACHE_PATH, EXTERNAL_CACHE_TTL, check_external_links
+from file_cache import FileCache, content_hash
+from file_tree_index import get_tree_index, install_tree_index, reset_tree_indexes
+from file_watcher import create_watcher
+from git_changes import changed_files_since
+from link_store import LINK_STORE_PATH, QUERY_LIMIT, LinkStore, format_link_row
+from link_report import (MARKDOWN_NO_BROKEN_LINKS, REPORT_WRITERS,
+                         format_markdown_header, format_markdown_row, open_report_writers,
+                         close_report_writers)
+from script_profiler import add_profile_arguments, get_profiler, profile_run
 
 # Configuration
 DIRECTORIES_TO_SCAN = ['.', 'docs', 'client-angular', 'server']
 DIRECTORIES_TO_EXCLUDE = ['node_modules', 'dist', '.git', '__pycache__']
 FILE_EXTENSIONS = ['.md']
+CACHE_PATH = '.cache/documentation-link-check.json'
+REFERRER_INDEX_PATH = '.cache/documentation-link-referrers.json'
+REPORT_FORMATS = ['markdown']
+EXTRACT_BATCH_SIZE = 32
+VALIDATE_BATCH_SIZE = 500
+MMAP_MIN_SIZE = 256 * 1024
+MAX_SCAN_FILE_SIZE = 64 * 1024 * 1024
+
+# Bump when the layout of the referrer index changes
+REFERRER_INDEX_VERSION = 1
 
-# Regex patterns to identify links in documentation files
+# Regex patterns to identify links in documentation files, matched against the whole file.
+# Each pattern captures (text, url) or just (url). Link text may wrap across lines but
+# not across a blank line.
 LINK_PATTERNS = [
-    r'\[([^\]]+)\]\(([^)]+)\)',  # Markdown links: [text](url)
+    r'\[((?:[^\]\n]|\n(?![ \t]*\n))+)\]\(([^)\n]+)\)',  # Markdown links: [text](url)
     r'<a\s+href=[\'"]([^\'"]+)[\'"]',  # HTML links: <a href="url">
 ]
 
+# Byte sequences of which every LINK_PATTERNS match contains one; a paragraph
+# without any of them has no links and is never decoded. Keep in sync with LINK_PATTERNS.
+LINK_MARKERS = [b'](', b'href=']
+
+# Leading bytes checked for a NUL byte to tell binary files from text
+BINARY_SNIFF_SIZE = 8192
+
+# Bytes copied at a time when counting the lines between the decoded regions of a mapped file
+NEWLINE_COUNT_CHUNK = 1024 * 1024
+
+def compile_link_scanner(patterns):
+    """
+    Combine the link patterns into one alternation that is applied in a single pass.
+    
+    Returns the compiled scanner and a table mapping each group index to the
+    (first group, group count) of the alternative it belongs to, so a match can be
+    mapped back to the pattern that produced it through match.lastindex.
+    """
+    group_table = {}
+    next_group = 1
+    for pattern in patterns:
+        group_count = re.compile(pattern).groups
+        for group in range(next_group, next_group + group_count):
+            group_table[group] = (next_group, group_count)
+        next_group += group_count
+    scanner = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+    return scanner, group_table
+
+LINK_SCANNER, LINK_GROUP_TABLE = compile_link_scanner(LINK_PATTERNS)
+
+# Line breaks, used to build the newline-offset table
+NEWLINE_PATTERN = re.compile('\n')
+
+# Whitespace run (including a line break) inside wrapped link text
+WRAPPED_TEXT_PATTERN = re.compile(r'\s*\n\s*')
+
+# Target file extensions whose fragments (page.md#section) are validated
+ANCHOR_FILE_EXTENSIONS = ['.md', '.markdown', '.html', '.htm']
+
+# Patterns used to collect anchors: ATX and setext headings, fenced code blocks and explicit HTML ids
+ATX_HEADING_PATTERN = re.compile(r'^ {0,3}#{1,6}(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+SETEXT_UNDERLINE_PATTERN = re.compile(r'^ {0,3}(?:=+|-+)[ \t]*$')
+CODE_FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+SETEXT_NON_PARAGRAPH_PREFIXES = ('|', '>', '- ', '* ', '+ ')
+HTML_ID_PATTERN = re.compile(r'<[a-zA-Z][^>]*?\s(?:id|name)\s*=\s*[\'"]([^\'"]+)[\'"]')
+
+# Inline markup removed from heading text before computing its slug
+INLINE_LINK_PATTERN = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+SLUG_DROP_PATTERN = re.compile(r'[^\w\- ]')
+
 class DocumentationLink:
     """
     Represents a link in a documentation file.
@@ -39,33 +130,361 @@ class DocumentationLink:
         self.line_number = line_number
         self.is_valid = None
         self.error_message = None
+    
+    def to_record(self):
+        """Serialize the link for the incremental cache."""
+        return [self.text, self.url, self.line_number]
+    
+    @classmethod
+    def from_record(cls, record, file_path):
+        """Rebuild a link from an incremental cache record."""
+        text, url, line_number = record
+        return cls(text, url, file_path, line_number)
 
-def extract_links_from_file(file_path):
+class LinkCheckCache(FileCache):
     """
-    Extract links from a documentation file.
+    On-disk cache of the links and anchors extracted from each file, keyed by file.
+    """
+    version = 5
+    description = 'link'
+    
+    def read(self, file_path, st):
+        """
+        Hash a file, mapping large files instead of reading them into memory.
+        
+        Data is None for mapped files and both are None for oversized files.
+        """
+        if st.st_size > MAX_SCAN_FILE_SIZE:
+            return None, None
+        if st.st_size < MMAP_MIN_SIZE:
+            return super().read(file_path, st)
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                return None, content_hash(buffer)
+    
+    def get_links(self, file_path, st):
+        """
+        Return (links, anchors, content) for a file.
+        
+        On a cache hit, links and anchors come from the cache and content is None;
+        anchors are None too if they were never collected. On a miss, links and anchors
+        are None and content is the decoded file, or None if the file has to be read
+        by extract_file (mapped, binary or oversized files).
+        """
+        entry, data = self.get(file_path, st, {'links': [], 'anchors': []})
+        if entry is not None:
+            return [DocumentationLink.from_record(r, file_path) for r in entry['links']], entry['anchors'], None
+        if data is None or is_binary(data):
+            return None, None, None
+        return None, None, decode_text(data)
+    
+    def store_anchors(self, file_path, anchors):
+        """Record the anchors of a re-extracted file."""
+        self.entry(file_path)['anchors'] = anchors
+    
+    def store_links(self, links):
+        """Record the links extracted from each re-read file in its entry."""
+        records = {}
+        for link in links:
+            records.setdefault(self._key(link.file_path), []).append(link)
+        for key, entry in self.files.items():
+            if key not in self.seen:
+                continue
+            new_records = [link.to_record() for link in records.get(key, [])]
+            if new_records != entry['links']:
+                entry['links'] = new_records
+                self.dirty = True
+
+class LinkReferrerIndex:
+    """
+    Reverse index from each internal link target to the documentation files that link to it.
+    
+    Targets are resolved paths, whether or not they exist, so adding a missing target
+    finds the files whose links it fixes. Every full check persists the index, and
+    --since reads it to find the unchanged files that point at a changed, renamed or
+    deleted path. Watch mode keeps one in memory.
+    """
+    def __init__(self, project_root, index_path=None):
+        self.project_root = project_root
+        self.index_path = index_path
+        self.referrers = {}
+        self.targets = {}
+    
+    @classmethod
+    def load(cls, index_path, project_root):
+        """Load a persisted index; return None if it is missing, stale or unreadable."""
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Ignoring unreadable link referrer index {index_path}: {e}")
+            return None
+        if data.get('version') != REFERRER_INDEX_VERSION:
+            return None
+        
+        referrer_index = cls(project_root, index_path)
+        for target, sources in data.get('referrers', {}).items():
+            target = os.path.normpath(os.path.join(project_root, target))
+            sources = {os.path.normpath(os.path.join(project_root, source)) for source in sources}
+            referrer_index.referrers[target] = sources
+            for source in sources:
+                referrer_index.targets.setdefault(source, set()).add(target)
+        return referrer_index
+    
+    def set_links(self, file_path, links):
+        """Record the internal targets of a file's links, replacing those recorded before."""
+        targets = {resolve_link_target(link.url, file_path, self.project_root)
+                   for link in links if not is_external_link(link.url)}
+        previous = self.targets.pop(file_path, set())
+        for target in previous - targets:
+            self.referrers[target].discard(file_path)
+            if not self.referrers[target]:
+                del self.referrers[target]
+        for target in targets - previous:
+            self.referrers.setdefault(target, set()).add(file_path)
+        if targets:
+            self.targets[file_path] = targets
+    
+    def remove_file(self, file_path):
+        """Forget a deleted file's links."""
+        self.set_links(file_path, [])
+    
+    def referring_files(self, paths, directories=()):
+        """
+        Return the files linking to any of paths or to anything inside directories.
+        """
+        sources = set()
+        for path in paths:
+            sources.update(self.referrers.get(path, ()))
+        prefixes = tuple(directory.rstrip(os.sep) + os.sep for directory in directories)
+        if prefixes:
+            for target, target_sources in self.referrers.items():
+                if target.startswith(prefixes):
+                    sources.update(target_sources)
+        return sources
+    
+    def save(self):
+        """Write the index atomically."""
+        referrers = {os.path.relpath(target, self.project_root):
+                     sorted(os.path.relpath(source, self.project_root) for source in sources)
+                     for target, sources in sorted(self.referrers.items())}
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': REFERRER_INDEX_VERSION, 'referrers': referrers}, f)
+        os.replace(tmp_path, self.index_path)
+
+def newline_offsets(content):
+    """
+    Return the offsets of every newline in content, for bisecting line numbers.
+    """
+    return [match.start() for match in NEWLINE_PATTERN.finditer(content)]
+
+def iter_link_matches(content):
+    """
+    Yield (match, text, url) for every link in content, in a single pass over the buffer.
+    """
+    for match in LINK_SCANNER.finditer(content):
+        # The last matched group belongs to the alternative that matched
+        first_group, group_count = LINK_GROUP_TABLE[match.lastindex]
+        
+        if group_count >= 2:
+            text = match.group(first_group)
+            if '\n' in text:
+                text = WRAPPED_TEXT_PATTERN.sub(' ', text)
+            url = match.group(first_group + 1)
+        else:
+            text = ''
+            url = match.group(first_group)
+        yield match, text, url
+
+def extract_links_from_content(content, file_path, first_line=1):
+    """
+    Extract links from the content of a documentation file, or from a region of it
+    that starts at line first_line.
     """
     links = []
+    offsets = None
     
+    for match, text, url in iter_link_matches(content):
+        if offsets is None:
+            offsets = newline_offsets(content)
+        line_number = bisect.bisect_left(offsets, match.start()) + first_line
+        links.append(DocumentationLink(text, url, file_path, line_number))
+    
+    return links
+
+def github_slug(text):
+    """
+    Compute the GitHub-compatible anchor slug of a heading.
+    """
+    text = INLINE_LINK_PATTERN.sub(r'\1', text)
+    text = HTML_TAG_PATTERN.sub('', text)
+    return SLUG_DROP_PATTERN.sub('', text.strip().lower()).replace(' ', '-')
+
+def extract_anchors_from_content(content):
+    """
+    Collect the anchors a document defines: heading slugs and explicit HTML ids.
+    
+    Repeated headings get GitHub's -1, -2, ... suffixes. Headings inside fenced
+    code blocks are ignored.
+    """
+    anchors = []
+    slug_counts = {}
+    
+    def add_heading(text):
+        slug = github_slug(text)
+        count = slug_counts.get(slug, 0)
+        slug_counts[slug] = count + 1
+        anchors.append(f"{slug}-{count}" if count else slug)
+    
+    fence = None
+    previous_line = ''
+    for line in content.split('\n'):
+        fence_match = CODE_FENCE_PATTERN.match(line)
+        if fence:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            previous_line = ''
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            previous_line = ''
+            continue
+        
+        heading_match = ATX_HEADING_PATTERN.match(line)
+        if heading_match:
+            add_heading(heading_match.group(1) or '')
+            line = ''
+        elif SETEXT_UNDERLINE_PATTERN.match(line) and previous_line.strip() and not previous_line.lstrip().startswith(SETEXT_NON_PARAGRAPH_PREFIXES):
+            add_heading(previous_line)
+            line = ''
+        previous_line = line
+    
+    anchors.extend(HTML_ID_PATTERN.findall(content))
+    return anchors
+
+def load_anchors(file_path):
+    """
+    Read a file and collect its anchors.
+    """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            lines = content.split('\n')
-            
-            for pattern in LINK_PATTERNS:
-                for i, line in enumerate(lines):
-                    matches = re.finditer(pattern, line)
-                    for match in matches:
-                        if len(match.groups()) >= 2:
-                            text = match.group(1)
-                            url = match.group(2)
-                            links.append(DocumentationLink(text, url, file_path, i + 1))
-                        elif len(match.groups()) == 1:
-                            url = match.group(1)
-                            links.append(DocumentationLink('', url, file_path, i + 1))
+            get_profiler().record_read(f)
+        return extract_anchors_from_content(content)
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
+        return []
+
+def is_binary(data):
+    """
+    Check if file bytes look binary: a NUL byte among the first BINARY_SNIFF_SIZE bytes.
+    """
+    return b'\0' in data[:BINARY_SNIFF_SIZE]
+
+def decode_text(data):
+    """
+    Decode UTF-8 file bytes with universal newlines, as reading the file in text mode would.
+    """
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def count_newlines(buffer, start, end):
+    """
+    Count the newlines in buffer[start:end], copying at most NEWLINE_COUNT_CHUNK bytes at a time.
+    """
+    return sum(buffer[position:min(position + NEWLINE_COUNT_CHUNK, end)].count(b'\n')
+               for position in range(start, end, NEWLINE_COUNT_CHUNK))
+
+def find_link_regions(buffer):
+    """
+    Return the sorted (start, end) byte ranges of the paragraphs of buffer that contain a link marker.
     
-    return links
+    Links never span a blank line, so each range starts and ends at a paragraph
+    break and can be decoded and scanned on its own. Every byte is searched
+    a bounded number of times, so a file with few blank lines stays linear to scan.
+    """
+    blank = b'\r\n\r\n' if b'\r\n' in buffer[:BINARY_SNIFF_SIZE] else b'\n\n'
+    # Ranges split a blank-line sequence after its first line break
+    split = len(blank) // 2
+    regions = []
+    for marker in LINK_MARKERS:
+        previous_end = 0
+        position = buffer.find(marker)
+        while position != -1:
+            start = buffer.rfind(blank, previous_end, position)
+            start = previous_end if start == -1 else start + split
+            end = buffer.find(blank, position)
+            end = len(buffer) if end == -1 else end + split
+            regions.append((start, end))
+            previous_end = end
+            position = buffer.find(marker, end)
+    
+    merged = []
+    for start, end in sorted(regions):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+def extract_file(file_path):
+    """
+    Read a documentation file and extract its (links, anchors).
+    
+    Files smaller than MMAP_MIN_SIZE are decoded whole. Larger files are
+    memory-mapped and only the paragraphs around a link marker are decoded; their
+    anchors are None and get loaded by get_file_anchors if a link needs them.
+    Binary files and files larger than MAX_SCAN_FILE_SIZE are skipped with a
+    warning and return (None, []).
+    """
+    profiler = get_profiler()
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > MAX_SCAN_FILE_SIZE:
+            print(f"Skipping {file_path}: {size} bytes is over MAX_SCAN_FILE_SIZE ({MAX_SCAN_FILE_SIZE})")
+            return None, []
+        
+        if size < MMAP_MIN_SIZE or size == 0:
+            data = f.read()
+            profiler.record_read(f)
+            if is_binary(data):
+                print(f"Skipping binary file {file_path}")
+                return None, []
+            content = decode_text(data)
+            return extract_links_from_content(content, file_path), extract_anchors_from_content(content)
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if is_binary(buffer):
+                print(f"Skipping binary file {file_path}")
+                return None, []
+            profiler.count('files_mapped')
+            links = []
+            line_number = 1
+            position = 0
+            for start, end in find_link_regions(buffer):
+                line_number += count_newlines(buffer, position, start)
+                position = start
+                links.extend(extract_links_from_content(decode_text(buffer[start:end]), file_path, line_number))
+                profiler.count('bytes_decoded', end - start)
+            return links, None
+
+def extract_links_from_file(file_path):
+    """
+    Extract links from a documentation file.
+    """
+    try:
+        links, _ = extract_file(file_path)
+    except Exception as e:
+        print(f"Error reading file {file_path}: {e}")
+        return []
+    
+    return links or []
 
 def is_external_link(url):
     """
@@ -80,143 +499,725 @@ def is_anchor_link(url):
     """
     return url.startswith('#')
 
-def is_valid_internal_link(url, file_path, project_root):
+def split_fragment(url):
     """
-    Check if an internal link is valid.
+    Split a link into its path and decoded fragment (None when there is no fragment).
+    """
+    path, separator, fragment = url.partition('#')
+    path = path.split('?', 1)[0]
+    return path, unquote(fragment) if separator else None
+
+def resolve_link_target(url, file_path, project_root):
+    """
+    Resolve an internal link to the path it points at; anchor links point at their own file.
     """
-    # Handle anchor links
-    if is_anchor_link(url):
-        # Anchor links are considered valid for now
-        return True, None
+    path, _ = split_fragment(url)
+    if not path:
+        return os.path.normpath(file_path)
     
     # Handle relative links
-    if not url.startswith('/'):
+    if not path.startswith('/'):
         # Relative to the current file
         current_dir = os.path.dirname(file_path)
-        target_path = os.path.normpath(os.path.join(current_dir, url))
-    else:
-        # Absolute path within the project
-        target_path = os.path.normpath(os.path.join(project_root, url.lstrip('/')))
+        return os.path.normpath(os.path.join(current_dir, path))
     
+    # Absolute path within the project
+    return os.path.normpath(os.path.join(project_root, path.lstrip('/')))
+
+def get_file_anchors(file_path, project_root):
+    """
+    Return the set of anchors defined by a file, parsing it at most once per run.
+    """
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    return index.file_data(file_path, 'anchors', lambda path: set(load_anchors(path)))
+
+def check_link_target(target_path, fragment, project_root, path_exists=os.path.exists):
+    """
+    Check that a resolved link target exists and, for documents, defines the fragment.
+    """
     # Check if the target file exists
-    if not os.path.exists(target_path):
+    if not path_exists(target_path):
         return False, f"Target file does not exist: {target_path}"
     
+    # Check the fragment against the headings and HTML ids of the target
+    if fragment and os.path.splitext(target_path)[1].lower() in ANCHOR_FILE_EXTENSIONS:
+        anchors = get_file_anchors(target_path, project_root)
+        if fragment not in anchors and fragment.lower() not in anchors:
+            return False, f"Anchor #{fragment} not found in {target_path}"
+    
     return True, None
 
-def validate_links(links, project_root):
+def is_valid_internal_link(url, file_path, project_root, path_exists=os.path.exists):
+    """
+    Check if an internal link is valid.
+    """
+    target_path = resolve_link_target(url, file_path, project_root)
+    _, fragment = split_fragment(url)
+    return check_link_target(target_path, fragment, project_root, path_exists)
+
+def validate_links(links, project_root, external_results=None, on_result=None):
     """
     Validate links in documentation files.
+    
+    External links are only checked when external_results, a dict mapping URLs
+    (without fragment) to (is_valid, error_message), is given; otherwise they are
+    considered valid. on_result, when given, is called with each link as soon as
+    it has been validated.
+    Targets are resolved against the in-memory file index built during the directory
+    walk, and each unique (target, fragment) pair is checked only once; its verdict
+    is shared by every link pointing at it. Every link gets a fresh verdict; the
+    incremental cache only saves the extraction, never the validation.
     """
     valid_links = []
     broken_links = []
+    profiler = get_profiler()
+    
+    path_exists = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE).exists
+    # Resolved (target, fragment) per (resolution base, url), and verdict per unique target
+    resolved_targets = {}
+    verdicts = {}
     
     for link in links:
         if is_external_link(link.url):
-            # External links are considered valid for now
-            link.is_valid = True
+            if external_results is None:
+                verdict = (True, None)
+            else:
+                verdict = external_results.get(urldefrag(link.url)[0], (True, None))
+        else:
+            base = link.file_path if is_anchor_link(link.url) else os.path.dirname(link.file_path)
+            key = (base, link.url)
+            if key not in resolved_targets:
+                resolved_targets[key] = (resolve_link_target(link.url, link.file_path, project_root),
+                                         split_fragment(link.url)[1])
+            target = resolved_targets[key]
+            if target not in verdicts:
+                verdicts[target] = check_link_target(*target, project_root, path_exists)
+                profiler.count('targets_checked')
+            verdict = verdicts[target]
+        
+        link.is_valid, link.error_message = verdict
+        
+        if link.is_valid:
             valid_links.append(link)
         else:
-            # Internal links
-            is_valid, error_message = is_valid_internal_link(link.url, link.file_path, project_root)
+            broken_links.append(link)
+        if on_result is not None:
+            on_result(link)
+    
+    return valid_links, broken_links
+
+def _batches(items, batch_size):
+    """
+    Split a list into consecutive batches.
+    """
+    return [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+
+def map_batches(func, batches, jobs=1, index=None):
+    """
+    Apply func to each batch, in a process pool when jobs > 1.
+    
+    Results are returned in batch order, so merging them is deterministic. When
+    func needs the file index, pass it as index: every worker gets a copy of it
+    at startup, which forked workers would inherit anyway but spawned ones would
+    otherwise have to rebuild from the file system.
+    """
+    if jobs <= 1 or len(batches) <= 1:
+        return [func(batch) for batch in batches]
+    
+    initializer, initargs = (install_tree_index, (index,)) if index is not None else (None, ())
+    with ProcessPoolExecutor(max_workers=min(jobs, len(batches)),
+                             initializer=initializer, initargs=initargs) as executor:
+        return list(executor.map(func, batches))
+
+def _extract_batch(batch):
+    """
+    Extract (links, anchors) for a batch of (file_path, content) pairs; content None means read the file.
+    
+    As with extract_file, links is None for skipped files and anchors is None when not collected.
+    """
+    results = []
+    profiler = get_profiler()
+    for file_path, content in batch:
+        with profiler.file(file_path):
+            if content is None:
+                try:
+                    results.append(extract_file(file_path))
+                except Exception as e:
+                    print(f"Error reading file {file_path}: {e}")
+                    results.append(([], []))
+                continue
+            results.append((extract_links_from_content(content, file_path), extract_anchors_from_content(content)))
+    return results
+
+def _validate_batch(batch):
+    """
+    Validate a batch of links in a worker and return their (is_valid, error_message) results.
+    """
+    links, project_root, external_results = batch
+    validate_links(links, project_root, external_results)
+    return [(link.is_valid, link.error_message) for link in links]
+
+def validate_links_parallel(links, project_root, jobs=1, external_results=None, on_result=None):
+    """
+    Validate links across a process pool, preserving the serial result order.
+    """
+    if jobs <= 1:
+        return validate_links(links, project_root, external_results, on_result)
+    
+    batches = [(batch, project_root, external_results) for batch in _batches(links, VALIDATE_BATCH_SIZE)]
+    results = map_batches(_validate_batch, batches, jobs, get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE))
+    
+    valid_links = []
+    broken_links = []
+    for (batch, _, _), batch_results in zip(batches, results):
+        for link, (is_valid, error_message) in zip(batch, batch_results):
             link.is_valid = is_valid
             link.error_message = error_message
-            
             if is_valid:
                 valid_links.append(link)
             else:
                 broken_links.append(link)
+            if on_result is not None:
+                on_result(link)
     
     return valid_links, broken_links
 
-def scan_directory(base_dir, project_root):
+def scan_directory(base_dir, project_root, cache=None, jobs=1):
     """
     Scan a directory for documentation files and extract links.
+    
+    When a cache is given, unchanged files are served from it and only changed
+    files are read and re-extracted. With jobs > 1, extraction runs in batches
+    across a process pool and links are returned in the same order as a serial scan.
+    The anchors of every scanned file are recorded in the file index, so fragment
+    validation never has to read these files again.
     """
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    
+    # Links per file in walk order; None marks files that still need extracting
+    links_per_file = []
+    pending = []
+    
+    for file_path, st in index.walk(base_dir, FILE_EXTENSIONS):
+        if cache is None:
+            links, anchors, content = None, None, None
+        else:
+            try:
+                links, anchors, content = cache.get_links(file_path, st)
+            except Exception as e:
+                print(f"Error reading file {file_path}: {e}")
+                continue
+        if links is None:
+            pending.append((len(links_per_file), file_path, content))
+        elif anchors is not None:
+            index.set_file_data(file_path, 'anchors', set(anchors))
+        links_per_file.append(links)
+    
+    # Extract links from the files that were not served from the cache
+    batches = _batches([(file_path, content) for _, file_path, content in pending], EXTRACT_BATCH_SIZE)
+    results = [result for batch in map_batches(_extract_batch, batches, jobs) for result in batch]
+    skipped = 0
+    for (position, file_path, _), (links, anchors) in zip(pending, results):
+        if links is None:
+            skipped += 1
+            links = []
+        links_per_file[position] = links
+        if anchors is not None:
+            index.set_file_data(file_path, 'anchors', set(anchors))
+        if cache is not None:
+            cache.store_anchors(file_path, anchors)
+    if skipped:
+        print(f"Skipped {skipped} binary or oversized files.")
+    
     all_links = []
+    for links in links_per_file:
+        all_links.extend(links)
+    
+    profiler = get_profiler()
+    profiler.count('files_from_cache', len(links_per_file) - len(pending))
+    profiler.count('files_skipped', skipped)
+    profiler.count('links_extracted', len(all_links))
+    return all_links
+
+def verify_files(file_contents, project_root):
+    """
+    Re-check the links of specific files in-process, reusing the shared file index.
+    
+    file_contents maps file paths to their current content (None to read the file).
+    Only these files are parsed; their targets are resolved against the file index
+    and the anchors of other targets are loaded at most once. Returns the valid and
+    broken links, like validate_links.
+    """
+    return validate_links(extract_files(file_contents, project_root), project_root)
+
+def extract_files(file_contents, project_root):
+    """
+    Extract the links of specific files, in path order, and record their anchors in the file index.
+    
+    file_contents maps file paths to their current content (None to read the file).
+    """
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    profiler = get_profiler()
+    links = []
+    
+    skipped = 0
+    
+    for file_path in sorted(file_contents):
+        with profiler.file(file_path):
+            content = file_contents[file_path]
+            if content is None:
+                try:
+                    file_links, anchors = extract_file(file_path)
+                except Exception as e:
+                    print(f"Error reading file {file_path}: {e}")
+                    continue
+                if file_links is None:
+                    skipped += 1
+                    continue
+            else:
+                file_links, anchors = extract_links_from_content(content, file_path), extract_anchors_from_content(content)
+            links.extend(file_links)
+            if anchors is not None:
+                index.set_file_data(file_path, 'anchors', set(anchors))
+    
+    if skipped:
+        print(f"Skipped {skipped} binary or oversized files.")
+    profiler.count('files_skipped', skipped)
+    return links
+
+def is_documentation_file(file_path, project_root):
+    """
+    Check if a path is a documentation file the full scan would visit.
+    """
+    if os.path.splitext(file_path)[1] not in FILE_EXTENSIONS or not os.path.isfile(file_path):
+        return False
+    relative_parts = os.path.relpath(file_path, project_root).split(os.sep)
+    if relative_parts[0] == os.pardir or any(part in DIRECTORIES_TO_EXCLUDE for part in relative_parts[:-1]):
+        return False
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    return any(path and (file_path + os.sep).startswith(path.rstrip(os.sep) + os.sep)
+               for _, path in index.normalize_roots(DIRECTORIES_TO_SCAN))
+
+def select_changed_files(changes, referrer_index, project_root):
+    """
+    Choose the documentation files a diff-scoped check has to parse.
+    
+    Returns (files, removed): the changed documentation files plus the unchanged files
+    that link to a changed, renamed or deleted path, and the documentation files that
+    no longer exist.
+    """
+    changed_paths = set()
+    files = set()
+    removed = set()
+    for change in changes:
+        for path in (change.path, change.old_path):
+            if path is None:
+                continue
+            changed_paths.add(path)
+            if is_documentation_file(path, project_root):
+                files.add(path)
+            elif path in referrer_index.targets:
+                removed.add(path)
+    
+    files.update(path for path in referrer_index.referring_files(changed_paths) if os.path.isfile(path))
+    return sorted(files), sorted(removed - files)
+
+class LinkGraph:
+    """
+    In-memory links of every scanned documentation file, with a LinkReferrerIndex
+    from each link target to the files that link to it.
+    
+    Used by watch mode: after a change only the changed files are re-extracted, and
+    only they and the files linking to a changed path are revalidated.
+    """
+    def __init__(self, project_root):
+        self.project_root = project_root
+        self.index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+        self.links = {}
+        self.referrers = LinkReferrerIndex(project_root)
     
-    for root, dirs, files in os.walk(base_dir):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in DIRECTORIES_TO_EXCLUDE]
+    def build(self, roots, jobs=1):
+        """
+        Scan the roots and validate every link; return the broken links.
+        """
+        all_links = []
+        for root in roots:
+            all_links.extend(scan_directory(root, self.project_root, jobs=jobs))
+        for link in all_links:
+            self.links.setdefault(link.file_path, []).append(link)
+        for file_path, links in self.links.items():
+            self.referrers.set_links(file_path, links)
+        return validate_links_parallel(all_links, self.project_root, jobs)[1]
+    
+    def apply_changes(self, paths):
+        """
+        Apply created, changed and deleted paths and revalidate the affected files.
+        
+        Returns (affected, broken_links): the documentation files whose links were
+        revalidated, and their broken links.
+        """
+        updated, removed = self.index.update(paths)
+        affected = set()
+        
+        for file_path, _ in removed:
+            if self.links.pop(file_path, None) is not None:
+                self.referrers.remove_file(file_path)
+        for file_path, _ in updated:
+            if os.path.splitext(file_path)[1] in FILE_EXTENSIONS:
+                links, anchors = _extract_batch([(file_path, None)])[0]
+                if anchors is not None:
+                    self.index.set_file_data(file_path, 'anchors', set(anchors))
+                links = links or []
+                self.links[file_path] = links
+                self.referrers.set_links(file_path, links)
+                affected.add(file_path)
+        
+        # Files linking to a changed path; a directory also affects links into it
+        changed = {os.path.normpath(os.path.abspath(path)) for path in paths}
+        entries = {file_path for file_path, _ in updated + removed}
+        changed.update(entries)
+        affected.update(self.referrers.referring_files(changed, [path for path in changed if path not in entries]))
         
-        for file in files:
-            file_path = os.path.join(root, file)
-            ext = os.path.splitext(file)[1]
+        affected = sorted(file_path for file_path in affected if file_path in self.links)
+        links = [link for file_path in affected for link in self.links[file_path]]
+        return affected, validate_links(links, self.project_root)[1]
+    
+    def link_count(self):
+        """Return the number of links in the graph."""
+        return sum(len(links) for links in self.links.values())
+    
+    def broken_count(self):
+        """Return the number of broken links in the graph."""
+        return sum(1 for links in self.links.values() for link in links if link.is_valid is False)
+
+def print_broken_links(broken_links, project_root):
+    """
+    Print one diagnostic line per broken link.
+    """
+    for link in broken_links:
+        relative_path = os.path.relpath(link.file_path, project_root)
+        print(f"  {relative_path}:{link.line_number}: {link.url} ({link.error_message})")
+
+def watch(args, project_root):
+    """
+    Build the link graph once, then revalidate changed files and the files linking
+    to them as changes arrive, until interrupted.
+    """
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    roots = [path for _, path in index.normalize_roots(DIRECTORIES_TO_SCAN) if path]
+    
+    start = time.perf_counter()
+    graph = LinkGraph(project_root)
+    broken_links = graph.build(roots, args.jobs)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Found {graph.link_count()} links in {len(graph.links)} files in {elapsed:.0f} ms; "
+          f"{len(broken_links)} broken.")
+    print_broken_links(broken_links, project_root)
+    
+    watcher = create_watcher(roots, DIRECTORIES_TO_EXCLUDE, args.poll)
+    print("Watching for changes (press Ctrl+C to stop)...")
+    try:
+        while True:
+            paths = watcher.poll()
+            if paths is None:
+                print("File events were lost; rescanning...")
+                reset_tree_indexes()
+                graph = LinkGraph(project_root)
+                broken_links = graph.build(roots, args.jobs)
+                print(f"{len(broken_links)} broken links in total.")
+                continue
             
-            if ext in FILE_EXTENSIONS:
-                # Extract links from the file
-                links = extract_links_from_file(file_path)
-                all_links.extend(links)
+            start = time.perf_counter()
+            affected, broken_links = graph.apply_changes(paths)
+            if not affected:
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"[{time.strftime('%H:%M:%S')}] Revalidated {len(affected)} files in {elapsed:.1f} ms: "
+                  f"{len(broken_links)} broken, {graph.broken_count()} in total.")
+            print_broken_links(broken_links, project_root)
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
+    return 0
+
+def link_store_target(link, project_root):
+    """
+    Return the (target, fragment, external) a link is recorded with in the link store.
+    """
+    if is_external_link(link.url):
+        return urldefrag(link.url)[0], None, True
+    return resolve_link_target(link.url, link.file_path, project_root), split_fragment(link.url)[1], False
+
+def update_link_store(store_path, project_root, files, links, removed_files=None):
+    """
+    Record the links of scanned files in the link store.
     
-    return all_links
+    files maps every scanned file to its stat result. Without removed_files the scan
+    covered the whole tree and files that were not scanned are dropped; otherwise
+    only removed_files are dropped.
+    """
+    store = LinkStore(store_path, project_root)
+    try:
+        store.update_files(files, links, lambda link: link_store_target(link, project_root))
+        if removed_files is None:
+            store.prune(files)
+        else:
+            store.remove_files(removed_files)
+    finally:
+        store.close()
+
+def run_query(args, project_root):
+    """
+    Answer an inbound, outbound or broken-link query from the link store.
+    """
+    store_path = args.link_store_path or os.path.join(project_root, LINK_STORE_PATH)
+    if not os.path.exists(store_path):
+        print(f"No link store at {store_path}; run the checker with --link-store first.")
+        return 2
+    
+    path = os.path.abspath(args.path) if args.path else None
+    store = LinkStore(store_path, project_root)
+    try:
+        if args.query == 'broken' and args.by_file:
+            rows = store.broken_by_file(args.limit)
+            for file_path, count in rows:
+                print(f"{count:>6}  {file_path}")
+        elif args.query == 'inbound':
+            rows = store.inbound(path, args.limit)
+            for row in rows:
+                print(format_link_row(row))
+        elif args.query == 'outbound':
+            rows = store.outbound(path, args.limit)
+            for row in rows:
+                print(format_link_row(row, show_file=False))
+        else:
+            rows = store.broken(path, args.limit)
+            for row in rows:
+                print(format_link_row(row))
+    finally:
+        store.close()
+    
+    if not rows:
+        print("No links found.")
+    return 0
 
 def generate_report(valid_links, broken_links):
     """
     Generate a report of valid and broken links.
     """
-    report = "# Documentation Link Check Report\n\n"
-    
-    report += f"## Summary\n\n"
-    report += f"- Total links: {len(valid_links) + len(broken_links)}\n"
-    report += f"- Valid links: {len(valid_links)}\n"
-    report += f"- Broken links: {len(broken_links)}\n\n"
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    relative_paths = {}
+    parts = [format_markdown_header(len(valid_links) + len(broken_links), len(broken_links))]
     
     if broken_links:
-        report += f"## Broken Links\n\n"
-        report += f"| File | Line | Link Text | URL | Error |\n"
-        report += f"|------|------|-----------|-----|-------|\n"
-        
         for link in broken_links:
-            relative_path = os.path.relpath(link.file_path, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            report += f"| {relative_path} | {link.line_number} | {link.text} | {link.url} | {link.error_message} |\n"
+            if link.file_path not in relative_paths:
+                relative_paths[link.file_path] = os.path.relpath(link.file_path, project_root)
+            parts.append(format_markdown_row(link, relative_paths[link.file_path]))
     else:
-        report += f"## No Broken Links Found\n\n"
-        report += f"All links in the documentation are valid.\n"
+        parts.append(MARKDOWN_NO_BROKEN_LINKS)
+    
+    return ''.join(parts)
+
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Check links in documentation files.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reuse cached links and results for unchanged files")
+    parser.add_argument('--cache-path', default=None,
+                        help=f"Incremental cache file (default: {CACHE_PATH})")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="Worker processes for extraction and validation (0: one per CPU, default: 1)")
+    parser.add_argument('--format', dest='formats', action='append', choices=sorted(REPORT_WRITERS),
+                        help=f"Report format to write; repeat for several (default: {', '.join(REPORT_FORMATS)})")
+    parser.add_argument('--check-external', action='store_true',
+                        help="Check http/https links over the network")
+    parser.add_argument('--external-cache-ttl', type=int, default=EXTERNAL_CACHE_TTL,
+                        help=f"Seconds to reuse cached external results, 0 to disable the cache (default: {EXTERNAL_CACHE_TTL})")
+    parser.add_argument('--since', metavar='REF',
+                        help="Only check documentation changed since the merge base with REF and the files linking to changed paths")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and revalidate changed files and the files linking to them (no report is written)")
+    parser.add_argument('--poll', action='store_true',
+                        help="With --watch, poll for changes instead of using inotify")
+    parser.add_argument('--link-store', action='store_true',
+                        help="Record links and their results in the SQLite link store, for the query command")
+    parser.add_argument('--link-store-path', default=None,
+                        help=f"Link store database (default: {LINK_STORE_PATH})")
+    add_profile_arguments(parser)
     
-    return report
+    subparsers = parser.add_subparsers(dest='command')
+    query_parser = subparsers.add_parser('query', help="Query the link store without scanning")
+    query_parser.add_argument('query', choices=['inbound', 'outbound', 'broken'],
+                              help="inbound: links to PATH; outbound: links in PATH; broken: broken links (in PATH)")
+    query_parser.add_argument('path', nargs='?',
+                              help="File or directory the query is about")
+    query_parser.add_argument('--by-file', action='store_true',
+                              help="For broken: count broken links per file, most first")
+    query_parser.add_argument('--limit', type=int, default=QUERY_LIMIT,
+                              help=f"Rows to print (default: {QUERY_LIMIT})")
+    
+    args = parser.parse_args(argv if argv is not None else [])
+    if args.command == 'query' and args.query != 'broken' and not args.path:
+        query_parser.error(f"{args.query} needs a PATH")
+    if args.jobs < 0:
+        parser.error("--jobs must be zero or a positive number")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    args.formats = list(dict.fromkeys(args.formats or REPORT_FORMATS))
+    return args
 
-def main():
+def main(argv=None):
     """
     Main function to check documentation links.
     """
-    print("Checking documentation links...")
+    args = parse_args(argv)
     
     # Get project root directory
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
-    # Collect all links
+    with profile_run('check_documentation_links', args, project_root):
+        return run(args, project_root)
+
+def run(args, project_root):
+    """
+    Check documentation links under the project root with parsed arguments.
+    """
+    if args.command == 'query':
+        return run_query(args, project_root)
+    
+    print("Checking documentation links...")
+    profiler = get_profiler()
+    
+    if args.watch:
+        return watch(args, project_root)
+    
+    # With --since, only check the files affected by the changes, when the referrer
+    # index of an earlier full check is available to find unchanged referring files
+    referrer_index_path = os.path.join(project_root, REFERRER_INDEX_PATH)
+    referrer_index = None
+    scoped_files = None
+    if args.since:
+        with profiler.phase('list changes'):
+            referrer_index = LinkReferrerIndex.load(referrer_index_path, project_root)
+            if referrer_index is None:
+                print(f"No link referrer index at {referrer_index_path}; checking the full tree.")
+            else:
+                try:
+                    changes = changed_files_since(project_root, args.since)
+                    scoped_files, removed_files = select_changed_files(changes, referrer_index, project_root)
+                except Exception as e:
+                    print(f"Error listing changes since {args.since}: {e}; checking the full tree.")
+    
+    cache = None
+    if args.incremental and scoped_files is None:
+        cache_path = args.cache_path or os.path.join(project_root, CACHE_PATH)
+        with profiler.phase('load cache'):
+            cache = LinkCheckCache.load(cache_path, project_root)
+    
+    # Collect all links, scanning overlapping directories only once
     all_links = []
-    for directory in DIRECTORIES_TO_SCAN:
-        dir_path = os.path.join(project_root, directory)
-        if os.path.exists(dir_path):
-            print(f"Scanning {dir_path}...")
-            links = scan_directory(dir_path, project_root)
-            all_links.extend(links)
-        else:
-            print(f"Directory not found: {dir_path}")
+    if scoped_files is not None:
+        print(f"Checking {len(scoped_files)} files affected by {len(changes)} changes since {args.since}...")
+        with profiler.phase('scan'):
+            all_links = extract_files(dict.fromkeys(scoped_files), project_root)
+    else:
+        index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+        for directory, dir_path in index.normalize_roots(DIRECTORIES_TO_SCAN):
+            if dir_path:
+                print(f"Scanning {dir_path}...")
+                with profiler.phase('scan'):
+                    links = scan_directory(dir_path, project_root, cache, args.jobs)
+                all_links.extend(links)
+            else:
+                print(f"Directory not found: {os.path.join(project_root, directory)}")
     
     print(f"Found {len(all_links)} links in documentation files.")
     
+    # Check external links once per unique URL
+    external_results = None
+    if args.check_external:
+        urls = [urldefrag(link.url)[0] for link in all_links if is_external_link(link.url)]
+        external_cache_path = os.path.join(project_root, EXTERNAL_CACHE_PATH) if args.external_cache_ttl > 0 else None
+        print(f"Checking {len(set(urls))} external URLs...")
+        with profiler.phase('check external'):
+            external_results = check_external_links(urls, external_cache_path, args.external_cache_ttl)
+    
+    # Open the report writers so rows are streamed out as links are validated
+    try:
+        writers = open_report_writers(args.formats, project_root)
+    except Exception as e:
+        print(f"Error writing report: {e}")
+        return 1
+    
+    def write_result(link):
+        for writer in writers:
+            writer.add(link)
+    
     # Validate links
-    valid_links, broken_links = validate_links(all_links, project_root)
+    try:
+        with profiler.phase('validate'):
+            valid_links, broken_links = validate_links_parallel(all_links, project_root, args.jobs,
+                                                                external_results, write_result)
+    except BaseException:
+        for writer in writers:
+            writer.abort()
+        raise
     
     print(f"Valid links: {len(valid_links)}")
     print(f"Broken links: {len(broken_links)}")
     
-    # Generate report
-    report = generate_report(valid_links, broken_links)
+    if cache is not None:
+        with profiler.phase('save cache'):
+            cache.store_links(all_links)
+            try:
+                cache.save()
+            except Exception as e:
+                print(f"Error writing link cache: {e}")
     
-    # Write report to file
-    report_path = os.path.join(project_root, 'docs', 'documentation-link-check-report.md')
+    # Keep the referrer index current for the next --since check
+    with profiler.phase('save referrer index'):
+        links_per_file = {}
+        for link in all_links:
+            links_per_file.setdefault(link.file_path, []).append(link)
+        if scoped_files is None:
+            referrer_index = LinkReferrerIndex(project_root, referrer_index_path)
+        else:
+            for file_path in removed_files:
+                referrer_index.remove_file(file_path)
+        for file_path in scoped_files if scoped_files is not None else links_per_file:
+            referrer_index.set_links(file_path, links_per_file.get(file_path, []))
+        try:
+            referrer_index.save()
+        except Exception as e:
+            print(f"Error writing link referrer index: {e}")
+    
+    if args.link_store:
+        store_path = args.link_store_path or os.path.join(project_root, LINK_STORE_PATH)
+        with profiler.phase('update link store'):
+            try:
+                if scoped_files is None:
+                    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+                    files = {file_path: st for _, dir_path in index.normalize_roots(DIRECTORIES_TO_SCAN) if dir_path
+                             for file_path, st in index.walk(dir_path, FILE_EXTENSIONS)}
+                    update_link_store(store_path, project_root, files, all_links)
+                else:
+                    files = {file_path: os.stat(file_path) for file_path in scoped_files}
+                    deleted = [path for change in changes for path in (change.path, change.old_path)
+                               if path and not os.path.exists(path)]
+                    update_link_store(store_path, project_root, files, all_links, deleted)
+            except Exception as e:
+                print(f"Error writing link store: {e}")
+    
+    # Finish the reports
     try:
-        # Remove the old report if it exists
-        if os.path.exists(report_path):
-            os.remove(report_path)
-        
-        # Write the new report
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report)
-        print(f"Report generated: {report_path}")
+        with profiler.phase('write report'):
+            close_report_writers(writers)
+        for writer in writers:
+            print(f"Report generated: {writer.path}")
     except Exception as e:
         print(f"Error writing report: {e}")
         return 1
@@ -225,4 +1226,4 @@ def main():
     return 1 if broken_links else 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
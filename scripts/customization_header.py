@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for customization header detection and parsing
+#
+# COMMON CUSTOMIZATIONS:
+# - HEADER_COMMENT_STYLES: Comment syntax of the customization header by file type
+#   Related to: update_customization_headers.py:HEADER_TEMPLATES
+# - HEADER_SCAN_LINES: Lines from the top of a file in which a header is looked for first; a header right below a longer leading comment block is found too, and one further down by scanning the whole file (default: 64)
+#   Related to: update_customization_headers.py:insert_header
+# ===================================================
+
+import re
+from collections import namedtuple
+
+# Configuration
+HEADER_SCAN_LINES = 64
+
+# Comment syntax of the header per file type: (line comment prefix, block opener, block closer)
+HEADER_COMMENT_STYLES = {
+    '.js': ('//', None, None),
+    '.ts': ('//', None, None),
+    '.py': ('#', None, None),
+    '.html': (None, '<!--', '-->'),
+    '.css': (None, '/*', '*/'),
+    '.scss': (None, '/*', '*/')
+}
+
+# Default comment style for unknown file types
+DEFAULT_COMMENT_STYLE = HEADER_COMMENT_STYLES['.js']
+
+# Starts of the shebang, comment and blank lines that headers are inserted after
+LEADING_COMMENT_PREFIXES = ('#', '//', '/*', '*')
+
+HEADER_TITLE = 'CUSTOMIZABLE SETTINGS IN THIS FILE'
+
+# Lines inside a header, after the comment prefix has been removed
+SETTING_LINE_PATTERN = re.compile(r'\s*-\s*([A-Z_][A-Z0-9_]*)\s*:\s*(.*?)\s*$')
+RELATED_LINE_PATTERN = re.compile(r'\s*Related to:\s*(.*?)\s*$')
+
+# Fields embedded in a setting's description
+DEFAULT_VALUE_PATTERN = re.compile(r'\(default:\s*(.*?)\)')
+VALID_VALUES_PATTERN = re.compile(r'Valid values:\s*\[(.*?)\]')
+RELATED_TO_PATTERN = re.compile(r'Related to:\s*(.*?)(?:\n|$)')
+
+# A setting listed in a header; related_to comes from a following "Related to:" line
+HeaderSetting = namedtuple('HeaderSetting', ['name', 'description', 'related_to'])
+
+# A header found in a file: its text and the settings it lists
+CustomizationHeader = namedtuple('CustomizationHeader', ['text', 'settings'])
+
+class HeaderMatcher:
+    """
+    Line-oriented state machine that finds a customization header near the top of a file.
+
+    The header is looked for within the first HEADER_SCAN_LINES lines, or right
+    below the file's leading comment block, where new headers are inserted. Only a
+    file whose header title appears further down is scanned to the end, so a header
+    placed by hand below the code is not reported missing (and duplicated). Once a
+    header has started, every line must stay inside the comment, so a header opener
+    without a closing rule is given up at the first line of code instead of searching
+    the rest of the file.
+    """
+    def __init__(self, line_prefix, block_open, block_close):
+        prefix = re.escape(line_prefix) if line_prefix else ''
+        opener = re.escape(block_open) if block_open else prefix
+        self.opener = re.compile(rf'\s*({opener}\s*={{3,}})\s*$')
+        self.title = re.compile(rf'\s*{prefix}\s*{HEADER_TITLE}\s*$')
+        self.rule = re.compile(rf'\s*{prefix}\s*={{3,}}')
+        if block_close:
+            self.closer = re.compile(rf'={{3,}}\s*{re.escape(block_close)}')
+        else:
+            self.closer = re.compile(rf'\s*{prefix}\s*={{3,}}')
+        self.comment_line = re.compile(rf'\s*{prefix}') if line_prefix else None
+        self.block_close = block_close
+
+    def _closing_end(self, line):
+        """Return the offset in the line where a closing rule ends, or None."""
+        if self.block_close:
+            match = self.closer.search(line)
+        else:
+            match = self.closer.match(line)
+        return match.end() if match else None
+
+    def _leaves_comment(self, line):
+        """Return True if a header body line is not part of the comment."""
+        if self.block_close:
+            return self.block_close in line
+        return not self.comment_line.match(line)
+
+    def _tokenize(self, line, settings):
+        """Add the setting (or the related-to note of the last setting) on a header line."""
+        if self.comment_line is not None:
+            line = line[self.comment_line.match(line).end():]
+        match = SETTING_LINE_PATTERN.match(line)
+        if match:
+            settings.append(HeaderSetting(match.group(1), match.group(2), None))
+            return
+        match = RELATED_LINE_PATTERN.match(line)
+        if match and settings and settings[-1].related_to is None:
+            settings[-1] = settings[-1]._replace(related_to=match.group(1))
+
+    def find(self, content, scan_lines=HEADER_SCAN_LINES, settings=None):
+        """
+        Return (start, end) offsets of the header in the content, or None.
+
+        When a settings list is given, the settings listed in the header are
+        tokenized into it as the header's lines are walked.
+        """
+        scan_lines = max(scan_lines, leading_comment_lines(content) + 1)
+
+        # Most files have no header: rule them out with one search for the title
+        if content.find(HEADER_TITLE) == -1:
+            return None
+
+        state = 'seek'
+        start = None
+        pos = 0
+        line_number = 0
+        length = len(content)
+
+        while pos < length:
+            newline = content.find('\n', pos)
+            line_end = length if newline == -1 else newline
+            line = content[pos:line_end]
+            line_number += 1
+
+            if state == 'body':
+                end = self._closing_end(line)
+                if end is not None:
+                    return start, pos + end
+                if self._leaves_comment(line):
+                    return None
+                if settings is not None:
+                    self._tokenize(line, settings)
+            elif state == 'title' and self.title.match(line):
+                state = 'rule'
+            elif state == 'rule' and self.rule.match(line):
+                state = 'body'
+            else:
+                # Not (or no longer) inside a header: look for an opener
+                if line_number > scan_lines:
+                    # Past the window, keep going only if a header title lies further down
+                    if content.find(HEADER_TITLE, pos) == -1:
+                        return None
+                    scan_lines = length
+                match = self.opener.match(line)
+                if match:
+                    start = pos + match.start(1)
+                    state = 'title'
+                    if settings:
+                        del settings[:]
+                else:
+                    state = 'seek'
+
+            pos = line_end + 1
+
+        return None
+
+def leading_comment_lines(content):
+    """
+    Return the number of shebang, comment and blank lines at the top of content.
+
+    Headers are inserted right after these lines.
+    """
+    count = 0
+    pos = 0
+    while True:
+        newline = content.find('\n', pos)
+        line = content[pos:] if newline == -1 else content[pos:newline]
+        stripped = line.strip()
+        if stripped and not stripped.startswith(LEADING_COMMENT_PREFIXES):
+            return count
+        count += 1
+        if newline == -1:
+            return count
+        pos = newline + 1
+
+HEADER_MATCHERS = {ext: HeaderMatcher(*style) for ext, style in HEADER_COMMENT_STYLES.items()}
+DEFAULT_MATCHER = HeaderMatcher(*DEFAULT_COMMENT_STYLE)
+
+def find_customization_header(content, ext):
+    """
+    Return the customization header in content for a file type, or None.
+    """
+    span = HEADER_MATCHERS.get(ext, DEFAULT_MATCHER).find(content)
+    return content[span[0]:span[1]] if span else None
+
+
+def parse_customization_header(content, ext):
+    """
+    Find the customization header in content and tokenize the settings it lists,
+    in one pass over its lines. Return a CustomizationHeader, or None.
+    """
+    settings = []
+    span = HEADER_MATCHERS.get(ext, DEFAULT_MATCHER).find(content, settings=settings)
+    return CustomizationHeader(content[span[0]:span[1]], settings) if span else None
+
+def parse_default_value(description):
+    """
+    Return the "(default: ...)" value in a setting description, or None.
+    """
+    match = DEFAULT_VALUE_PATTERN.search(description)
+    return match.group(1) if match else None
+
+def parse_valid_values(description):
+    """
+    Return the "Valid values: [...]" list in a setting description, or None.
+    """
+    match = VALID_VALUES_PATTERN.search(description)
+    return match.group(1) if match else None
+
+def parse_related_to(description):
+    """
+    Return the "Related to: ..." note in a setting description, or None.
+    """
+    match = RELATED_TO_PATTERN.search(description)
+    return match.group(1) if match else None
+
+def parse_environment(description):
+    """
+    Return the environment a setting description mentions, or None.
+    """
+    description = description.lower()
+    if 'development' in description:
+        return 'Development'
+    elif 'production' in description:
+        return 'Production'
+    elif 'test' in description:
+        return 'Test'
+    return None
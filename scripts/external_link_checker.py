@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the external (http/https) link checker
+#
+# COMMON CUSTOMIZATIONS:
+# - EXTERNAL_CACHE_PATH: Path to the external link cache, relative to the project root (default: '.cache/external-link-check.json')
+# - EXTERNAL_CACHE_TTL: Seconds a cached result stays fresh (default: 86400)
+# - CACHED_FAILURE_STATUSES: Failure statuses cached like successes; other failures are checked again on the next run (default: {404, 410})
+#   Related to: check_documentation_links.py:CACHE_PATH
+# - MAX_CONNECTIONS_PER_HOST: Concurrent requests per host (default: 4)
+# - MAX_TOTAL_CONNECTIONS: Concurrent requests across all hosts (default: 32)
+# - REQUEST_TIMEOUT: Seconds before a request times out (default: 10)
+# - MAX_RETRIES: Retries for timeouts, connection errors, 429 and 5xx responses (default: 2)
+# - RETRY_BACKOFF: Base delay in seconds, doubled on every retry (default: 0.5)
+# - HEAD_FALLBACK_STATUSES: HEAD responses after which the URL is checked again with GET (default: {403, 405, 501})
+# ===================================================
+
+import asyncio
+import http.client
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+# Configuration
+EXTERNAL_CACHE_PATH = '.cache/external-link-check.json'
+EXTERNAL_CACHE_TTL = 86400
+MAX_CONNECTIONS_PER_HOST = 4
+MAX_TOTAL_CONNECTIONS = 32
+REQUEST_TIMEOUT = 10
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.5
+MAX_REDIRECTS = 5
+USER_AGENT = 'date-night-app-link-checker/1.0'
+
+# Statuses that are worth retrying, and HEAD failures that are retried with GET
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+HEAD_FALLBACK_STATUSES = {403, 405, 501}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Failures that will not go away by themselves; transient ones are never cached
+CACHED_FAILURE_STATUSES = {404, 410}
+
+class ConnectionPool:
+    """
+    Keeps idle keep-alive connections per (scheme, host, port) for reuse across requests.
+    """
+    def __init__(self, timeout=REQUEST_TIMEOUT):
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme, netloc):
+        """Return an idle connection for the host, or open a new one."""
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def release(self, scheme, netloc, connection):
+        """Return a connection whose response was fully read to the pool."""
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(connection)
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            for connections in self._idle.values():
+                for connection in connections:
+                    connection.close()
+            self._idle.clear()
+
+class ExternalLinkCache:
+    """
+    On-disk cache of external link results that expire after a TTL.
+    """
+    def __init__(self, cache_path, ttl=EXTERNAL_CACHE_TTL):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.results = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, cache_path, ttl=EXTERNAL_CACHE_TTL):
+        """Load a cache file, starting empty if it is missing or unreadable."""
+        cache = cls(cache_path, ttl)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cache.results = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable external link cache {cache_path}: {e}")
+        return cache
+
+    def get(self, url, now=None):
+        """Return a fresh (is_valid, error_message) result for a URL, or None."""
+        entry = self.results.get(url)
+        now = time.time() if now is None else now
+        if entry and now - entry['checked_at'] < self.ttl:
+            return entry['is_valid'], entry['error']
+        return None
+
+    def put(self, url, is_valid, error_message, now=None):
+        """Record the result of checking a URL."""
+        self.results[url] = {
+            'checked_at': time.time() if now is None else now,
+            'is_valid': is_valid,
+            'error': error_message,
+        }
+        self.dirty = True
+
+    def save(self):
+        """Write the cache atomically, dropping expired entries."""
+        now = time.time()
+        expired = [url for url, entry in self.results.items() if now - entry['checked_at'] >= self.ttl]
+        for url in expired:
+            del self.results[url]
+        if not self.dirty and not expired:
+            return
+
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.results, f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+def link_verdict(status, error):
+    """
+    Turn the outcome of checking a URL into (is_valid, error_message).
+    """
+    if status is None:
+        return False, f"Request failed: {error}"
+    if status >= 400:
+        return False, f"HTTP {status}"
+    return True, None
+
+def is_definitive(status):
+    """
+    Check if the outcome of checking a URL can be cached: a success or a permanent failure.
+    """
+    return status is not None and (status < 400 or status in CACHED_FAILURE_STATUSES)
+
+class ExternalLinkChecker:
+    """
+    Checks http/https URLs concurrently with per-host limits, retries and keep-alive connections.
+    """
+    def __init__(self, cache=None, max_per_host=MAX_CONNECTIONS_PER_HOST,
+                 max_total=MAX_TOTAL_CONNECTIONS, timeout=REQUEST_TIMEOUT,
+                 retries=MAX_RETRIES, backoff=RETRY_BACKOFF):
+        self.cache = cache
+        self.max_per_host = max_per_host
+        self.max_total = max_total
+        self.retries = retries
+        self.backoff = backoff
+        self.pool = ConnectionPool(timeout)
+        self._host_limits = {}
+
+    def _request(self, method, url):
+        """
+        Send one request on a pooled connection, following redirects; return the final status,
+        or None if the URL still redirects after MAX_REDIRECTS hops.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            path = parts.path or '/'
+            if parts.query:
+                path = f"{path}?{parts.query}"
+
+            connection = self.pool.acquire(parts.scheme, parts.netloc)
+            try:
+                connection.request(method, path, headers={
+                    'User-Agent': USER_AGENT,
+                    'Connection': 'keep-alive',
+                })
+                response = connection.getresponse()
+                status = response.status
+                location = response.getheader('Location')
+                if method == 'HEAD' and not response.will_close:
+                    response.read()
+                    self.pool.release(parts.scheme, parts.netloc, connection)
+                else:
+                    # Do not download GET bodies just to keep the connection alive
+                    connection.close()
+            except Exception:
+                connection.close()
+                raise
+
+            if status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            return status
+        return None
+
+    async def _request_with_retries(self, loop, executor, method, url):
+        """
+        Run a request in the executor, retrying transient failures with exponential backoff.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                status = await loop.run_in_executor(executor, self._request, method, url)
+                if status is None:
+                    # A redirect loop does not go away by asking again
+                    return None, "Too many redirects"
+                if status not in RETRY_STATUSES or attempt == self.retries:
+                    return status, None
+            except Exception as e:
+                if attempt == self.retries:
+                    return None, f"{type(e).__name__}: {e}"
+            await asyncio.sleep(self.backoff * (2 ** attempt))
+
+    async def check(self, loop, executor, url):
+        """
+        Check one URL with HEAD, falling back to GET when the server rejects HEAD.
+
+        Returns (status, error): the final status, or None and the reason the request failed.
+        """
+        host = urlsplit(url).netloc.lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+
+        async with self._host_limits[host]:
+            status, error = await self._request_with_retries(loop, executor, 'HEAD', url)
+            if status in HEAD_FALLBACK_STATUSES:
+                status, error = await self._request_with_retries(loop, executor, 'GET', url)
+        return status, error
+
+    async def check_all(self, urls):
+        """
+        Check URLs concurrently and return a dict mapping each URL to (is_valid, error_message).
+        """
+        results = {}
+        pending = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url) if self.cache is not None else None
+            if cached is not None:
+                results[url] = cached
+            else:
+                pending.append(url)
+
+        if pending:
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=self.max_total) as executor:
+                outcomes = await asyncio.gather(*(self.check(loop, executor, url) for url in pending))
+            self.pool.close()
+            for url, (status, error) in zip(pending, outcomes):
+                results[url] = link_verdict(status, error)
+                if self.cache is not None and is_definitive(status):
+                    self.cache.put(url, *results[url])
+
+        return results
+
+def check_external_links(urls, cache_path=None, ttl=EXTERNAL_CACHE_TTL, **checker_options):
+    """
+    Check external URLs and return a dict mapping each URL to (is_valid, error_message).
+
+    With a cache_path, fresh cached results are reused, and new successes and permanent
+    failures are saved.
+    """
+    cache = ExternalLinkCache.load(cache_path, ttl) if cache_path else None
+    checker = ExternalLinkChecker(cache, **checker_options)
+    results = asyncio.run(checker.check_all(urls))
+    if cache is not None:
+        try:
+            cache.save()
+        except Exception as e:
+            print(f"Error writing external link cache: {e}")
+    return results
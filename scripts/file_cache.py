@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the per-file on-disk caches used by the documentation scripts
+#
+# COMMON CUSTOMIZATIONS:
+# - HASH_DIGEST_SIZE: Bytes of the blake2b content hash stored per file (default: 16)
+#   Related to: check_documentation_links.py:CACHE_PATH, update_customization_headers.py:CACHE_PATH,
+#   update_config_index.py:CACHE_PATH, api_routes.py:ROUTE_CACHE_PATH
+# ===================================================
+
+import hashlib
+import json
+import os
+
+from script_profiler import get_profiler
+
+# Configuration
+HASH_DIGEST_SIZE = 16
+
+def content_hash(data):
+    """
+    Return a short hash of a file's bytes.
+    """
+    return hashlib.blake2b(data, digest_size=HASH_DIGEST_SIZE).hexdigest()
+
+class FileCache:
+    """
+    On-disk cache holding one entry per file, keyed by its path relative to the project root.
+
+    An entry is reused when the file's mtime and size are unchanged, or when they
+    changed but the content hash did not. Subclasses set version, bumped whenever
+    their payload or the rules producing it change, and description, used in
+    messages; identity() returns settings a cache file must match to be used.
+    Entries of files that were not looked up during the run are dropped on save.
+    """
+    version = 1
+    description = 'file'
+
+    def __init__(self, cache_path, project_root):
+        self.cache_path = cache_path
+        self.project_root = project_root
+        self.files = {}
+        self.seen = set()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, cache_path, project_root, *args):
+        """Load a cache file, starting empty if it is missing, stale or unreadable."""
+        cache = cls(cache_path, project_root, *args)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == cls.version and all(
+                    data.get(name) == value for name, value in cache.identity().items()):
+                cache.files = data.get('files', {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Ignoring unreadable {cls.description} cache {cache_path}: {e}")
+        return cache
+
+    def identity(self):
+        """Return the settings stored with the cache that must match for it to be reused."""
+        return {}
+
+    def _key(self, file_path):
+        return os.path.relpath(file_path, self.project_root)
+
+    def entry(self, file_path):
+        """Return the entry of a file, or None."""
+        return self.files.get(self._key(file_path))
+
+    def lookup(self, file_path, st):
+        """Return the entry of a file whose mtime and size are unchanged, or None."""
+        key = self._key(file_path)
+        self.seen.add(key)
+        entry = self.files.get(key)
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            return entry
+        return None
+
+    def lookup_hash(self, file_path, st, digest):
+        """Return the entry of a touched file whose content hash is unchanged, or None."""
+        entry = self.files.get(self._key(file_path))
+        if entry and digest is not None and entry['hash'] == digest:
+            entry['mtime_ns'] = st.st_mtime_ns
+            entry['size'] = st.st_size
+            self.dirty = True
+            return entry
+        return None
+
+    def store(self, file_path, st, digest, payload):
+        """Replace the entry of a file with a new payload and return it."""
+        entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'hash': digest}
+        entry.update(payload)
+        self.files[self._key(file_path)] = entry
+        self.dirty = True
+        return entry
+
+    def read(self, file_path, st):
+        """Return (data, digest) for a file whose entry could not be reused."""
+        with open(file_path, 'rb') as f:
+            data = f.read()
+            get_profiler().record_read(f)
+        return data, content_hash(data)
+
+    def get(self, file_path, st, empty_payload):
+        """
+        Return (entry, data) for a file.
+
+        When the entry can be reused, data is None. Otherwise the file is read, its
+        entry is reset to empty_payload (a fresh dict the caller fills in later),
+        and entry is None and data is what read() returned.
+        """
+        entry = self.lookup(file_path, st)
+        if entry is not None:
+            return entry, None
+        data, digest = self.read(file_path, st)
+        entry = self.lookup_hash(file_path, st, digest)
+        if entry is not None:
+            return entry, None
+        self.store(file_path, st, digest, empty_payload)
+        return None, data
+
+    def save(self):
+        """Write the cache atomically, dropping entries for files that were not looked up."""
+        stale = [key for key in self.files if key not in self.seen]
+        for key in stale:
+            del self.files[key]
+        if not self.dirty and not stale:
+            return
+
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(version=self.version, **self.identity(), files=self.files), f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the shared file-tree index used by the documentation scripts
+#
+# COMMON CUSTOMIZATIONS:
+# - FOLLOW_SYMLINKS: Descend into symlinked directories (default: True)
+#   Related to: check_documentation_links.py:DIRECTORIES_TO_SCAN
+# ===================================================
+
+import os
+
+from script_profiler import get_profiler
+
+# Configuration
+FOLLOW_SYMLINKS = True
+
+# Indexes shared by every script in the current process, keyed by project root and exclusions
+_SHARED_INDEXES = {}
+
+def _is_within(path, root):
+    """
+    Check if a normalized path is equal to or nested under a normalized root.
+    """
+    return path == root or path.startswith(root.rstrip(os.sep) + os.sep)
+
+class FileTreeIndex:
+    """
+    Walks each scan root at most once per run and hands out unique (path, stat) entries.
+
+    Directories and files are de-duplicated by (st_dev, st_ino), so a tree that is
+    reachable through overlapping roots, symlinks or hard links is only reported once.
+    """
+    def __init__(self, project_root, directories_to_exclude):
+        self.project_root = os.path.abspath(project_root)
+        self.directories_to_exclude = set(directories_to_exclude)
+        self._walked_roots = {}
+        self._seen_dirs = set()
+        self._seen_files = set()
+        # Every file and directory path seen while walking, including duplicates by inode
+        self._paths = set()
+        # Directories that exist but were not walked (excluded, or already walked via another path)
+        self._opaque_dirs = set()
+        self._exists_fallback = {}
+        # Derived per-file data (such as heading slugs), computed at most once per run
+        self._file_data = {}
+        # Position of each yielded entry, so rewritten files can be re-stat'ed in place
+        self._positions = {}
+        # (st_dev, st_ino) of each walked directory, so a deleted directory can be forgotten
+        self._dir_keys = {}
+
+    def resolve(self, directory):
+        """
+        Resolve a scan directory to a normalized absolute path.
+        """
+        return os.path.normpath(os.path.join(self.project_root, directory))
+
+    def normalize_roots(self, directories):
+        """
+        Resolve scan directories and drop missing roots and roots nested in another root.
+
+        Returns a list of (directory, absolute_path) tuples in the order the directories
+        were given. Missing directories are returned with an absolute path of None so
+        callers can report them.
+        """
+        resolved = []
+        for directory in directories:
+            path = self.resolve(directory)
+            resolved.append((directory, path if os.path.isdir(path) else None))
+
+        existing = [path for _, path in resolved if path]
+        roots = []
+        seen_inodes = set()
+        for directory, path in resolved:
+            if path is None:
+                roots.append((directory, None))
+                continue
+            if any(other != path and _is_within(path, other) for other in existing):
+                continue
+            st = os.stat(path)
+            if (st.st_dev, st.st_ino) in seen_inodes:
+                continue
+            seen_inodes.add((st.st_dev, st.st_ino))
+            roots.append((directory, path))
+        return roots
+
+    def _covering_root(self, base_dir):
+        """
+        Find an already-walked root that contains base_dir.
+        """
+        for root in self._walked_roots:
+            if _is_within(base_dir, root):
+                return root
+        return None
+
+    def _walk(self, top):
+        """
+        Walk a directory tree in sorted order, collecting unique file entries.
+        """
+        entries = []
+        try:
+            top_stat = os.stat(top)
+        except OSError:
+            return entries
+        if (top_stat.st_dev, top_stat.st_ino) in self._seen_dirs:
+            self._opaque_dirs.add(top)
+            return entries
+        self._seen_dirs.add((top_stat.st_dev, top_stat.st_ino))
+        self._dir_keys[top] = (top_stat.st_dev, top_stat.st_ino)
+        self._paths.add(top)
+
+        stack = [top]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    dir_entries = sorted(it, key=lambda entry: entry.name)
+            except OSError as e:
+                print(f"Error scanning directory {current}: {e}")
+                continue
+
+            subdirs = []
+            for entry in dir_entries:
+                try:
+                    if entry.is_dir(follow_symlinks=FOLLOW_SYMLINKS):
+                        self._paths.add(entry.path)
+                        if entry.name in self.directories_to_exclude:
+                            self._opaque_dirs.add(entry.path)
+                            continue
+                        st = entry.stat(follow_symlinks=FOLLOW_SYMLINKS)
+                        key = (st.st_dev, st.st_ino)
+                        if key in self._seen_dirs:
+                            self._opaque_dirs.add(entry.path)
+                            continue
+                        self._seen_dirs.add(key)
+                        self._dir_keys[entry.path] = key
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        self._paths.add(entry.path)
+                        st = entry.stat()
+                        key = (st.st_dev, st.st_ino)
+                        if key in self._seen_files:
+                            continue
+                        self._seen_files.add(key)
+                        entries.append((entry.path, st))
+                except OSError as e:
+                    print(f"Error reading {entry.path}: {e}")
+
+            # Push in reverse so directories are visited in sorted order
+            stack.extend(reversed(subdirs))
+        return entries
+
+    def walk(self, base_dir, extensions=None):
+        """
+        Yield unique (path, stat) entries under base_dir, optionally filtered by extension.
+
+        The first call for a root walks the file system; later calls for the same root,
+        or for a directory inside it, are served from the index.
+        """
+        base_dir = os.path.abspath(base_dir)
+        root = self._covering_root(base_dir)
+        if root is None:
+            root = base_dir
+            profiler = get_profiler()
+            with profiler.phase('walk'):
+                self._walked_roots[root] = self._walk(root)
+            profiler.count('files_indexed', len(self._walked_roots[root]))
+            for position, (path, _) in enumerate(self._walked_roots[root]):
+                self._positions[path] = (root, position)
+
+        for path, st in self._walked_roots[root]:
+            if root != base_dir and not _is_within(path, base_dir):
+                continue
+            if extensions is not None and os.path.splitext(path)[1] not in extensions:
+                continue
+            yield path, st
+
+    def exists(self, path):
+        """
+        Check if a path exists, answering from the index when it covers the path.
+        
+        Paths outside the walked roots, or inside excluded or de-duplicated
+        directories, fall back to a (memoized) file-system check.
+        """
+        path = os.path.normpath(os.path.abspath(path))
+        if path in self._paths:
+            return True
+        
+        root = self._covering_root(path)
+        if root is not None:
+            parent = os.path.dirname(path)
+            while parent not in self._opaque_dirs:
+                if parent == root or parent == os.path.dirname(parent):
+                    return False
+                parent = os.path.dirname(parent)
+        
+        if path not in self._exists_fallback:
+            self._exists_fallback[path] = os.path.exists(path)
+        return self._exists_fallback[path]
+
+    def refresh(self, path):
+        """
+        Re-stat an indexed file after it was rewritten and drop its derived data.
+        """
+        path = os.path.normpath(os.path.abspath(path))
+        for key in [key for key in self._file_data if key[1] == path]:
+            del self._file_data[key]
+        if path in self._positions:
+            root, position = self._positions[path]
+            self._walked_roots[root][position] = (path, os.stat(path))
+
+    def update(self, paths):
+        """
+        Bring the index up to date with paths that were created, changed or deleted
+        after they were walked, such as the paths reported by a file watcher.
+        
+        Derived data of the paths and of everything below them is dropped. New
+        directories are walked and deleted ones are forgotten with their contents;
+        directories that are already indexed are left alone, since changes inside
+        them are reported as paths of their own. Returns (updated, removed): the
+        file entries that were added or re-stat'ed, and those that were dropped.
+        """
+        updated = {}
+        removed = []
+        paths = {os.path.normpath(os.path.abspath(path)) for path in paths}
+        for path in paths:
+            for key in [key for key in self._file_data if _is_within(key[1], path)]:
+                del self._file_data[key]
+            for key in [key for key in self._exists_fallback if _is_within(key, path)]:
+                del self._exists_fallback[key]
+        
+        # Forget deleted paths first, so a directory moved within the tree is not
+        # mistaken for a duplicate of itself; then add parents before children
+        existing = {path: os.path.exists(path) for path in paths}
+        for path in sorted(paths, key=lambda path: (existing[path], path)):
+            root = self._covering_root(path)
+            if not existing[path]:
+                removed.extend(self._forget(path, root))
+            elif root is not None and not self._is_excluded(path, root):
+                updated.update(self._add(path, root))
+        return list(updated.items()), removed
+    
+    def _is_excluded(self, path, root):
+        """
+        Check if a path lies in a directory that was excluded or skipped as a duplicate.
+        """
+        parent = os.path.dirname(path)
+        while parent != root and _is_within(parent, root):
+            if parent in self._opaque_dirs or os.path.basename(parent) in self.directories_to_exclude:
+                return True
+            parent = os.path.dirname(parent)
+        return False
+    
+    def _add(self, path, root):
+        """
+        Add or re-stat an existing path below a walked root; return the file entries that changed.
+        """
+        parent = os.path.dirname(path)
+        while parent not in self._paths and _is_within(parent, root):
+            self._paths.add(parent)
+            parent = os.path.dirname(parent)
+        
+        entries = self._walked_roots[root]
+        try:
+            st = os.stat(path)
+        except OSError:
+            return []
+        if os.path.isdir(path):
+            if path in self._paths:
+                return []
+            if os.path.basename(path) in self.directories_to_exclude:
+                self._paths.add(path)
+                self._opaque_dirs.add(path)
+                return []
+            new_entries = self._walk(path)
+        else:
+            self._paths.add(path)
+            if path in self._positions:
+                entries[self._positions[path][1]] = (path, st)
+                return [(path, st)]
+            self._seen_files.add((st.st_dev, st.st_ino))
+            new_entries = [(path, st)]
+        
+        for entry in new_entries:
+            self._positions[entry[0]] = (root, len(entries))
+            entries.append(entry)
+        return new_entries
+    
+    def _forget(self, path, root):
+        """
+        Drop a deleted path and everything below it; return the file entries that were dropped.
+        """
+        was_directory = path in self._dir_keys or path in self._opaque_dirs
+        if was_directory:
+            self._paths = {p for p in self._paths if not _is_within(p, path)}
+            self._opaque_dirs = {p for p in self._opaque_dirs if not _is_within(p, path)}
+            for directory in [d for d in self._dir_keys if _is_within(d, path)]:
+                self._seen_dirs.discard(self._dir_keys.pop(directory))
+        else:
+            self._paths.discard(path)
+        if root is None or (not was_directory and path not in self._positions):
+            return []
+        
+        entries = self._walked_roots[root]
+        kept = []
+        dropped = []
+        for entry in entries:
+            if _is_within(entry[0], path):
+                self._seen_files.discard((entry[1].st_dev, entry[1].st_ino))
+                del self._positions[entry[0]]
+                dropped.append(entry)
+            else:
+                kept.append(entry)
+        if dropped:
+            entries[:] = kept
+            for position, (entry_path, _) in enumerate(kept):
+                self._positions[entry_path] = (root, position)
+        return dropped
+    
+    def file_data(self, path, kind, loader):
+        """
+        Return derived data of a given kind for a file, calling loader(path) only on first use.
+        """
+        key = (kind, os.path.normpath(os.path.abspath(path)))
+        if key not in self._file_data:
+            self._file_data[key] = loader(path)
+        return self._file_data[key]
+
+    def set_file_data(self, path, kind, data):
+        """
+        Record derived data for a file that was already parsed by the caller.
+        """
+        self._file_data[(kind, os.path.normpath(os.path.abspath(path)))] = data
+
+    def files(self, extensions=None):
+        """
+        Yield every unique (path, stat) entry indexed so far.
+        """
+        for root in list(self._walked_roots):
+            yield from self.walk(root, extensions)
+
+def get_tree_index(project_root, directories_to_exclude):
+    """
+    Return the index shared by all scripts in this process for a project root.
+    """
+    key = (os.path.abspath(project_root), frozenset(directories_to_exclude))
+    if key not in _SHARED_INDEXES:
+        _SHARED_INDEXES[key] = FileTreeIndex(project_root, directories_to_exclude)
+    return _SHARED_INDEXES[key]
+
+def install_tree_index(index):
+    """
+    Make an index built in another process the shared index for its project root.
+
+    Used as a process pool initializer, so workers started with the spawn method
+    (the default on macOS and Windows) reuse the parent's walk and parsed file data
+    instead of starting from an empty index.
+    """
+    _SHARED_INDEXES[(index.project_root, frozenset(index.directories_to_exclude))] = index
+
+def reset_tree_indexes():
+    """
+    Drop all shared indexes so the next run walks the file system again.
+    """
+    _SHARED_INDEXES.clear()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the file watchers used by the documentation scripts' watch mode
+#
+# COMMON CUSTOMIZATIONS:
+# - WATCH_POLL_INTERVAL: Seconds between scans of the polling watcher (default: 0.5)
+# - WATCH_DEBOUNCE: Seconds to wait for further events before reporting a batch of changes (default: 0.02)
+#   Related to: check_documentation_links.py:DIRECTORIES_TO_EXCLUDE
+# ===================================================
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+# Configuration
+WATCH_POLL_INTERVAL = 0.5
+WATCH_DEBOUNCE = 0.02
+
+# inotify event masks (see inotify(7))
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE |
+              IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+# struct inotify_event without its variable-length name: wd, mask, cookie, len
+INOTIFY_EVENT = struct.Struct('iIII')
+
+def iter_directories(root, directories_to_exclude):
+    """
+    Yield root and every directory below it, skipping excluded directory names.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        yield current
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.name not in directories_to_exclude and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+
+class PollingWatcher:
+    """
+    Detects changes by re-scanning the watched trees and comparing (mtime, size) per path.
+    """
+    def __init__(self, roots, directories_to_exclude, interval=WATCH_POLL_INTERVAL):
+        self.roots = [os.path.abspath(root) for root in roots]
+        self.directories_to_exclude = set(directories_to_exclude)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self):
+        """Return {path: (mtime_ns, size)} for every file and directory under the roots."""
+        snapshot = {}
+        for root in self.roots:
+            for directory in iter_directories(root, self.directories_to_exclude):
+                try:
+                    with os.scandir(directory) as it:
+                        for entry in it:
+                            if entry.name in self.directories_to_exclude:
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+    def poll(self, timeout=None):
+        """
+        Wait until something changed or the timeout expired; return the set of changed paths.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            if remaining > 0:
+                time.sleep(remaining)
+            snapshot = self._scan()
+            changed = {path for path, state in snapshot.items() if self._snapshot.get(path) != state}
+            changed.update(path for path in self._snapshot if path not in snapshot)
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        """Release the watcher."""
+
+class InotifyWatcher:
+    """
+    Receives changes from the Linux kernel through inotify, with one watch per directory.
+
+    Directories that are created or moved in are watched as they appear. poll()
+    returns None when the kernel's event queue overflowed and changes were lost,
+    in which case the caller has to rescan.
+    """
+    def __init__(self, roots, directories_to_exclude):
+        self.directories_to_exclude = set(directories_to_exclude)
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._paths = {}
+        self._watches = {}
+        try:
+            for root in roots:
+                self._watch_tree(os.path.abspath(root))
+        except BaseException:
+            self.close()
+            raise
+
+    def _watch_tree(self, root):
+        """Add a watch for root and every directory below it."""
+        for directory in iter_directories(root, self.directories_to_exclude):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                error = ctypes.get_errno()
+                if os.path.isdir(directory):
+                    raise OSError(error, f"inotify_add_watch failed for {directory}: {os.strerror(error)}")
+                continue
+            self._paths[wd] = directory
+            self._watches[directory] = wd
+
+    def _forget_tree(self, root):
+        """Drop the watches of a directory that was moved away, and of everything below it."""
+        prefix = root.rstrip(os.sep) + os.sep
+        for directory in [d for d in self._watches if d == root or d.startswith(prefix)]:
+            wd = self._watches.pop(directory)
+            self._paths.pop(wd, None)
+            self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _read_events(self, changed):
+        """Read every queued event into changed; return False if the queue overflowed."""
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return True
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_length = INOTIFY_EVENT.unpack_from(data, offset)
+                offset += INOTIFY_EVENT.size
+                name = data[offset:offset + name_length].rstrip(b'\0')
+                offset += name_length
+                if mask & IN_Q_OVERFLOW:
+                    return False
+                directory = self._paths.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_IGNORED:
+                    self._watches.pop(self._paths.pop(wd), None)
+                    continue
+                if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                    changed.add(directory)
+                    continue
+                path = os.path.join(directory, os.fsdecode(name))
+                if os.path.basename(path) in self.directories_to_exclude:
+                    continue
+                changed.add(path)
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._watch_tree(path)
+                    elif mask & IN_MOVED_FROM:
+                        self._forget_tree(path)
+
+    def poll(self, timeout=None):
+        """
+        Wait until something changed or the timeout expired; return the set of changed
+        paths, or None if events were lost.
+        """
+        changed = set()
+        while True:
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if not ready:
+                return changed
+            if not self._read_events(changed):
+                return None
+            # An editor's save is often several events; collect the whole burst
+            timeout = WATCH_DEBOUNCE
+
+    def close(self):
+        """Release the inotify file descriptor and its watches."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+def create_watcher(roots, directories_to_exclude, polling=False):
+    """
+    Return an inotify watcher on Linux, falling back to polling when inotify is not
+    available (other platforms, watch limit reached) or polling is requested.
+    """
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots, directories_to_exclude)
+        except (OSError, AttributeError) as e:
+            print(f"inotify is not available ({e}); polling every {WATCH_POLL_INTERVAL}s instead.")
+    return PollingWatcher(roots, directories_to_exclude)
@@ -9,22 +9,30 @@
 # - DIRECTORIES_TO_EXCLUDE: Directories to exclude from scanning (default: ['node_modules', 'dist', '.git'])
 # - FILE_EXTENSIONS: File extensions to scan for links (default: ['.md'])
 # - LINK_PATTERNS: Regex patterns to identify links in documentation files
-# - LINK_REPLACEMENTS: Patterns to replace in links
+# - LINK_REPLACEMENTS: Patterns to replace in links, applied only inside the link spans found by LINK_PATTERNS
 # ===================================================
 
+import argparse
+import bisect
+import difflib
 import os
 import re
 import sys
 from pathlib import Path
 
+import check_documentation_links
+from file_tree_index import get_tree_index
+from script_profiler import add_profile_arguments, get_profiler, profile_run
+
 # Configuration
 DIRECTORIES_TO_SCAN = ['.', 'docs', 'client-angular', 'server']
 DIRECTORIES_TO_EXCLUDE = ['node_modules', 'dist', '.git', '__pycache__']
 FILE_EXTENSIONS = ['.md']
 
-# Regex patterns to identify links in documentation files
+# Regex patterns to identify links in documentation files, matched against the whole file.
+# Link text may wrap across lines but not across a blank line.
 LINK_PATTERNS = [
-    r'\[([^\]]+)\]\(([^)]+)\)',  # Markdown links: [text](url)
+    r'\[((?:[^\]\n]|\n(?![ \t]*\n))+)\]\(([^)\n]+)\)',  # Markdown links: [text](url)
 ]
 
 # Common link replacement patterns
@@ -45,80 +53,209 @@ LINK_REPLACEMENTS = [
     (r'\]\(images/', '](/docs/images/'),
 ]
 
-def fix_links_in_file(file_path, project_root):
+# Fenced code blocks and inline code spans, whose contents are never rewritten
+CODE_SPAN_PATTERN = re.compile(
+    r'^ {0,3}(`{3,}|~{3,})[^\n]*\n.*?(?:^ {0,3}\1[ \t]*$|\Z)'  # Fenced code block
+    r'|(`+)(?!`)(?:[^\n]|\n(?![ \t]*\n))*?(?<!`)\2(?!`)',  # Inline code, within one paragraph
+    re.MULTILINE | re.DOTALL)
+
+class LinkRewriter:
+    """
+    Applies LINK_REPLACEMENTS to link spans through one combined, dispatching matcher.
+    
+    The combined alternation finds the next rule that matches anywhere in a span in a
+    single scan; the matching rule's own regex then produces the replacement, so
+    group references in replacements keep working. A span is rewritten until it is
+    stable, so a rule can still apply to the output of an earlier one.
+    """
+    def __init__(self, replacements):
+        self.rules = [(re.compile(pattern), replacement) for pattern, replacement in replacements]
+        self.matcher = re.compile('|'.join(f'(?P<rule{i}>{pattern})' for i, (pattern, _) in enumerate(replacements)))
+    
+    def _dispatch(self, match):
+        name = match.lastgroup or next(name for name, value in match.groupdict().items() if value is not None)
+        pattern, replacement = self.rules[int(name[len('rule'):])]
+        return pattern.match(match.string, match.start()).expand(replacement)
+    
+    def rewrite(self, span):
+        """Rewrite one link span."""
+        for _ in range(len(self.rules) + 1):
+            new_span = self.matcher.sub(self._dispatch, span)
+            if new_span == span:
+                break
+            span = new_span
+        return span
+
+LINK_SCANNER, _ = check_documentation_links.compile_link_scanner(LINK_PATTERNS)
+LINK_REWRITER = LinkRewriter(LINK_REPLACEMENTS)
+
+def find_code_spans(content):
+    """
+    Return sorted (start, end) offsets of fenced code blocks and inline code spans.
+    """
+    return [match.span() for match in CODE_SPAN_PATTERN.finditer(content)]
+
+def fix_links_in_content(content):
+    """
+    Rewrite the links in a document in one pass, leaving prose and code untouched.
+    """
+    code_spans = None
+    parts = []
+    position = 0
+    
+    for match in LINK_SCANNER.finditer(content):
+        start, end = match.span()
+        if code_spans is None:
+            code_spans = find_code_spans(content)
+            code_starts = [span_start for span_start, _ in code_spans]
+        
+        # Skip links inside code
+        i = bisect.bisect_right(code_starts, start) - 1
+        if i >= 0 and start < code_spans[i][1]:
+            continue
+        
+        span = match.group(0)
+        new_span = LINK_REWRITER.rewrite(span)
+        if new_span != span:
+            parts.append(content[position:start])
+            parts.append(new_span)
+            position = end
+    
+    if not parts:
+        return content
+    parts.append(content[position:])
+    return ''.join(parts)
+
+def fix_links_in_file(file_path, project_root, dry_run=False, fixed_contents=None):
     """
     Fix broken links in a documentation file.
+    
+    In dry-run mode the file is left untouched and a unified diff of the changes is printed.
+    When fixed_contents is given, the new content of a fixed file is recorded in it.
     """
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
+            get_profiler().record_read(f)
         
         original_content = content
         
         # Apply link replacements
-        for pattern, replacement in LINK_REPLACEMENTS:
-            content = re.sub(pattern, replacement, content)
+        content = fix_links_in_content(content)
+        
+        if content == original_content:
+            return False
         
-        # Write the updated content back to the file if changes were made
-        if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            print(f"Fixed links in {file_path}")
+        if dry_run:
+            relative_path = os.path.relpath(file_path, project_root)
+            sys.stdout.writelines(difflib.unified_diff(
+                original_content.splitlines(keepends=True),
+                content.splitlines(keepends=True),
+                fromfile=f"a/{relative_path}",
+                tofile=f"b/{relative_path}",
+            ))
             return True
         
-        return False
+        # Write the updated content back to the file
+        with open(file_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE).refresh(file_path)
+        if fixed_contents is not None:
+            fixed_contents[file_path] = content
+        print(f"Fixed links in {file_path}")
+        return True
     except Exception as e:
         print(f"Error fixing links in {file_path}: {e}")
         return False
 
-def scan_directory(base_dir, project_root):
+def scan_directory(base_dir, project_root, dry_run=False, fixed_contents=None):
     """
     Scan a directory for documentation files and fix links.
     """
     fixed_files = 0
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    profiler = get_profiler()
     
-    for root, dirs, files in os.walk(base_dir):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in DIRECTORIES_TO_EXCLUDE]
-        
-        for file in files:
-            file_path = os.path.join(root, file)
-            ext = os.path.splitext(file)[1]
-            
-            if ext in FILE_EXTENSIONS:
-                # Fix links in the file
-                if fix_links_in_file(file_path, project_root):
-                    fixed_files += 1
+    for file_path, _ in index.walk(base_dir, FILE_EXTENSIONS):
+        # Fix links in the file
+        with profiler.file(file_path):
+            if fix_links_in_file(file_path, project_root, dry_run=dry_run, fixed_contents=fixed_contents):
+                fixed_files += 1
     
+    profiler.count('files_fixed', fixed_files)
     return fixed_files
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Fix common broken link patterns in documentation files.")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Print a unified diff of the fixes instead of writing them")
+    parser.add_argument('--full-check', action='store_true',
+                        help="Verify the whole tree after fixing instead of only the changed files")
+    add_profile_arguments(parser)
+    return parser.parse_args(argv if argv is not None else [])
+
+def main(argv=None):
     """
     Main function to fix documentation links.
     """
-    print("Fixing documentation links...")
+    args = parse_args(argv)
     
     # Get project root directory
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
-    # Fix links in all directories
+    with profile_run('fix_documentation_links', args, project_root):
+        return run(args, project_root)
+
+def run(args, project_root):
+    """
+    Fix documentation links under the project root with parsed arguments.
+    """
+    print("Fixing documentation links...")
+    profiler = get_profiler()
+    
+    # Fix links in all directories, scanning overlapping directories only once
     total_fixed_files = 0
-    for directory in DIRECTORIES_TO_SCAN:
-        dir_path = os.path.join(project_root, directory)
-        if os.path.exists(dir_path):
+    fixed_contents = {}
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    for directory, dir_path in index.normalize_roots(DIRECTORIES_TO_SCAN):
+        if dir_path:
             print(f"Scanning {dir_path}...")
-            fixed_files = scan_directory(dir_path, project_root)
+            with profiler.phase('fix'):
+                fixed_files = scan_directory(dir_path, project_root, args.dry_run, fixed_contents)
             total_fixed_files += fixed_files
         else:
-            print(f"Directory not found: {dir_path}")
+            print(f"Directory not found: {os.path.join(project_root, directory)}")
+    
+    if args.dry_run:
+        print(f"Would fix links in {total_fixed_files} files.")
+        return 0
     
     print(f"Fixed links in {total_fixed_files} files.")
     
-    # Run the link checker to see if there are still broken links
-    print("\nRunning link checker to verify fixes...")
-    os.system(f"python3 {os.path.join(project_root, 'scripts', 'check_documentation_links.py')}")
+    # Run the link checker in-process, reusing the file index built above
+    if args.full_check:
+        print("\nRunning link checker to verify fixes...")
+        with profiler.phase('verify'):
+            check_documentation_links.main([])
+        return 0
+    
+    if not fixed_contents:
+        print("\nNo files changed; nothing to verify.")
+        return 0
+    
+    print(f"\nVerifying links in {len(fixed_contents)} changed files...")
+    with profiler.phase('verify'):
+        valid_links, broken_links = check_documentation_links.verify_files(fixed_contents, project_root)
+    print(f"Valid links: {len(valid_links)}")
+    print(f"Broken links: {len(broken_links)}")
+    for link in broken_links:
+        relative_path = os.path.relpath(link.file_path, project_root)
+        print(f"  {relative_path}:{link.line_number}: {link.url} ({link.error_message})")
     
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
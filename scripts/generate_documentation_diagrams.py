@@ -7,13 +7,22 @@
 # COMMON CUSTOMIZATIONS:
 # - DIAGRAMS_TO_GENERATE: List of diagrams to generate
 # - OUTPUT_DIRECTORY: Directory to output diagrams to
+# - DIAGRAM_JOBS: Diagrams generated concurrently unless --jobs is given (default: 4)
+# - DERIVED_DIAGRAMS: Diagrams whose content is derived from the code (default: api_endpoints from the Express routes)
+#   Related to: api_routes.py:API_ENTRY_FILE, api_routes.py:ROUTE_CACHE_PATH
 # ===================================================
 
+import argparse
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from api_routes import (API_ENTRY_FILE, ROUTE_CACHE_PATH, RouteExtractionCache, build_endpoints_diagram,
+                        resolve_endpoints, scan_route_sources)
+from script_profiler import add_profile_arguments, get_profiler, profile_run
+
 # Configuration
 DIAGRAMS_TO_GENERATE = [
     "architecture",
@@ -24,6 +33,10 @@ DIAGRAMS_TO_GENERATE = [
 ]
 
 OUTPUT_DIRECTORY = "docs/images"
+DIAGRAM_JOBS = 4
+
+# Outcomes of generating a diagram, in the order they are summarized
+DIAGRAM_STATUSES = ['created', 'updated', 'skipped']
 
 # Diagram definitions
 DIAGRAMS = {
@@ -200,7 +213,9 @@ classDiagram
     },
     "api_endpoints": {
         "title": "API Endpoints",
-        "description": "API endpoints for the Date Night App",
+        "description": "API endpoints for the Date Night App, derived from the server's route files",
+        # Fallback for code that reads DIAGRAMS directly: resolve_diagrams replaces it
+        # with the content derived from the server's route definitions, see DERIVED_DIAGRAMS
         "content": """
 graph TD
     API[API] --> Auth[Authentication]
@@ -245,56 +260,192 @@ graph TD
     }
 }
 
-def generate_mermaid_diagram(diagram_name, output_directory):
+def derive_api_endpoints(project_root, use_cache=True):
+    """
+    Build the api_endpoints diagram from the Express routes mounted from API_ENTRY_FILE.
+    
+    Routes are extracted per file and cached by content hash, so only changed
+    server files are read again.
+    """
+    profiler = get_profiler()
+    cache = None
+    if use_cache:
+        cache = RouteExtractionCache.load(os.path.join(project_root, ROUTE_CACHE_PATH), project_root)
+    
+    with profiler.phase('extract routes'):
+        results = scan_route_sources(project_root, cache)
+        endpoints, unmounted = resolve_endpoints(results, project_root)
+    
+    if cache is not None:
+        with profiler.phase('save cache'):
+            try:
+                cache.save()
+            except Exception as e:
+                print(f"Error writing route cache: {e}")
+    
+    print(f"Found {len(endpoints)} API endpoints mounted from {API_ENTRY_FILE}.")
+    if unmounted:
+        print(f"{unmounted} files define routes that are not mounted from {API_ENTRY_FILE}.")
+    return build_endpoints_diagram(endpoints)
+
+# Diagrams whose content is derived from the code, by function of (project_root, use_cache)
+DERIVED_DIAGRAMS = {
+    "api_endpoints": derive_api_endpoints,
+}
+
+def default_project_root():
+    """
+    Return the root of the project this script belongs to.
+    """
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def resolve_diagrams(diagram_names, project_root, use_cache=True):
+    """
+    Return DIAGRAMS with the content of the derived diagrams among diagram_names filled in.
+    """
+    diagrams = dict(DIAGRAMS)
+    for diagram_name in diagram_names:
+        if diagram_name in DERIVED_DIAGRAMS and diagram_name in diagrams:
+            content = DERIVED_DIAGRAMS[diagram_name](project_root, use_cache)
+            diagrams[diagram_name] = dict(diagrams[diagram_name], content=content)
+    return diagrams
+
+def render_diagram(diagram):
+    """
+    Return the contents of a diagram's Mermaid and Markdown files.
+    """
+    markdown = (f"# {diagram['title']}\n\n"
+                f"{diagram['description']}\n\n"
+                "```mermaid\n"
+                f"{diagram['content']}"
+                "\n```\n")
+    return diagram["content"], markdown
+
+def write_if_changed(path, content):
+    """
+    Write content to path atomically unless the file already holds it.
+    
+    An existing file of a different size is known to differ without reading it.
+    Returns 'created', 'updated' or 'skipped'.
+    """
+    data = content.encode('utf-8')
+    try:
+        if os.path.getsize(path) == len(data):
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    return 'skipped'
+        status = 'updated'
+    except FileNotFoundError:
+        status = 'created'
+    
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return status
+
+def generate_mermaid_diagram(diagram_name, output_directory, diagrams=None, project_root=None):
     """
-    Generate a Mermaid diagram.
+    Generate a Mermaid diagram, writing only the files whose content changed.
+    
+    diagrams is the result of resolve_diagrams; without it, the diagram is resolved
+    here against project_root (default: the project this script belongs to).
+    Returns 'created' if a file of the diagram was missing, 'updated' if one
+    changed and 'skipped' if both were up to date; None if the diagram is unknown.
     """
-    if diagram_name not in DIAGRAMS:
+    if diagrams is None:
+        diagrams = resolve_diagrams([diagram_name], project_root or default_project_root())
+    if diagram_name not in diagrams:
         print(f"Diagram {diagram_name} not found.")
-        return False
+        return None
     
-    diagram = DIAGRAMS[diagram_name]
+    mermaid, markdown = render_diagram(diagrams[diagram_name])
     
     # Create the output directory if it doesn't exist
     os.makedirs(output_directory, exist_ok=True)
     
-    # Create the Mermaid file
-    mermaid_path = os.path.join(output_directory, f"{diagram_name}.mmd")
-    with open(mermaid_path, 'w', encoding='utf-8') as f:
-        f.write(diagram["content"])
-    
-    # Create the Markdown file
-    markdown_path = os.path.join(output_directory, f"{diagram_name}.md")
-    with open(markdown_path, 'w', encoding='utf-8') as f:
-        f.write(f"# {diagram['title']}\n\n")
-        f.write(f"{diagram['description']}\n\n")
-        f.write("```mermaid\n")
-        f.write(diagram["content"])
-        f.write("\n```\n")
-    
-    print(f"Generated {diagram_name} diagram.")
-    return True
+    statuses = [
+        write_if_changed(os.path.join(output_directory, f"{diagram_name}.mmd"), mermaid),
+        write_if_changed(os.path.join(output_directory, f"{diagram_name}.md"), markdown),
+    ]
+    return min(statuses, key=DIAGRAM_STATUSES.index)
+
+def generate_diagrams(diagram_names, output_directory, jobs=DIAGRAM_JOBS, diagrams=None, project_root=None):
+    """
+    Generate diagrams concurrently; return their statuses in the order of diagram_names.
+    
+    Without diagrams, they are resolved once against project_root, as in generate_mermaid_diagram.
+    """
+    if diagrams is None:
+        diagrams = resolve_diagrams(diagram_names, project_root or default_project_root())
+    if jobs <= 1 or len(diagram_names) <= 1:
+        return [generate_mermaid_diagram(name, output_directory, diagrams) for name in diagram_names]
+    
+    with ThreadPoolExecutor(max_workers=min(jobs, len(diagram_names))) as executor:
+        return list(executor.map(lambda name: generate_mermaid_diagram(name, output_directory, diagrams),
+                                 diagram_names))
+
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Generate the Mermaid documentation diagrams.")
+    parser.add_argument('--jobs', '-j', type=int, default=DIAGRAM_JOBS,
+                        help=f"Diagrams generated concurrently (0: one per CPU, default: {DIAGRAM_JOBS})")
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help=f"Extract the API routes from every server file instead of reusing {ROUTE_CACHE_PATH}")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv if argv is not None else [])
+    if args.jobs < 0:
+        parser.error("--jobs must be zero or a positive number")
+    if args.jobs == 0:
+        args.jobs = os.cpu_count() or 1
+    return args
 
-def main():
+def main(argv=None):
     """
     Main function to generate documentation diagrams.
     """
-    print("Generating documentation diagrams...")
+    args = parse_args(argv)
     
     # Get project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    project_root = default_project_root()
+    
+    with profile_run('generate_documentation_diagrams', args, project_root):
+        return run(args, project_root)
+
+def run(args, project_root):
+    """
+    Generate the documentation diagrams of the project root with parsed arguments.
+    """
+    print("Generating documentation diagrams...")
+    profiler = get_profiler()
     
     # Create the output directory
     output_directory = os.path.join(project_root, OUTPUT_DIRECTORY)
     os.makedirs(output_directory, exist_ok=True)
     
-    # Generate diagrams
-    for diagram_name in DIAGRAMS_TO_GENERATE:
-        generate_mermaid_diagram(diagram_name, output_directory)
-    
-    print(f"Diagrams generated in {output_directory}.")
+    # Derive diagrams from the code, then write them, rewriting only the files whose content changed
+    diagrams = resolve_diagrams(DIAGRAMS_TO_GENERATE, project_root, args.use_cache)
+    try:
+        with profiler.phase('generate'):
+            statuses = generate_diagrams(DIAGRAMS_TO_GENERATE, output_directory, args.jobs, diagrams)
+    except Exception as e:
+        print(f"Error writing diagrams: {e}")
+        return 1
+    
+    counts = dict.fromkeys(DIAGRAM_STATUSES, 0)
+    for diagram_name, status in zip(DIAGRAMS_TO_GENERATE, statuses):
+        if status is None:
+            continue
+        counts[status] += 1
+        profiler.count(f"diagrams_{status}")
+        print(f"{status.capitalize()} {diagram_name} diagram{' (unchanged)' if status == 'skipped' else ''}.")
+    
+    summary = ', '.join(f"{counts[status]} {status}" for status in DIAGRAM_STATUSES)
+    print(f"Diagrams in {output_directory}: {summary}.")
     
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file
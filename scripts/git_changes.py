@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for listing the files changed since a git ref
+#
+# COMMON CUSTOMIZATIONS:
+# - GIT_EXECUTABLE: git command used to list changes (default: 'git')
+# - INCLUDE_UNTRACKED: Report untracked, non-ignored files as added (default: True)
+#   Related to: check_documentation_links.py:REFERRER_INDEX_PATH
+# ===================================================
+
+import os
+import subprocess
+from collections import namedtuple
+
+# Configuration
+GIT_EXECUTABLE = 'git'
+INCLUDE_UNTRACKED = True
+
+# A changed file: status is 'A', 'M', 'D', 'R' (renamed from old_path), 'C' (copied from old_path) or 'T'
+FileChange = namedtuple('FileChange', ['status', 'path', 'old_path'])
+
+def run_git(project_root, *args):
+    """
+    Run a git command in the project root and return its output, raising on failure.
+    """
+    result = subprocess.run([GIT_EXECUTABLE, '-C', project_root, *args], capture_output=True, check=False)
+    if result.returncode != 0:
+        message = result.stderr.decode('utf-8', 'replace').strip()
+        raise RuntimeError(f"git {' '.join(args)} failed: {message}")
+    return result.stdout
+
+def parse_name_status(output, project_root):
+    """
+    Parse `git diff --name-status -z` output into FileChange tuples with absolute paths.
+    """
+    fields = output.decode('utf-8', 'surrogateescape').split('\0')
+    changes = []
+    position = 0
+    while position < len(fields) and fields[position]:
+        status = fields[position][0]
+        if status in ('R', 'C'):
+            old_path, path = fields[position + 1], fields[position + 2]
+            position += 3
+        else:
+            old_path, path = None, fields[position + 1]
+            position += 2
+        changes.append(FileChange(status,
+                                  os.path.normpath(os.path.join(project_root, path)),
+                                  os.path.normpath(os.path.join(project_root, old_path)) if old_path else None))
+    return changes
+
+def changed_files_since(project_root, ref, include_untracked=INCLUDE_UNTRACKED):
+    """
+    List the files under the project root that changed since a ref.
+
+    Changes are taken against the merge base of ref and HEAD, so `--since origin/main`
+    on a branch sees only the branch's own changes, and include uncommitted edits.
+    Renames are detected, so a moved file is reported as one 'R' change.
+    """
+    base = run_git(project_root, 'merge-base', ref, 'HEAD').decode('utf-8').strip()
+    output = run_git(project_root, 'diff', '--name-status', '-z', '-M', '--relative', base, '--')
+    changes = parse_name_status(output, project_root)
+    if include_untracked:
+        output = run_git(project_root, 'ls-files', '--others', '--exclude-standard', '-z')
+        changes.extend(FileChange('A', os.path.normpath(os.path.join(project_root, path)), None)
+                       for path in output.decode('utf-8', 'surrogateescape').split('\0') if path)
+    return changes
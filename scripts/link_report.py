@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the documentation link check report writers
+#
+# COMMON CUSTOMIZATIONS:
+# - REPORT_PATHS: Output path per report format, relative to the project root
+#   Related to: check_documentation_links.py:main
+# - SPOOL_MAX_SIZE: Bytes of report rows kept in memory before spilling to a temporary file (default: 1048576)
+# ===================================================
+
+import json
+import os
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import ExitStack
+from xml.sax.saxutils import quoteattr, escape
+
+# Configuration
+REPORT_PATHS = {
+    'markdown': 'docs/documentation-link-check-report.md',
+    'json': 'docs/documentation-link-check-report.json',
+    'sarif': 'docs/documentation-link-check-report.sarif',
+    'junit': 'docs/documentation-link-check-report.xml',
+}
+SPOOL_MAX_SIZE = 1024 * 1024
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+SARIF_RULE_ID = 'broken-link'
+
+class ReportWriter(ABC):
+    """
+    Base class for streaming report writers.
+
+    Links are passed to add() as they are validated; the report is assembled in a
+    temporary file next to the destination and moved into place by close(), so a
+    failed run never leaves a half-written report behind.
+    """
+    def __init__(self, path, project_root):
+        self.path = path
+        self.project_root = project_root
+        self.total = 0
+        self.broken = 0
+        self._relative_paths = {}
+        self.closed = False
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._out = open(f"{path}.tmp", 'w', encoding='utf-8')
+
+    def relative_path(self, file_path):
+        """Return a file path relative to the project root, computed once per file."""
+        if file_path not in self._relative_paths:
+            self._relative_paths[file_path] = os.path.relpath(file_path, self.project_root)
+        return self._relative_paths[file_path]
+
+    def add(self, link):
+        """Record one validated link."""
+        self.total += 1
+        if link.is_valid:
+            self.write_valid(link)
+        else:
+            self.broken += 1
+            self.write_broken(link)
+
+    def write_valid(self, link):
+        """Emit a valid link; most formats only report broken links."""
+
+    @abstractmethod
+    def write_broken(self, link):
+        """Emit a broken link."""
+
+    def finish(self):
+        """Write whatever has to follow the streamed rows."""
+
+    def close(self):
+        """Finish the report and move it into place."""
+        self.finish()
+        self._out.close()
+        os.replace(f"{self.path}.tmp", self.path)
+        self.closed = True
+
+    def abort(self):
+        """Discard a partially written report; a report already moved into place is kept."""
+        if self.closed:
+            return
+        self._out.close()
+        os.remove(f"{self.path}.tmp")
+
+class SpooledReportWriter(ReportWriter):
+    """
+    Writer for formats whose header needs the final counts: rows are spooled and
+    copied in after the header once every link has been seen.
+    """
+    def __init__(self, path, project_root):
+        super().__init__(path, project_root)
+        self._rows = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+
+    def write_header(self):
+        """Write the part of the report that precedes the rows."""
+
+    def write_footer(self):
+        """Write the part of the report that follows the rows."""
+
+    def finish(self):
+        self.write_header()
+        self._rows.seek(0)
+        shutil.copyfileobj(self._rows, self._out)
+        self._rows.close()
+        self.write_footer()
+
+    def abort(self):
+        self._rows.close()
+        super().abort()
+
+class MarkdownReportWriter(SpooledReportWriter):
+    """
+    Writes the human-readable markdown report.
+    """
+    def write_broken(self, link):
+        self._rows.write(format_markdown_row(link, self.relative_path(link.file_path)))
+
+    def write_header(self):
+        self._out.write(format_markdown_header(self.total, self.broken))
+
+    def write_footer(self):
+        if not self.broken:
+            self._out.write(MARKDOWN_NO_BROKEN_LINKS)
+
+class JsonReportWriter(ReportWriter):
+    """
+    Writes {"broken_links": [...], "summary": {...}} with one broken link per line.
+    """
+    def __init__(self, path, project_root):
+        super().__init__(path, project_root)
+        self._out.write('{"broken_links": [')
+
+    def write_broken(self, link):
+        record = {
+            'file': self.relative_path(link.file_path),
+            'line': link.line_number,
+            'text': link.text,
+            'url': link.url,
+            'error': link.error_message,
+        }
+        self._out.write(('\n  ' if self.broken == 1 else ',\n  ') + json.dumps(record))
+
+    def finish(self):
+        summary = {'total': self.total, 'valid': self.total - self.broken, 'broken': self.broken}
+        self._out.write(f"\n], \"summary\": {json.dumps(summary)}}}\n")
+
+class SarifReportWriter(ReportWriter):
+    """
+    Writes a SARIF 2.1.0 log with one result per broken link, for code-scanning tools.
+    """
+    def __init__(self, path, project_root):
+        super().__init__(path, project_root)
+        driver = {
+            'name': 'check_documentation_links',
+            'rules': [{
+                'id': SARIF_RULE_ID,
+                'shortDescription': {'text': 'Broken documentation link'},
+            }],
+        }
+        self._out.write(f'{{"$schema": {json.dumps(SARIF_SCHEMA)}, "version": "2.1.0", '
+                        f'"runs": [{{"tool": {{"driver": {json.dumps(driver)}}}, "results": [')
+
+    def write_broken(self, link):
+        result = {
+            'ruleId': SARIF_RULE_ID,
+            'level': 'error',
+            'message': {'text': f"{link.url}: {link.error_message}"},
+            'locations': [{
+                'physicalLocation': {
+                    'artifactLocation': {
+                        'uri': self.relative_path(link.file_path).replace(os.sep, '/'),
+                        'uriBaseId': '%SRCROOT%',
+                    },
+                    'region': {'startLine': link.line_number},
+                },
+            }],
+        }
+        self._out.write(('\n' if self.broken == 1 else ',\n') + json.dumps(result))
+
+    def finish(self):
+        self._out.write('\n]}]}\n')
+
+class JUnitReportWriter(SpooledReportWriter):
+    """
+    Writes a JUnit XML report with one test case per link and a failure per broken link.
+    """
+    def _testcase(self, link):
+        classname = quoteattr(self.relative_path(link.file_path))
+        name = quoteattr(f"line {link.line_number}: {link.url}")
+        return f'    <testcase classname={classname} name={name}'
+
+    def write_valid(self, link):
+        self._rows.write(f"{self._testcase(link)}/>\n")
+
+    def write_broken(self, link):
+        message = quoteattr(link.error_message or 'Broken link')
+        self._rows.write(f"{self._testcase(link)}>\n"
+                         f"      <failure message={message}>{escape(link.text)}</failure>\n"
+                         f"    </testcase>\n")
+
+    def write_header(self):
+        self._out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        self._out.write(f'<testsuites tests="{self.total}" failures="{self.broken}">\n')
+        self._out.write(f'  <testsuite name="documentation-links" tests="{self.total}" failures="{self.broken}">\n')
+
+    def write_footer(self):
+        self._out.write('  </testsuite>\n</testsuites>\n')
+
+REPORT_WRITERS = {
+    'markdown': MarkdownReportWriter,
+    'json': JsonReportWriter,
+    'sarif': SarifReportWriter,
+    'junit': JUnitReportWriter,
+}
+
+MARKDOWN_NO_BROKEN_LINKS = "## No Broken Links Found\n\nAll links in the documentation are valid.\n"
+
+def format_markdown_header(total, broken):
+    """
+    Format the title, summary and (when needed) the broken-link table header.
+    """
+    parts = [
+        "# Documentation Link Check Report\n\n",
+        "## Summary\n\n",
+        f"- Total links: {total}\n",
+        f"- Valid links: {total - broken}\n",
+        f"- Broken links: {broken}\n\n",
+    ]
+    if broken:
+        parts.append("## Broken Links\n\n")
+        parts.append("| File | Line | Link Text | URL | Error |\n")
+        parts.append("|------|------|-----------|-----|-------|\n")
+    return ''.join(parts)
+
+def format_markdown_row(link, relative_path):
+    """
+    Format one broken link as a markdown table row.
+    """
+    return f"| {relative_path} | {link.line_number} | {link.text} | {link.url} | {link.error_message} |\n"
+
+def open_report_writers(formats, project_root, report_paths=None):
+    """
+    Open one writer per requested format, at its configured path under the project root.
+
+    If a writer cannot be opened, the ones opened before it are aborted so no
+    temporary report files are left behind.
+    """
+    report_paths = report_paths or REPORT_PATHS
+    writers = []
+    with ExitStack() as opened:
+        for fmt in formats:
+            writer = REPORT_WRITERS[fmt](os.path.join(project_root, report_paths[fmt]), project_root)
+            opened.callback(writer.abort)
+            writers.append(writer)
+        opened.pop_all()
+    return writers
+
+def close_report_writers(writers):
+    """
+    Close every writer, moving its report into place.
+
+    If closing one writer fails, it and the writers not closed yet are aborted
+    before the error propagates, so no temporary report files are left behind.
+    """
+    with ExitStack() as pending:
+        for writer in writers:
+            pending.callback(writer.abort)
+        for writer in writers:
+            writer.close()
+        pending.pop_all()
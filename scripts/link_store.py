@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the SQLite link store of the documentation link checker
+#
+# COMMON CUSTOMIZATIONS:
+# - LINK_STORE_PATH: Path to the link store database, relative to the project root (default: '.cache/documentation-links.sqlite')
+#   Related to: check_documentation_links.py:parse_args (--link-store, query)
+# - QUERY_LIMIT: Rows printed by a query unless --limit is given (default: 50)
+# ===================================================
+
+import os
+import sqlite3
+from collections import namedtuple
+
+# Configuration
+LINK_STORE_PATH = '.cache/documentation-links.sqlite'
+QUERY_LIMIT = 50
+
+# Bump when the schema changes; a store with another version is rebuilt
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS targets (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    external INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    line INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    url TEXT NOT NULL,
+    target_id INTEGER NOT NULL REFERENCES targets(id),
+    fragment TEXT,
+    is_valid INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS links_by_file ON links(file_id);
+CREATE INDEX IF NOT EXISTS links_by_target ON links(target_id);
+CREATE INDEX IF NOT EXISTS broken_links_by_file ON links(file_id) WHERE is_valid = 0;
+"""
+
+# One link row as returned by the queries; file and target are relative to the project root
+LinkRow = namedtuple('LinkRow', ['file', 'line', 'text', 'url', 'target', 'is_valid', 'error'])
+
+LINK_ROW_QUERY = """
+SELECT files.path, links.line, links.text, links.url, targets.path, links.is_valid, links.error
+FROM links JOIN files ON files.id = links.file_id JOIN targets ON targets.id = links.target_id
+"""
+
+class LinkStore:
+    """
+    Persistent link graph in a local SQLite database: one row per documentation file,
+    per link and per distinct target, indexed for inbound, outbound and broken-link queries.
+
+    Files are updated one at a time. A file whose mtime and size are unchanged keeps
+    its link rows and only has the verdicts that changed rewritten.
+    """
+    def __init__(self, store_path, project_root):
+        self.store_path = store_path
+        self.project_root = project_root
+        os.makedirs(os.path.dirname(store_path) or '.', exist_ok=True)
+        self.connection = sqlite3.connect(store_path)
+        self.connection.execute('PRAGMA foreign_keys = ON')
+        self.connection.execute('PRAGMA journal_mode = WAL')
+        if self.connection.execute('PRAGMA user_version').fetchone()[0] != SCHEMA_VERSION:
+            self.connection.executescript('DROP TABLE IF EXISTS links; DROP TABLE IF EXISTS targets; '
+                                          'DROP TABLE IF EXISTS files;')
+            self.connection.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+        self.connection.executescript(SCHEMA)
+        self._target_ids = dict(self.connection.execute('SELECT path, id FROM targets'))
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
+
+    def _key(self, file_path):
+        return os.path.relpath(file_path, self.project_root)
+
+    def _target_id(self, path, external):
+        """Return the id of a target row, creating it on first use."""
+        target_id = self._target_ids.get(path)
+        if target_id is None:
+            target_id = self.connection.execute('INSERT INTO targets (path, external) VALUES (?, ?)',
+                                                (path, int(external))).lastrowid
+            self._target_ids[path] = target_id
+        return target_id
+
+    def update_files(self, files, links, resolve_target):
+        """
+        Record the links of scanned files.
+
+        files maps file paths to their stat results, links is the validated links of
+        those files, and resolve_target(link) returns (target path, fragment, external).
+        """
+        links_per_file = {}
+        for link in links:
+            links_per_file.setdefault(link.file_path, []).append(link)
+        stored_files = {path: (file_id, mtime_ns, size) for file_id, path, mtime_ns, size
+                        in self.connection.execute('SELECT id, path, mtime_ns, size FROM files')}
+
+        with self.connection:
+            for file_path, st in files.items():
+                file_links = links_per_file.get(file_path, [])
+                stored = stored_files.get(self._key(file_path))
+                if stored and stored[1:] == (st.st_mtime_ns, st.st_size):
+                    if self._update_verdicts(stored[0], file_links):
+                        continue
+                if stored:
+                    file_id = stored[0]
+                    self.connection.execute('DELETE FROM links WHERE file_id = ?', (file_id,))
+                    self.connection.execute('UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?',
+                                            (st.st_mtime_ns, st.st_size, file_id))
+                else:
+                    file_id = self.connection.execute('INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)',
+                                                      (self._key(file_path), st.st_mtime_ns, st.st_size)).lastrowid
+                rows = []
+                for link in file_links:
+                    target, fragment, external = resolve_target(link)
+                    rows.append((file_id, link.line_number, link.text, link.url,
+                                 self._target_id(target if external else self._key(target), external), fragment,
+                                 None if link.is_valid is None else int(link.is_valid), link.error_message))
+                self.connection.executemany('INSERT INTO links (file_id, line, text, url, target_id, fragment, '
+                                            'is_valid, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def _update_verdicts(self, file_id, links):
+        """
+        Rewrite the verdicts of an unchanged file's links; return False if its stored
+        links no longer match and the file has to be re-recorded.
+        """
+        stored = self.connection.execute('SELECT id, line, url, is_valid, error FROM links '
+                                         'WHERE file_id = ? ORDER BY id', (file_id,)).fetchall()
+        if [(line, url) for _, line, url, _, _ in stored] != [(link.line_number, link.url) for link in links]:
+            return False
+        changed = []
+        for (link_id, _, _, is_valid, error), link in zip(stored, links):
+            verdict = None if link.is_valid is None else int(link.is_valid)
+            if (is_valid, error) != (verdict, link.error_message):
+                changed.append((verdict, link.error_message, link_id))
+        self.connection.executemany('UPDATE links SET is_valid = ?, error = ? WHERE id = ?', changed)
+        return True
+
+    def remove_files(self, file_paths):
+        """Drop deleted files and their links."""
+        with self.connection:
+            self.connection.executemany('DELETE FROM files WHERE path = ?',
+                                        [(self._key(file_path),) for file_path in file_paths])
+
+    def prune(self, file_paths):
+        """Drop every file not in file_paths, then targets no link points at any more."""
+        keep = {self._key(file_path) for file_path in file_paths}
+        stale = [(path,) for path, in self.connection.execute('SELECT path FROM files') if path not in keep]
+        with self.connection:
+            self.connection.executemany('DELETE FROM files WHERE path = ?', stale)
+            self.connection.execute('DELETE FROM targets WHERE id NOT IN (SELECT DISTINCT target_id FROM links)')
+        self._target_ids = dict(self.connection.execute('SELECT path, id FROM targets'))
+
+    def _path_condition(self, column, path):
+        """Return an SQL condition and its parameters matching a path or anything inside it."""
+        key = self._key(path)
+        if key == os.curdir:
+            return '1', ()
+        prefix = key.rstrip(os.sep) + os.sep
+        return f"({column} = ? OR substr({column}, 1, ?) = ?)", (key, len(prefix), prefix)
+
+    def inbound(self, target_path, limit=None):
+        """Return the links pointing at a file or directory, or at anything inside a directory."""
+        condition, parameters = self._path_condition('targets.path', target_path)
+        return self._rows(f"{LINK_ROW_QUERY} WHERE {condition} ORDER BY files.path, links.line", parameters, limit)
+
+    def outbound(self, file_path, limit=None):
+        """Return the links in a file."""
+        return self._rows(f"{LINK_ROW_QUERY} WHERE files.path = ? ORDER BY links.line, links.id",
+                          (self._key(file_path),), limit)
+
+    def broken(self, path=None, limit=None):
+        """Return broken links, optionally only those in one file or directory."""
+        condition, parameters = self._path_condition('files.path', path) if path else ('1', ())
+        return self._rows(f"{LINK_ROW_QUERY} WHERE links.is_valid = 0 AND {condition} "
+                          "ORDER BY files.path, links.line", parameters, limit)
+
+    def broken_by_file(self, limit=None):
+        """Return (file, broken link count) for files with broken links, most broken first."""
+        query = ("SELECT files.path, COUNT(*) AS broken FROM links JOIN files ON files.id = links.file_id "
+                 "WHERE links.is_valid = 0 GROUP BY files.id ORDER BY broken DESC, files.path")
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return self.connection.execute(query).fetchall()
+
+    def _rows(self, query, parameters, limit):
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [LinkRow(*row) for row in self.connection.execute(query, parameters)]
+
+def format_link_row(row, show_file=True):
+    """
+    Format a link row as one line of query output.
+    """
+    location = f"{row.file}:{row.line}" if show_file else f"line {row.line}"
+    if row.is_valid is None:
+        status = 'unchecked'
+    elif row.is_valid:
+        status = 'ok'
+    else:
+        status = f"broken: {row.error}"
+    return f"{location}: [{row.text}]({row.url}) -> {row.target} ({status})"
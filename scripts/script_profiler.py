@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains settings for the --profile instrumentation shared by the documentation scripts
+#
+# COMMON CUSTOMIZATIONS:
+# - PROFILE_TRACE_DIRECTORY: Directory of the Chrome trace files, relative to the project root (default: '.cache/profile')
+# - PROFILE_SLOWEST_FILES: Slowest files listed in the summary (default: 10)
+# - PROFILE_TRACE_MEMORY: Record peak memory with tracemalloc; it slows the run down, and --no-profile-memory turns it off (default: True)
+#   Related to: benchmark_documentation_scripts.py:run_phases
+# ===================================================
+
+import contextlib
+import heapq
+import json
+import os
+import time
+import tracemalloc
+
+# Configuration
+PROFILE_TRACE_DIRECTORY = '.cache/profile'
+PROFILE_SLOWEST_FILES = 10
+PROFILE_TRACE_MEMORY = True
+
+# Profiler of the script running in this process, if it was started with --profile
+_ACTIVE_PROFILER = None
+
+def format_bytes(size):
+    """
+    Format a byte count for the summary table.
+    """
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+class NullProfiler:
+    """
+    Profiler used when --profile is off: every hook does nothing.
+    """
+    enabled = False
+
+    def phase(self, name):
+        return contextlib.nullcontext()
+
+    def file(self, file_path):
+        return contextlib.nullcontext()
+
+    def count(self, name, amount=1):
+        pass
+
+    def record_read(self, f):
+        pass
+
+class ScriptProfiler:
+    """
+    Records per-phase wall time and call counts, named counters, bytes read, the
+    slowest files and peak memory of one script run.
+
+    Phases may nest; a phase's self time leaves out the phases nested in it, so the
+    shares in the summary add up to at most the whole run. Each phase and each
+    profiled file becomes a complete event in the Chrome trace, and traced memory
+    is sampled as a counter at every phase boundary. Work done in --jobs worker
+    processes is only visible as the time of the phase that waits for it.
+    """
+    enabled = True
+
+    def __init__(self, script, slowest_files=PROFILE_SLOWEST_FILES, trace_memory=PROFILE_TRACE_MEMORY):
+        self.script = script
+        self.slowest_files = slowest_files
+        self.trace_memory = trace_memory
+        # Per phase name: [calls, seconds, peak traced bytes, self seconds]
+        self.phases = {}
+        self.counters = {}
+        self.events = []
+        self.peak_memory = 0
+        self._slowest = []
+        self._open_phases = []
+        # Seconds spent in the phases nested in each open phase
+        self._nested_seconds = []
+        self._started_tracemalloc = False
+        self._start = None
+        self.elapsed = 0.0
+
+    def start(self):
+        """Start the run clock and, when enabled, tracemalloc."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._start = time.perf_counter()
+
+    def stop(self):
+        """Stop the run clock and tracemalloc."""
+        self.elapsed = time.perf_counter() - self._start
+        self._sample_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def _timestamp(self, moment):
+        """Return microseconds since the start of the run, as Chrome traces expect."""
+        return round((moment - self._start) * 1e6, 3)
+
+    def _sample_memory(self):
+        """Fold the traced peak into every open phase and the run, then restart peak tracking."""
+        if not tracemalloc.is_tracing():
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak_memory = max(self.peak_memory, peak)
+        for entry in self._open_phases:
+            entry[2] = max(entry[2], peak)
+        tracemalloc.reset_peak()
+        self.events.append({'name': 'traced memory', 'ph': 'C', 'pid': os.getpid(), 'tid': 0,
+                            'ts': self._timestamp(time.perf_counter()), 'args': {'bytes': current}})
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Time the enclosed block as one call of a phase."""
+        self._sample_memory()
+        entry = self.phases.setdefault(name, [0, 0.0, 0, 0.0])
+        self._open_phases.append(entry)
+        self._nested_seconds.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._sample_memory()
+            self._open_phases.pop()
+            nested = self._nested_seconds.pop()
+            if self._nested_seconds:
+                self._nested_seconds[-1] += end - start
+            entry[0] += 1
+            entry[1] += end - start
+            entry[3] += end - start - nested
+            self.events.append({'name': name, 'cat': 'phase', 'ph': 'X', 'pid': os.getpid(), 'tid': 0,
+                                'ts': self._timestamp(start), 'dur': round((end - start) * 1e6, 3)})
+
+    @contextlib.contextmanager
+    def file(self, file_path):
+        """Time the enclosed processing of one file."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.count('files')
+            self.events.append({'name': os.path.basename(file_path), 'cat': 'file', 'ph': 'X',
+                                'pid': os.getpid(), 'tid': 0, 'ts': self._timestamp(start),
+                                'dur': round(seconds * 1e6, 3), 'args': {'path': file_path}})
+            if len(self._slowest) < self.slowest_files:
+                heapq.heappush(self._slowest, (seconds, file_path))
+            elif self._slowest and seconds > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, (seconds, file_path))
+
+    def count(self, name, amount=1):
+        """Add to a named counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_read(self, f):
+        """Count a file object that was read in full."""
+        self.count('files_read')
+        self.count('bytes_read', os.fstat(f.fileno()).st_size)
+
+    def slowest(self):
+        """Return the slowest files as (seconds, path), slowest first."""
+        return sorted(self._slowest, reverse=True)
+
+    def to_chrome_trace(self):
+        """Return the run as a Chrome trace-event document (chrome://tracing, Perfetto)."""
+        metadata = {'name': 'process_name', 'ph': 'M', 'pid': os.getpid(), 'tid': 0,
+                    'args': {'name': self.script}}
+        return {
+            'traceEvents': [metadata] + self.events,
+            'displayTimeUnit': 'ms',
+            'otherData': {
+                'script': self.script,
+                'elapsed_seconds': round(self.elapsed, 6),
+                'peak_memory_bytes': self.peak_memory if self.trace_memory else None,
+                'counters': self.counters,
+                'phases': {name: {'calls': calls, 'seconds': round(seconds, 6), 'self_seconds': round(self_seconds, 6),
+                                  'peak_memory_bytes': peak}
+                           for name, (calls, seconds, peak, self_seconds) in self.phases.items()},
+                'slowest_files': [{'path': path, 'seconds': round(seconds, 6)} for seconds, path in self.slowest()],
+            },
+        }
+
+    def write_chrome_trace(self, path):
+        """Write the Chrome trace atomically."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        os.replace(tmp_path, path)
+
+    def format_summary(self, project_root=None):
+        """
+        Format the phases, counters and slowest files as a plain-text table.
+
+        Seconds include nested phases; Self and Share (of the run) leave them out.
+        """
+        lines = [f"Profile of {self.script}",
+                 f"{'Phase':24} {'Calls':>6} {'Seconds':>9} {'Self':>9} {'Share':>7} {'Peak memory':>12}"]
+        for name, (calls, seconds, peak, self_seconds) in self.phases.items():
+            share = self_seconds / self.elapsed if self.elapsed else 0
+            memory = format_bytes(peak) if self.trace_memory else '-'
+            lines.append(f"{name:24} {calls:>6} {seconds:>9.3f} {self_seconds:>9.3f} {share:>7.1%} {memory:>12}")
+        memory = format_bytes(self.peak_memory) if self.trace_memory else '-'
+        lines.append(f"{'Total':24} {'':>6} {self.elapsed:>9.3f} {'':>9} {'':>7} {memory:>12}")
+
+        if self.counters:
+            lines.append("")
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"{name:24} {format_bytes(value) if name.startswith('bytes') else value:>16}")
+
+        slowest = self.slowest()
+        if slowest:
+            lines.append("")
+            lines.append(f"Slowest {len(slowest)} files:")
+            for seconds, path in slowest:
+                shown = os.path.relpath(path, project_root) if project_root else path
+                lines.append(f"  {seconds * 1000:>8.2f} ms  {shown}")
+        return '\n'.join(lines)
+
+NULL_PROFILER = NullProfiler()
+
+def get_profiler():
+    """
+    Return the profiler of the running script, or a no-op profiler when not profiling.
+    """
+    return _ACTIVE_PROFILER or NULL_PROFILER
+
+def add_profile_arguments(parser):
+    """
+    Add the --profile, --profile-output and --no-profile-memory options to a script's argument parser.
+    """
+    parser.add_argument('--profile', action='store_true',
+                        help="Print per-phase timings, counters, slowest files and peak memory, and write a Chrome trace")
+    parser.add_argument('--profile-output', default=None,
+                        help=f"Chrome trace file written with --profile (default: {PROFILE_TRACE_DIRECTORY}/<script>.trace.json)")
+    parser.add_argument('--no-profile-memory', action='store_true',
+                        help="With --profile, skip the peak memory measurement, which slows every phase down")
+
+@contextlib.contextmanager
+def profile_run(script, args, project_root):
+    """
+    Profile the enclosed run when args.profile is set, then print the summary and write the trace.
+
+    A run nested in a profiled run (such as the link check started by the fixer)
+    reports into the outer profile instead of starting its own.
+    """
+    global _ACTIVE_PROFILER
+    if not getattr(args, 'profile', False) or _ACTIVE_PROFILER is not None:
+        yield
+        return
+
+    profiler = ScriptProfiler(script, trace_memory=PROFILE_TRACE_MEMORY and not getattr(args, 'no_profile_memory', False))
+    _ACTIVE_PROFILER = profiler
+    profiler.start()
+    try:
+        yield
+    finally:
+        profiler.stop()
+        _ACTIVE_PROFILER = None
+        print()
+        print(profiler.format_summary(project_root))
+        trace_path = args.profile_output or os.path.join(project_root, PROFILE_TRACE_DIRECTORY, f"{script}.trace.json")
+        try:
+            profiler.write_chrome_trace(trace_path)
+            print(f"Trace written: {trace_path}")
+        except Exception as e:
+            print(f"Error writing profile trace: {e}")
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the Express route extraction
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_SERVER_FILES: Server source files of the test tree (default: defined in this file)
+# ===================================================
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import api_routes
+import file_tree_index
+
+TEST_SERVER_FILES = {
+    'server/server.js': """import express from 'express';
+import routes from './routes/index.js';
+const app = express();
+app.get('/health', (req, res) => res.json({}));
+app.use('/api/v1', limiter, routes);
+""",
+    'server/routes/index.js': """import express from 'express';
+import adRoutes from './ad.routes.js';
+import chatRoutes from '../components/chat';
+const router = express.Router();
+const safelyRegisterRoutes = (path, routeModule) => router.use(path, routeModule);
+safelyRegisterRoutes('/ads', adRoutes);
+router.use('/chat', chatRoutes);
+export default router;
+""",
+    'server/routes/ad.routes.ts': """import { Router } from 'express';
+import index from './index.js';
+const router: Router = Router();
+// router.get('/disabled', handler);
+/* router.post('/also-disabled', handler); */
+router.get('/', list);
+router
+  .get('/:id', show);
+router.delete('/:id', remove);
+axios.get('/not-a-route');
+router.use('/again', index);
+export default router;
+""",
+    'server/components/chat/index.js': """const express = require('express');
+const encryption = require('./encryption.routes');
+const router = express.Router();
+router.post('/messages', send);
+router.use('/encryption', encryption);
+module.exports = router;
+""",
+    'server/components/chat/encryption.routes.js': """const router = require('express').Router();
+const keys = express.Router();
+keys.get('/keys', getKeys);
+module.exports = keys;
+""",
+    'server/routes/unused.routes.js': """const router = express.Router();
+router.get('/unused', handler);
+""",
+    'server/routes/unused.routes.d.ts': "router.get('/typings', handler);\n",
+}
+
+class TestApiRoutes(unittest.TestCase):
+    """Test cases for the api_routes.py module."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.cache_path = os.path.join(self.test_dir, '.cache', 'api-routes.json')
+        for name, content in TEST_SERVER_FILES.items():
+            self.write_file(name, content)
+        file_tree_index.reset_tree_indexes()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def write_file(self, name, content):
+        """Write a file relative to the test directory."""
+        path = os.path.join(self.test_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def scan_with_cache(self):
+        """Extract the test tree with the route cache and save it."""
+        file_tree_index.reset_tree_indexes()
+        cache = api_routes.RouteExtractionCache.load(self.cache_path, self.test_dir)
+        results = api_routes.scan_route_sources(self.test_dir, cache)
+        cache.save()
+        return results
+
+    def test_extract_routes_from_content(self):
+        """Test that only uncommented routes of routers created in the file are extracted."""
+        result = api_routes.extract_routes_from_content(TEST_SERVER_FILES['server/routes/ad.routes.ts'])
+        self.assertEqual(result['routes'], [['GET', '/'], ['GET', '/:id'], ['DELETE', '/:id']])
+        self.assertEqual(result['mounts'], [['/again', './index.js']])
+
+        result = api_routes.extract_routes_from_content(TEST_SERVER_FILES['server/server.js'])
+        self.assertEqual(result, {'routes': [['GET', '/health']], 'mounts': [['/api/v1', './routes/index.js']]})
+
+    def test_resolve_endpoints(self):
+        """Test that routes get the prefixes of the mounts leading to them from the entry file."""
+        results = api_routes.scan_route_sources(self.test_dir)
+        self.assertNotIn(os.path.join(self.test_dir, 'server/routes/unused.routes.d.ts'), results)
+
+        endpoints, unmounted = api_routes.resolve_endpoints(results, self.test_dir)
+        self.assertEqual([(e.method, e.path, e.group) for e in endpoints], [
+            ('GET', '/health', '/'),
+            ('GET', '/api/v1/ads', '/api/v1/ads'),
+            ('GET', '/api/v1/ads/:id', '/api/v1/ads'),
+            ('DELETE', '/api/v1/ads/:id', '/api/v1/ads'),
+            ('POST', '/api/v1/chat/messages', '/api/v1/chat'),
+            ('GET', '/api/v1/chat/encryption/keys', '/api/v1/chat/encryption'),
+        ])
+        self.assertEqual(endpoints[1].file, os.path.join('server', 'routes', 'ad.routes.ts'))
+        self.assertEqual(unmounted, 1)
+
+        diagram = api_routes.build_endpoints_diagram(endpoints)
+        self.assertIn('    API --> G2["/api/v1/ads"]\n', diagram)
+        self.assertIn('    G2 --> G2E3["DELETE /api/v1/ads/:id"]\n', diagram)
+
+    def test_cache_reuses_unchanged_files(self):
+        """Test that a second scan reads no files and a changed file is extracted again."""
+        first = self.scan_with_cache()
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        with patch('api_routes.extract_routes_from_content') as mock_extract:
+            self.assertEqual(self.scan_with_cache(), first)
+            mock_extract.assert_not_called()
+
+        self.write_file('server/routes/ad.routes.ts', "const router = Router();\nrouter.patch('/:id', update);\n")
+        results = self.scan_with_cache()
+        endpoints, _ = api_routes.resolve_endpoints(results, self.test_dir)
+        self.assertIn(('PATCH', '/api/v1/ads/:id'), [(e.method, e.path) for e in endpoints])
+        self.assertNotIn(('GET', '/api/v1/ads'), [(e.method, e.path) for e in endpoints])
+
+if __name__ == '__main__':
+    unittest.main()
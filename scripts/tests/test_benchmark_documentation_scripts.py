@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the documentation scripts benchmark
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_SIZES: Size of the synthetic trees used in the tests (default: defined in this file)
+# ===================================================
+
+import io
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import benchmark_documentation_scripts
+import check_documentation_links
+import file_tree_index
+import update_config_index
+
+TEST_SIZES = {'docs': 6, 'links_per_doc': 8, 'sources': 16, 'header_ratio': 0.5, 'settings_per_header': 3}
+
+class TestBenchmarkDocumentationScripts(unittest.TestCase):
+    """Test cases for the benchmark_documentation_scripts.py script."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        file_tree_index.reset_tree_indexes()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def test_synthetic_tree_is_seen_by_the_scripts(self):
+        """Test that the synthetic tree has links of every kind and parseable headers."""
+        doc_count, source_count = benchmark_documentation_scripts.generate_synthetic_tree(self.test_dir, TEST_SIZES)
+        self.assertEqual((doc_count, source_count), (7, 16))
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'scripts', 'check_documentation_links.py')))
+
+        links = check_documentation_links.scan_directory(os.path.join(self.test_dir, 'docs'), self.test_dir)
+        valid_links, broken_links = check_documentation_links.validate_links(links, self.test_dir)
+        self.assertEqual(len(links), 6 * 8)
+        self.assertTrue(valid_links and broken_links)
+
+        settings = update_config_index.scan_directory(os.path.join(self.test_dir, 'server'), self.test_dir)
+        self.assertGreater(len(settings), 0)
+        self.assertEqual(len(settings) % 3, 0)
+
+    def test_benchmark_results(self):
+        """Test that a benchmark run reports items, end-to-end time, throughput and phases."""
+        results = benchmark_documentation_scripts.benchmark(['update_config_index'], TEST_SIZES, repeat=1)
+        result = results['scripts']['update_config_index']
+        self.assertEqual(results['sizes'], TEST_SIZES)
+        self.assertEqual(result['items'], 16)
+        self.assertGreater(result['throughput'], 0)
+        self.assertEqual(list(result['phases']), ['scan', 'walk', 'generate', 'write index'])
+
+    def test_failing_script_fails_the_benchmark(self):
+        """Test that a script exiting with an unexpected code fails the run and shows its stderr."""
+        benchmark_documentation_scripts.generate_synthetic_tree(self.test_dir, TEST_SIZES)
+        self.assertGreater(benchmark_documentation_scripts.run_end_to_end('check_documentation_links', self.test_dir), 0)
+
+        with open(os.path.join(self.test_dir, 'scripts', 'update_config_index.py'), 'w', encoding='utf-8') as f:
+            f.write("import sys\nsys.exit('cannot import settings')\n")
+        with self.assertRaises(RuntimeError) as raised:
+            benchmark_documentation_scripts.run_end_to_end('update_config_index', self.test_dir)
+        self.assertIn('exited with code 1', str(raised.exception))
+        self.assertIn('cannot import settings', str(raised.exception))
+
+    def test_compare_fails_on_regression(self):
+        """Test that --compare fails only when throughput drops past the threshold."""
+        current = {'scripts': {'a': {'throughput': 85.0}, 'b': {'throughput': 95.0}}}
+        baseline = {'scripts': {'a': {'throughput': 100.0}, 'b': {'throughput': 100.0}}}
+        rows = benchmark_documentation_scripts.compare_results(baseline, current, threshold=0.10)
+        self.assertEqual([(row[0], row[4]) for row in rows], [('a', True), ('b', False)])
+
+        fast_baseline = os.path.join(self.test_dir, 'baseline.json')
+        with open(fast_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'scripts': {'generate_documentation_diagrams': {'throughput': 1e9}}}, f)
+        output = os.path.join(self.test_dir, 'results.json')
+        argv = ['--script', 'generate_documentation_diagrams', '--repeat', '1', '--docs', '1', '--sources', '1',
+                '--output', output, '--compare', fast_baseline]
+        with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            self.assertEqual(benchmark_documentation_scripts.main(argv), 1)
+        self.assertIn('REGRESSION', stdout.getvalue())
+        with open(output, 'r', encoding='utf-8') as f:
+            self.assertIn('generate_documentation_diagrams', json.load(f)['scripts'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the documentation link checker
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_CONTENT: Test content for documentation files (default: defined in this file)
+# ===================================================
+
+import contextlib
+import functools
+import io
+import multiprocessing
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import check_documentation_links
+import file_tree_index
+import git_changes
+
+TEST_CONTENT = """# Test Documentation
+
+- [Guide](guide.md)
+- [Missing](missing.md)
+- [External](https://example.com)
+- [Anchor](#section)
+
+## Section
+"""
+
+class TestCheckDocumentationLinks(unittest.TestCase):
+    """Test cases for the check_documentation_links.py script."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.readme_path = os.path.join(self.test_dir, 'README.md')
+        self.write_file('README.md', TEST_CONTENT)
+        self.write_file('guide.md', '# Guide\n')
+        self.cache_path = os.path.join(self.test_dir, '.cache', 'links.json')
+        file_tree_index.reset_tree_indexes()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def write_file(self, name, content):
+        """Write a file relative to the test directory."""
+        path = os.path.join(self.test_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def run_incremental(self):
+        """Scan and validate the test directory with the incremental cache."""
+        file_tree_index.reset_tree_indexes()
+        cache = check_documentation_links.LinkCheckCache.load(self.cache_path, self.test_dir)
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir, cache)
+        valid_links, broken_links = check_documentation_links.validate_links(links, self.test_dir)
+        cache.store_links(links)
+        cache.save()
+        return valid_links, broken_links
+
+    def test_extract_links_from_file(self):
+        """Test that markdown links are extracted with their line numbers."""
+        links = check_documentation_links.extract_links_from_file(self.readme_path)
+        self.assertEqual([(l.text, l.url, l.line_number) for l in links], [
+            ('Guide', 'guide.md', 3),
+            ('Missing', 'missing.md', 4),
+            ('External', 'https://example.com', 5),
+            ('Anchor', '#section', 6),
+        ])
+
+    def test_extract_links_spanning_lines(self):
+        """Test that wrapped links are found in one pass and reported at their first line."""
+        content = 'Intro\n\nSee [the setup\n  guide](docs/setup.md) and\n<a\n  href="other.md">other</a>.\n[not\n\na link](x.md)\n'
+        links = check_documentation_links.extract_links_from_content(content, 'test.md')
+        self.assertEqual([(l.text, l.url, l.line_number) for l in links], [
+            ('the setup guide', 'docs/setup.md', 3),
+            ('', 'other.md', 5),
+        ])
+
+    def test_find_link_regions(self):
+        """Test that only the paragraphs containing a link marker are selected."""
+        data = b'Intro\n\n[A](a.md) and\n[B](b.md)\n\nplain\ntext\n\n<a href="c.md">C</a>\n'
+        regions = check_documentation_links.find_link_regions(data)
+        self.assertEqual([data[start:end] for start, end in regions],
+                         [b'\n[A](a.md) and\n[B](b.md)\n', b'\n<a href="c.md">C</a>\n'])
+
+    @patch('check_documentation_links.MMAP_MIN_SIZE', 1)
+    def test_mapped_extraction_matches_full_decode(self):
+        """Test that mapped files yield the same links and line numbers as decoding them whole."""
+        paragraphs = ['Filler without links.\n' * 3, TEST_CONTENT, 'See [the wrapped\n  guide](guide.md).',
+                      '<a\n  href="other.md">other</a> and [ünïcode](ü.md)', 'No links here either.']
+        for newline in ('\n', '\r\n'):
+            content = '\n\n'.join(paragraphs).replace('\n', newline)
+            path = self.write_file('docs/mapped.md', '')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+
+            links, anchors = check_documentation_links.extract_file(path)
+            expected = check_documentation_links.extract_links_from_content(content.replace('\r\n', '\n'), path)
+            self.assertEqual([(l.text, l.url, l.line_number) for l in links],
+                             [(l.text, l.url, l.line_number) for l in expected])
+            self.assertEqual(len(links), 7)
+            self.assertIsNone(anchors)
+
+        # Anchors of mapped files are loaded when a fragment link needs them, also from the cache
+        for _ in range(2):
+            valid_links, broken_links = self.run_incremental()
+            # docs/mapped.md links to docs/guide.md, which does not exist; its #section does
+            self.assertEqual(sorted(l.url for l in broken_links),
+                             ['guide.md', 'guide.md', 'missing.md', 'missing.md', 'other.md', 'ü.md'])
+
+    @patch('check_documentation_links.MAX_SCAN_FILE_SIZE', 1000)
+    def test_binary_and_oversized_files_are_skipped(self):
+        """Test that binary and oversized files are skipped with a counted warning."""
+        self.write_file('docs/binary.md', '[Link](nowhere.md)\0\n')
+        self.write_file('docs/large.md', '[Link](nowhere.md)\n' * 100)
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            valid_links, broken_links = self.run_incremental()
+        self.assertEqual([l.url for l in broken_links], ['missing.md'])
+        self.assertIn('Skipping binary file', output.getvalue())
+        self.assertIn('Skipped 2 binary or oversized files.', output.getvalue())
+
+    def test_validate_links(self):
+        """Test that links to missing files are reported as broken."""
+        links = check_documentation_links.extract_links_from_file(self.readme_path)
+        valid_links, broken_links = check_documentation_links.validate_links(links, self.test_dir)
+        self.assertEqual(len(valid_links), 3)
+        self.assertEqual([l.url for l in broken_links], ['missing.md'])
+
+    def test_validate_links_uses_index_once_per_target(self):
+        """Test that targets are resolved from the file index, once per unique target."""
+        self.write_file('docs/a.md', '[Guide](../guide.md) [Again](/guide.md) [Gone](../missing.md)\n')
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir)
+
+        index = file_tree_index.get_tree_index(self.test_dir, check_documentation_links.DIRECTORIES_TO_EXCLUDE)
+        with patch('os.path.exists') as mock_exists, patch.object(index, 'exists', wraps=index.exists) as mock_index_exists:
+            valid_links, broken_links = check_documentation_links.validate_links(links, self.test_dir)
+            mock_exists.assert_not_called()
+            # guide.md, missing.md and README.md (for #section), each checked once
+            self.assertEqual(mock_index_exists.call_count, 3)
+
+        self.assertEqual(len(valid_links), 5)
+        self.assertEqual(sorted(l.url for l in broken_links), ['../missing.md', 'missing.md'])
+
+    def test_validate_links_with_external_results(self):
+        """Test that external results are applied to links regardless of their fragment."""
+        links = check_documentation_links.extract_links_from_content(
+            '[A](https://example.com/a#top) [B](https://example.com/b) [C](https://example.com/c)\n', self.readme_path)
+        external_results = {
+            'https://example.com/a': (True, None),
+            'https://example.com/b': (False, 'HTTP 404'),
+        }
+        valid_links, broken_links = check_documentation_links.validate_links(links, self.test_dir, external_results)
+        self.assertEqual([l.text for l in valid_links], ['A', 'C'])
+        self.assertEqual([(l.text, l.error_message) for l in broken_links], [('B', 'HTTP 404')])
+
+    def test_github_slug(self):
+        """Test that heading slugs follow GitHub's rules."""
+        self.assertEqual(check_documentation_links.github_slug('Getting Started'), 'getting-started')
+        self.assertEqual(check_documentation_links.github_slug('API: `GET /ads` (v1)'), 'api-get-ads-v1')
+        self.assertEqual(check_documentation_links.github_slug('See [the guide](guide.md)!'), 'see-the-guide')
+        self.assertEqual(check_documentation_links.github_slug('Café & Co'), 'café--co')
+
+    def test_extract_anchors_from_content(self):
+        """Test that headings, duplicates and HTML ids are collected, and code blocks skipped."""
+        content = '# Intro\n## Intro\nSetext Title\n===\n```\n# Not a heading\n```\n<a id="custom-id"></a>\n'
+        self.assertEqual(check_documentation_links.extract_anchors_from_content(content),
+                         ['intro', 'intro-1', 'setext-title', 'custom-id'])
+
+    def test_validate_anchor_links(self):
+        """Test that same-file and cross-file fragments are validated against headings."""
+        self.write_file('guide.md', '# Guide\n\n## Install Steps\n')
+        self.write_file('docs/a.md', '[Ok](../guide.md#install-steps) [Bad](../guide.md#nope) [Self](#local) [Gone](#gone)\n\n## Local\n')
+        links = check_documentation_links.scan_directory(os.path.join(self.test_dir, 'docs'), self.test_dir)
+
+        with patch('check_documentation_links.load_anchors', wraps=check_documentation_links.load_anchors) as mock_load:
+            valid_links, broken_links = check_documentation_links.validate_links(links, self.test_dir)
+            # docs/a.md was parsed during the scan; guide.md is parsed once for both links
+            self.assertEqual(mock_load.call_count, 1)
+
+        self.assertEqual([l.url for l in valid_links], ['../guide.md#install-steps', '#local'])
+        self.assertEqual([l.url for l in broken_links], ['../guide.md#nope', '#gone'])
+        self.assertIn('Anchor #nope not found', broken_links[0].error_message)
+
+    def test_incremental_cache_reuses_unchanged_files(self):
+        """Test that unchanged files are not re-extracted on a second run."""
+        self.run_incremental()
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        with patch('check_documentation_links.extract_links_from_content') as mock_extract:
+            valid_links, broken_links = self.run_incremental()
+            mock_extract.assert_not_called()
+
+        self.assertEqual(len(valid_links), 3)
+        self.assertEqual([l.url for l in broken_links], ['missing.md'])
+
+    def test_incremental_cache_revalidates_appeared_targets(self):
+        """Test that a cached broken link is re-validated once its target appears."""
+        self.run_incremental()
+        self.write_file('missing.md', '# No longer missing\n')
+
+        valid_links, broken_links = self.run_incremental()
+        self.assertEqual(len(valid_links), 4)
+        self.assertEqual(broken_links, [])
+
+    def test_incremental_run_reports_like_full_run(self):
+        """Test that a cached broken link gets the same error message as in a full run."""
+        self.write_file('a.md', '[Section](b.md#sec)\n')
+        self.run_incremental()
+        self.write_file('b.md', '# Other heading\n')
+
+        _, incremental_broken = self.run_incremental()
+        file_tree_index.reset_tree_indexes()
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir)
+        _, full_broken = check_documentation_links.validate_links(links, self.test_dir)
+        report = lambda broken: [(l.file_path, l.url, l.is_valid, l.error_message) for l in broken]
+        self.assertEqual(report(incremental_broken), report(full_broken))
+        self.assertIn('Anchor #sec not found', [l for l in full_broken if l.url == 'b.md#sec'][0].error_message)
+
+    def test_incremental_cache_reextracts_changed_files(self):
+        """Test that a changed file is re-extracted."""
+        self.run_incremental()
+        self.write_file('README.md', TEST_CONTENT + '- [Other](other.md)\n')
+
+        valid_links, broken_links = self.run_incremental()
+        self.assertEqual([l.url for l in broken_links], ['missing.md', 'other.md'])
+
+    def test_link_graph_revalidates_changed_files_and_dependents(self):
+        """Test that a change re-extracts only the changed file and revalidates the files linking to it."""
+        self.write_file('docs/a.md', '[Guide](../guide.md#install) [Other](other.md)\n')
+        self.write_file('docs/b.md', '[Readme](../README.md)\n')
+        graph = check_documentation_links.LinkGraph(self.test_dir)
+        broken_links = graph.build([self.test_dir])
+        self.assertEqual(sorted(l.url for l in broken_links), ['../guide.md#install', 'missing.md', 'other.md'])
+
+        guide_path = self.write_file('guide.md', '# Guide\n\n## Install\n')
+        other_path = self.write_file('docs/other.md', '# Other\n')
+        with patch('check_documentation_links.extract_links_from_content',
+                   wraps=check_documentation_links.extract_links_from_content) as mock_extract:
+            affected, broken_links = graph.apply_changes([guide_path, other_path])
+            self.assertEqual(sorted(call.args[1] for call in mock_extract.call_args_list), [other_path, guide_path])
+
+        self.assertEqual([os.path.relpath(f, self.test_dir) for f in affected],
+                         ['README.md', 'docs/a.md', 'docs/other.md', 'guide.md'])
+        self.assertEqual(sorted(l.url for l in broken_links), ['missing.md'])
+        self.assertEqual(graph.broken_count(), 1)
+
+        os.remove(guide_path)
+        affected, broken_links = graph.apply_changes([guide_path])
+        self.assertEqual([os.path.relpath(f, self.test_dir) for f in affected], ['README.md', 'docs/a.md'])
+        self.assertEqual(sorted(l.url for l in broken_links), ['../guide.md#install', 'guide.md', 'missing.md'])
+        self.assertEqual(graph.broken_count(), 3)
+
+    def test_referrer_index_round_trip(self):
+        """Test that the referrer index maps targets, existing or not, to the files linking to them."""
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir)
+        index_path = os.path.join(self.test_dir, '.cache', 'referrers.json')
+        referrer_index = check_documentation_links.LinkReferrerIndex(self.test_dir, index_path)
+        referrer_index.set_links(self.readme_path, links)
+        referrer_index.save()
+
+        loaded = check_documentation_links.LinkReferrerIndex.load(index_path, self.test_dir)
+        self.assertEqual(loaded.referrers, referrer_index.referrers)
+        self.assertEqual(loaded.referring_files([os.path.join(self.test_dir, 'missing.md')]), {self.readme_path})
+        self.assertEqual(loaded.referring_files([], [self.test_dir]), {self.readme_path})
+        loaded.remove_file(self.readme_path)
+        self.assertEqual(loaded.referrers, {})
+
+    def test_select_changed_files(self):
+        """Test that changed files and unchanged files linking to changed paths are selected."""
+        self.write_file('docs/a.md', '[Guide](../guide.md)\n')
+        self.write_file('docs/b.md', '[Old](old.md)\n')
+        old_path = self.write_file('docs/old.md', '# Old\n')
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir)
+        referrer_index = check_documentation_links.LinkReferrerIndex(self.test_dir)
+        for file_path in {link.file_path for link in links}:
+            referrer_index.set_links(file_path, [link for link in links if link.file_path == file_path])
+
+        os.rename(old_path, os.path.join(self.test_dir, 'docs', 'new.md'))
+        os.remove(os.path.join(self.test_dir, 'docs', 'a.md'))
+        changes = [
+            git_changes.FileChange('R', os.path.join(self.test_dir, 'docs', 'new.md'), old_path),
+            git_changes.FileChange('D', os.path.join(self.test_dir, 'docs', 'a.md'), None),
+            git_changes.FileChange('M', os.path.join(self.test_dir, 'node_modules', 'pkg', 'x.md'), None),
+        ]
+        files, removed = check_documentation_links.select_changed_files(changes, referrer_index, self.test_dir)
+        self.assertEqual([os.path.relpath(f, self.test_dir) for f in files], ['docs/b.md', 'docs/new.md'])
+        self.assertEqual([os.path.relpath(f, self.test_dir) for f in removed], ['docs/a.md'])
+
+    @patch('check_documentation_links.VALIDATE_BATCH_SIZE', 3)
+    @patch('check_documentation_links.EXTRACT_BATCH_SIZE', 2)
+    def test_parallel_matches_serial(self):
+        """Test that a multi-process run produces the same report as a serial run."""
+        for i in range(6):
+            self.write_file(f'docs/page{i}.md', TEST_CONTENT.replace('guide.md', f'../page{i}.md'))
+
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir)
+        serial_report = check_documentation_links.generate_report(
+            *check_documentation_links.validate_links(links, self.test_dir))
+
+        file_tree_index.reset_tree_indexes()
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir, jobs=3)
+        parallel_report = check_documentation_links.generate_report(
+            *check_documentation_links.validate_links_parallel(links, self.test_dir, jobs=3))
+
+        self.assertEqual(parallel_report, serial_report)
+        self.assertIn('docs/page0.md', parallel_report)
+
+    def test_spawned_workers_reuse_the_index(self):
+        """Test that workers started with spawn validate against the parent's index."""
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir)
+        # Only the index still knows guide.md, so a worker walking the disk would report it
+        os.remove(os.path.join(self.test_dir, 'guide.md'))
+        spawn_pool = functools.partial(ProcessPoolExecutor, mp_context=multiprocessing.get_context('spawn'))
+        with patch('check_documentation_links.ProcessPoolExecutor', spawn_pool), \
+             patch('check_documentation_links.VALIDATE_BATCH_SIZE', 1):
+            _, broken_links = check_documentation_links.validate_links_parallel(links, self.test_dir, jobs=2)
+        self.assertEqual([l.url for l in broken_links], ['missing.md'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for customization header detection
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_IMPORTS: Code that precedes a header in the test files (default: defined in this file)
+# ===================================================
+
+import os
+import sys
+import unittest
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import customization_header
+from update_customization_headers import HEADER_TEMPLATES
+
+TEST_IMPORTS = "import { Injectable } from '@angular/core';\nimport {\n  HttpClient,\n} from '@angular/common/http';\n\n"
+
+class TestCustomizationHeader(unittest.TestCase):
+    """Test cases for the customization_header.py module."""
+
+    def header(self, ext):
+        """Return the generated header template for a file type."""
+        return HEADER_TEMPLATES[ext].format(module_purpose='tests', setting_example='API_URL')
+
+    def test_finds_generated_headers(self):
+        """Test that the header generated for every file type is found exactly."""
+        for ext in HEADER_TEMPLATES:
+            header = self.header(ext).rstrip('\n')
+            content = f"{header}\nbody {{}}\n"
+            self.assertEqual(customization_header.find_customization_header(content, ext), header, ext)
+
+    def test_finds_header_after_imports(self):
+        """Test that a header below the import block is found."""
+        content = TEST_IMPORTS + self.header('.ts') + 'export class ApiService {}\n'
+        found = customization_header.find_customization_header(content, '.ts')
+        self.assertTrue(found.startswith('// ====='))
+        self.assertIn('// - API_URL:', found)
+
+    def test_stops_at_code_inside_unclosed_header(self):
+        """Test that an opener without a closing rule is given up at the first line of code."""
+        opener = '// ===\n// CUSTOMIZABLE SETTINGS IN THIS FILE\n// ===\n// - API_URL: Base URL\n'
+        content = opener + 'const x = 1;\n' * 1000 + '// ===\n'
+        self.assertIsNone(customization_header.find_customization_header(content, '.js'))
+
+    def test_finds_header_past_the_scan_window(self):
+        """Test that a header starting after the scan window is found by scanning the whole file."""
+        for lines in (customization_header.HEADER_SCAN_LINES - 1, customization_header.HEADER_SCAN_LINES, 1000):
+            content = 'code();\n' * lines + self.header('.js') + 'more();\n'
+            self.assertEqual(customization_header.find_customization_header(content, '.js'),
+                             self.header('.js').rstrip('\n'), lines)
+        content = 'code();\n' * 1000 + '// CUSTOMIZABLE SETTINGS IN THIS FILE\n'
+        self.assertIsNone(customization_header.find_customization_header(content, '.js'))
+
+    def test_finds_header_below_long_leading_comment(self):
+        """Test that a header right below a leading comment longer than the scan window is found."""
+        comment = '/**\n' + ' * Notes\n' * customization_header.HEADER_SCAN_LINES + ' */\n\n'
+        self.assertIsNotNone(customization_header.find_customization_header(comment + self.header('.js'), '.js'))
+        self.assertIsNotNone(customization_header.find_customization_header(comment + 'code();\n' + self.header('.js'), '.js'))
+
+    def test_parses_settings_in_one_pass(self):
+        """Test that adjacent settings and their related-to lines are tokenized for each comment style."""
+        for ext in HEADER_TEMPLATES:
+            lines = self.header(ext).split('\n')
+            index = next(i for i, line in enumerate(lines) if '- API_URL:' in line)
+            lines.insert(index, lines[index].split('- API_URL:')[0] + '- API_TIMEOUT: Seconds to wait (default: 30)')
+            header = customization_header.parse_customization_header('\n'.join(lines), ext)
+            self.assertEqual([(s.name, s.description, s.related_to) for s in header.settings], [
+                ('API_TIMEOUT', 'Seconds to wait (default: 30)', None),
+                ('API_URL', 'Description of setting (default: value)', f'other_file{ext}:OTHER_SETTING'),
+            ], ext)
+
+    def test_parses_description_fields(self):
+        """Test that default values, valid values and environments are read from descriptions."""
+        description = 'Log level in production (default: info) Valid values: [debug, info]'
+        self.assertEqual(customization_header.parse_default_value(description), 'info')
+        self.assertEqual(customization_header.parse_valid_values(description), 'debug, info')
+        self.assertEqual(customization_header.parse_environment(description), 'Production')
+        self.assertIsNone(customization_header.parse_related_to(description))
+
+if __name__ == '__main__':
+    unittest.main()
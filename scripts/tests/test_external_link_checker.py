@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the external link checker
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_ROUTES: Status codes served by the local stand-in server (default: defined in this file)
+# ===================================================
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import external_link_checker
+
+# (HEAD status, GET status) served for each path
+TEST_ROUTES = {
+    '/ok': (200, 200),
+    '/missing': (404, 404),
+    '/no-head': (405, 200),
+    '/head-forbidden': (403, 200),
+    '/head-gone': (410, 200),
+}
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves TEST_ROUTES plus redirects and a route that fails once before succeeding."""
+    protocol_version = 'HTTP/1.1'
+    requests = []
+    flaky_failures = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def respond(self, method):
+        StandInHandler.requests.append((method, self.path))
+        if self.path == '/redirect':
+            status, headers = 301, {'Location': '/ok'}
+        elif self.path == '/loop':
+            status, headers = 302, {'Location': '/loop'}
+        elif self.path == '/flaky':
+            failures = StandInHandler.flaky_failures.get(self.path, 0)
+            StandInHandler.flaky_failures[self.path] = failures + 1
+            status, headers = (503 if failures == 0 else 200), {}
+        else:
+            head_status, get_status = TEST_ROUTES.get(self.path, (404, 404))
+            status, headers = (head_status if method == 'HEAD' else get_status), {}
+
+        body = b'' if method == 'HEAD' else b'stand-in body'
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.respond('HEAD')
+
+    def do_GET(self):
+        self.respond('GET')
+
+class TestExternalLinkChecker(unittest.TestCase):
+    """Test cases for the external_link_checker.py module."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Start the local stand-in HTTP server."""
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the local stand-in HTTP server."""
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.test_dir, 'external.json')
+        StandInHandler.requests = []
+        StandInHandler.flaky_failures = {}
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+
+    def check(self, paths, **options):
+        """Check stand-in URLs with fast retries."""
+        options.setdefault('backoff', 0.01)
+        urls = [f"{self.base_url}{path}" for path in paths]
+        results = external_link_checker.check_external_links(urls, **options)
+        return {url[len(self.base_url):]: verdict for url, verdict in results.items()}
+
+    def test_statuses(self):
+        """Test that successes, redirects, HEAD fallbacks and failures are reported."""
+        results = self.check(['/ok', '/missing', '/no-head', '/head-forbidden', '/head-gone', '/redirect'])
+        self.assertEqual(results['/ok'], (True, None))
+        self.assertEqual(results['/missing'], (False, 'HTTP 404'))
+        self.assertEqual(results['/no-head'], (True, None))
+        self.assertEqual(results['/head-forbidden'], (True, None))
+        self.assertEqual(results['/head-gone'], (False, 'HTTP 410'))
+        self.assertEqual(results['/redirect'], (True, None))
+        self.assertIn(('GET', '/no-head'), StandInHandler.requests)
+        for path in ['/ok', '/missing', '/head-gone']:
+            self.assertNotIn(('GET', path), StandInHandler.requests)
+
+    def test_redirect_loop_is_broken(self):
+        """Test that a URL redirecting to itself fails after MAX_REDIRECTS hops without retrying."""
+        results = self.check(['/loop'])
+        self.assertEqual(results['/loop'], (False, 'Request failed: Too many redirects'))
+        self.assertEqual(StandInHandler.requests, [('HEAD', '/loop')] * (external_link_checker.MAX_REDIRECTS + 1))
+
+    def test_retries_transient_errors(self):
+        """Test that a 503 is retried with backoff."""
+        results = self.check(['/flaky'])
+        self.assertEqual(results['/flaky'], (True, None))
+        self.assertEqual(StandInHandler.requests, [('HEAD', '/flaky'), ('HEAD', '/flaky')])
+
+    def test_connection_errors(self):
+        """Test that unreachable hosts are reported after retrying."""
+        results = external_link_checker.check_external_links(['http://127.0.0.1:1/'], retries=1, backoff=0.01)
+        is_valid, error_message = results['http://127.0.0.1:1/']
+        self.assertFalse(is_valid)
+        self.assertIn('Request failed', error_message)
+
+    def test_cache_ttl(self):
+        """Test that cached results are reused until they expire."""
+        self.check(['/ok', '/missing'], cache_path=self.cache_path)
+        self.assertTrue(os.path.exists(self.cache_path))
+        requests_made = len(StandInHandler.requests)
+
+        results = self.check(['/ok', '/missing'], cache_path=self.cache_path)
+        self.assertEqual(len(StandInHandler.requests), requests_made)
+        self.assertEqual(results['/missing'], (False, 'HTTP 404'))
+
+        self.check(['/ok'], cache_path=self.cache_path, ttl=0)
+        self.assertEqual(len(StandInHandler.requests), requests_made + 1)
+
+    def test_transient_failures_are_not_cached(self):
+        """Test that only successes and permanent failures are cached."""
+        self.check(['/ok', '/missing', '/flaky'], cache_path=self.cache_path, retries=0)
+        StandInHandler.requests = []
+        results = self.check(['/ok', '/missing', '/flaky'], cache_path=self.cache_path, retries=0)
+        self.assertEqual(StandInHandler.requests, [('HEAD', '/flaky')])
+        self.assertEqual(results['/flaky'], (True, None))
+
+    def test_connections_are_reused(self):
+        """Test that HEAD requests to one host share a keep-alive connection."""
+        pool = external_link_checker.ConnectionPool()
+        checker = external_link_checker.ExternalLinkChecker()
+        checker.pool = pool
+        netloc = self.base_url.split('//', 1)[1]
+        self.assertEqual(checker._request('HEAD', f"{self.base_url}/ok"), 200)
+        connection = pool.acquire('http', netloc)
+        pool.release('http', netloc, connection)
+        self.assertEqual(checker._request('HEAD', f"{self.base_url}/ok"), 200)
+        self.assertIs(pool.acquire('http', netloc), connection)
+        pool.close()
+
+if __name__ == '__main__':
+    unittest.main()
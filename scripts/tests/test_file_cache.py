@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the shared per-file cache
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_PAYLOAD: Payload stored for each file by the test cache (default: {'lines': 0})
+# ===================================================
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import file_cache
+
+TEST_PAYLOAD = {'lines': 0}
+
+class LineCountCache(file_cache.FileCache):
+    """Cache of the number of lines of each file, valid for one mode."""
+    version = 3
+    description = 'line count'
+
+    def __init__(self, cache_path, project_root, mode='lines'):
+        super().__init__(cache_path, project_root)
+        self.mode = mode
+
+    def identity(self):
+        return {'mode': self.mode}
+
+class TestFileCache(unittest.TestCase):
+    """Test cases for the file_cache.py module."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.cache_path = os.path.join(self.test_dir, '.cache', 'lines.json')
+        self.file_path = self.write_file('notes.txt', 'one\ntwo\n')
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+
+    def write_file(self, name, content):
+        """Write a file relative to the test directory."""
+        path = os.path.join(self.test_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def count_lines(self, mode='lines'):
+        """Look up the test file in a freshly loaded cache; return (cached count, data read)."""
+        cache = LineCountCache.load(self.cache_path, self.test_dir, mode)
+        entry, data = cache.get(self.file_path, os.stat(self.file_path), dict(TEST_PAYLOAD))
+        if entry is None:
+            cache.entry(self.file_path)['lines'] = data.count(b'\n')
+        cache.save()
+        return (entry['lines'] if entry else None), data
+
+    def test_unchanged_file_is_not_read(self):
+        """Test that a second lookup is served from the saved cache."""
+        self.assertEqual(self.count_lines(), (None, b'one\ntwo\n'))
+        self.assertEqual(self.count_lines(), (2, None))
+
+    def test_touched_file_is_matched_by_hash(self):
+        """Test that a file with a new mtime but the same content keeps its entry."""
+        self.count_lines()
+        st = os.stat(self.file_path)
+        os.utime(self.file_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+        self.assertEqual(self.count_lines(), (2, None))
+
+        self.write_file('notes.txt', 'one\n')
+        self.assertEqual(self.count_lines(), (None, b'one\n'))
+
+    def test_identity_mismatch_discards_the_cache(self):
+        """Test that a cache saved with other settings is not reused."""
+        self.count_lines()
+        self.assertEqual(self.count_lines(mode='words'), (None, b'one\ntwo\n'))
+
+    def test_unseen_entries_are_dropped(self):
+        """Test that entries of files not looked up are removed on save."""
+        self.count_lines()
+        os.remove(self.file_path)
+        cache = LineCountCache.load(self.cache_path, self.test_dir)
+        self.assertEqual(list(cache.files), ['notes.txt'])
+        cache.save()
+        self.assertEqual(LineCountCache.load(self.cache_path, self.test_dir).files, {})
+
+if __name__ == '__main__':
+    unittest.main()
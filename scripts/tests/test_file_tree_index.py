@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the shared file-tree index
+#
+# COMMON CUSTOMIZATIONS:
+# - EXCLUDED_DIRECTORIES: Directories excluded in the test index (default: ['node_modules'])
+# ===================================================
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import file_tree_index
+
+EXCLUDED_DIRECTORIES = ['node_modules']
+
+class TestFileTreeIndex(unittest.TestCase):
+    """Test cases for the file_tree_index.py module."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        for name in ['README.md', 'docs/guide.md', 'docs/notes.txt', 'node_modules/pkg/README.md']:
+            path = os.path.join(self.test_dir, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write('# Test\n')
+        self.index = file_tree_index.FileTreeIndex(self.test_dir, EXCLUDED_DIRECTORIES)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+
+    def relative_paths(self, entries):
+        """Convert index entries to sorted paths relative to the test directory."""
+        return sorted(os.path.relpath(path, self.test_dir) for path, _ in entries)
+
+    def test_walk_filters_extensions_and_exclusions(self):
+        """Test that excluded directories are skipped and extensions are filtered."""
+        entries = list(self.index.walk(self.test_dir, ['.md']))
+        self.assertEqual(self.relative_paths(entries), ['README.md', os.path.join('docs', 'guide.md')])
+        self.assertTrue(all(isinstance(st, os.stat_result) for _, st in entries))
+
+    def test_normalize_roots_drops_nested_and_missing(self):
+        """Test that nested roots are dropped and missing roots are reported."""
+        roots = self.index.normalize_roots(['.', 'docs', 'missing'])
+        self.assertEqual(roots, [('.', self.test_dir), ('missing', None)])
+
+    def test_walk_is_served_from_index(self):
+        """Test that walking a directory inside an indexed root does not walk again."""
+        list(self.index.walk(self.test_dir))
+        os.remove(os.path.join(self.test_dir, 'docs', 'guide.md'))
+        entries = list(self.index.walk(os.path.join(self.test_dir, 'docs'), ['.md']))
+        self.assertEqual(self.relative_paths(entries), [os.path.join('docs', 'guide.md')])
+
+    def test_exists_answers_from_index(self):
+        """Test that indexed paths are answered without touching the file system."""
+        list(self.index.walk(self.test_dir))
+        os.remove(os.path.join(self.test_dir, 'docs', 'guide.md'))
+        self.assertTrue(self.index.exists(os.path.join(self.test_dir, 'docs', 'guide.md')))
+        self.assertTrue(self.index.exists(os.path.join(self.test_dir, 'docs')))
+        self.assertFalse(self.index.exists(os.path.join(self.test_dir, 'docs', 'missing.md')))
+        # Excluded directories and paths outside the index fall back to the file system
+        self.assertTrue(self.index.exists(os.path.join(self.test_dir, 'node_modules', 'pkg', 'README.md')))
+        self.assertFalse(self.index.exists(os.path.join(self.test_dir, 'node_modules', 'missing.md')))
+
+    def test_update_adds_changes_and_forgets_paths(self):
+        """Test that created, rewritten and deleted paths are applied to a walked index."""
+        list(self.index.walk(self.test_dir))
+        guide_path = os.path.join(self.test_dir, 'docs', 'guide.md')
+        self.index.set_file_data(guide_path, 'anchors', {'test'})
+        new_path = os.path.join(self.test_dir, 'docs', 'new', 'page.md')
+        os.makedirs(os.path.dirname(new_path))
+        with open(new_path, 'w') as f:
+            f.write('# New\n')
+        with open(guide_path, 'w') as f:
+            f.write('# Guide\n\nMore\n')
+        os.remove(os.path.join(self.test_dir, 'README.md'))
+
+        updated, removed = self.index.update([os.path.dirname(new_path), new_path, guide_path,
+                                              os.path.join(self.test_dir, 'README.md')])
+        self.assertEqual(self.relative_paths(updated), [os.path.join('docs', 'guide.md'), os.path.join('docs', 'new', 'page.md')])
+        self.assertEqual(self.relative_paths(removed), ['README.md'])
+        self.assertEqual(self.index.file_data(guide_path, 'anchors', lambda path: None), None)
+        self.assertTrue(self.index.exists(new_path))
+        self.assertFalse(self.index.exists(os.path.join(self.test_dir, 'README.md')))
+        self.assertEqual(self.relative_paths(self.index.walk(self.test_dir, ['.md'])),
+                         [os.path.join('docs', 'guide.md'), os.path.join('docs', 'new', 'page.md')])
+
+        shutil.rmtree(os.path.join(self.test_dir, 'docs'))
+        updated, removed = self.index.update([os.path.join(self.test_dir, 'docs')])
+        self.assertEqual(len(removed), 3)
+        self.assertFalse(self.index.exists(new_path))
+        self.assertEqual(list(self.index.walk(self.test_dir, ['.md'])), [])
+
+    def test_update_ignores_excluded_directories(self):
+        """Test that changes inside excluded directories stay out of the index."""
+        list(self.index.walk(self.test_dir))
+        path = os.path.join(self.test_dir, 'node_modules', 'pkg', 'other.md')
+        with open(path, 'w') as f:
+            f.write('# Other\n')
+        self.assertEqual(self.index.update([path]), ([], []))
+        self.assertTrue(self.index.exists(path))
+        self.assertEqual(len(list(self.index.walk(self.test_dir, ['.md']))), 2)
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'symlinks not supported')
+    def test_symlinked_and_hard_linked_entries_are_unique(self):
+        """Test that symlinked directories and hard-linked files are reported once."""
+        os.symlink(os.path.join(self.test_dir, 'docs'), os.path.join(self.test_dir, 'docs-link'))
+        os.link(os.path.join(self.test_dir, 'README.md'), os.path.join(self.test_dir, 'README-copy.md'))
+        entries = list(self.index.walk(self.test_dir, ['.md']))
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(len({(st.st_dev, st.st_ino) for _, st in entries}), 2)
+
+if __name__ == '__main__':
+    unittest.main()
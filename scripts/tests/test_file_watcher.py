@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the watch-mode file watchers
+#
+# COMMON CUSTOMIZATIONS:
+# - EXCLUDED_DIRECTORIES: Directories excluded from watching in the tests (default: ['node_modules'])
+# ===================================================
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import file_watcher
+
+EXCLUDED_DIRECTORIES = ['node_modules']
+
+class WatcherTests:
+    """Behaviour shared by every watcher implementation."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.write_file('docs/guide.md', '# Guide\n')
+        os.makedirs(os.path.join(self.test_dir, 'node_modules'))
+        self.watcher = self.create_watcher()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.watcher.close()
+        shutil.rmtree(self.test_dir)
+
+    def write_file(self, name, content):
+        """Write a file relative to the test directory."""
+        path = os.path.join(self.test_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def changes(self):
+        """Collect the changed paths of the next batch, relative to the test directory."""
+        changed = self.watcher.poll(5)
+        changed.update(self.watcher.poll(0.2 + getattr(self.watcher, 'interval', 0)))
+        return {os.path.relpath(path, self.test_dir) for path in changed}
+
+    def test_reports_created_changed_and_deleted_files(self):
+        """Test that edits, new files in new directories and deletions are reported."""
+        self.write_file('docs/guide.md', '# Guide\n\nChanged\n')
+        self.assertIn(os.path.join('docs', 'guide.md'), self.changes())
+
+        # A file created right after its directory may precede the directory's watch;
+        # the new directory itself is always reported
+        self.write_file('docs/new/page.md', '# Page\n')
+        self.assertIn(os.path.join('docs', 'new'), self.changes())
+        self.write_file('docs/new/other.md', '# Other\n')
+        self.assertIn(os.path.join('docs', 'new', 'other.md'), self.changes())
+
+        os.remove(os.path.join(self.test_dir, 'docs', 'guide.md'))
+        self.assertIn(os.path.join('docs', 'guide.md'), self.changes())
+
+    def test_ignores_excluded_directories(self):
+        """Test that changes inside excluded directories are not reported."""
+        self.write_file('node_modules/pkg.md', '# Package\n')
+        self.assertEqual(self.watcher.poll(0.3 + getattr(self.watcher, 'interval', 0)), set())
+
+class TestPollingWatcher(WatcherTests, unittest.TestCase):
+    """Test cases for the polling watcher."""
+
+    def create_watcher(self):
+        return file_watcher.PollingWatcher([self.test_dir], EXCLUDED_DIRECTORIES, interval=0.05)
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'inotify is Linux-only')
+class TestInotifyWatcher(WatcherTests, unittest.TestCase):
+    """Test cases for the inotify watcher."""
+
+    def create_watcher(self):
+        return file_watcher.InotifyWatcher([self.test_dir], EXCLUDED_DIRECTORIES)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@
 # - TEST_REPLACEMENTS: Test replacements for links (default: defined in this file)
 # ===================================================
 
+import io
 import os
 import sys
 import unittest
@@ -18,7 +19,9 @@ import shutil
 
 # Add the parent directory to the path so we can import the script
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import check_documentation_links
 import fix_documentation_links
+import file_tree_index
 
 class TestFixDocumentationLinks(unittest.TestCase):
     """Test cases for the fix_documentation_links.py script."""
@@ -26,7 +29,8 @@ class TestFixDocumentationLinks(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         # Create a temporary directory for test files
-        self.test_dir = tempfile.mkdtemp()
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        file_tree_index.reset_tree_indexes()
         
         # Sample test content with links that need fixing
         self.test_content = """
@@ -59,6 +63,7 @@ This is a test file with links that need to be fixed.
         """Clean up after tests."""
         # Remove the temporary directory and its contents
         shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
     
     def test_fix_links_in_file(self):
         """Test that links are fixed correctly in a file."""
@@ -130,50 +135,106 @@ This is a test file with links that are already fixed.
         # Check that the content is unchanged
         self.assertEqual(fixed_content, updated_content)
     
-    @patch('os.path.exists')
-    @patch('os.walk')
-    def test_scan_directory(self, mock_walk, mock_exists):
-        """Test that directories are scanned correctly."""
-        # Mock os.path.exists to always return True
-        mock_exists.return_value = True
+    def test_rewrites_only_link_spans(self):
+        """Test that replacements leave prose, inline code and code blocks untouched."""
+        content = """See [Docs](docs/example.md) in docs/ and `[Raw](docs/raw.md)`.
+
+```bash
+cd /Users/oivindlund/date-night-app/client-angular
+```
+
+The [wrapped
+link](/Users/oivindlund/date-night-app/docs/file.md) is fixed by two rules.
+"""
+        updated_content = fix_documentation_links.fix_links_in_content(content)
         
-        # Mock os.walk to return test files
-        mock_walk.return_value = [
-            (self.test_dir, [], ['test1.md', 'test2.md', 'test3.txt']),
-            (os.path.join(self.test_dir, 'subdir'), [], ['test4.md', 'test5.md'])
-        ]
+        self.assertIn('[Docs](/docs/example.md) in docs/', updated_content)
+        self.assertIn('`[Raw](docs/raw.md)`', updated_content)
+        self.assertIn('cd /Users/oivindlund/date-night-app/client-angular', updated_content)
+        self.assertIn('link](/docs/example.md)', updated_content)
+    
+    def test_dry_run_prints_diff(self):
+        """Test that dry-run mode prints a unified diff and leaves the file unchanged."""
+        with patch('sys.stdout', new_callable=io.StringIO) as mock_stdout:
+            result = fix_documentation_links.fix_links_in_file(self.test_file_path, self.test_dir, dry_run=True)
+        
+        self.assertTrue(result)
+        diff = mock_stdout.getvalue()
+        self.assertIn('--- a/test.md', diff)
+        self.assertIn('-1. [Relative Link](docs/example.md)', diff)
+        self.assertIn('+1. [Relative Link](/docs/example.md)', diff)
+        
+        with open(self.test_file_path, 'r') as f:
+            self.assertEqual(f.read(), self.test_content)
+    
+    def test_scan_directory(self):
+        """Test that directories are scanned correctly."""
+        # Create a small tree with markdown and non-markdown files
+        os.makedirs(os.path.join(self.test_dir, 'subdir'))
+        for name in ['test1.md', 'test2.md', 'test3.txt', 'subdir/test4.md', 'subdir/test5.md']:
+            with open(os.path.join(self.test_dir, name), 'w') as f:
+                f.write('# Test\n')
         
         # Mock fix_links_in_file to return True for .md files
         with patch('fix_documentation_links.fix_links_in_file') as mock_fix:
-            mock_fix.side_effect = lambda file_path, project_root: file_path.endswith('.md')
+            mock_fix.side_effect = lambda file_path, project_root, **kwargs: file_path.endswith('.md')
             
             # Scan the test directory
-            fixed_files = fix_documentation_links.scan_directory(self.test_dir, '/Users/oivindlund/date-night-app')
+            fixed_files = fix_documentation_links.scan_directory(self.test_dir, self.test_dir)
             
-            # Check that the function was called for each .md file
-            self.assertEqual(mock_fix.call_count, 4)
+            # Check that the function was called for each .md file (including setUp's test.md)
+            self.assertEqual(mock_fix.call_count, 5)
             
             # Check that the function returned the correct number of fixed files
-            self.assertEqual(fixed_files, 4)
+            self.assertEqual(fixed_files, 5)
+    
+    def test_scan_directory_overlapping_roots(self):
+        """Test that files under overlapping roots are only fixed once."""
+        os.makedirs(os.path.join(self.test_dir, 'docs'))
+        with open(os.path.join(self.test_dir, 'docs', 'guide.md'), 'w') as f:
+            f.write('# Guide\n')
+        
+        index = file_tree_index.get_tree_index(self.test_dir, fix_documentation_links.DIRECTORIES_TO_EXCLUDE)
+        roots = [path for _, path in index.normalize_roots(['.', 'docs'])]
+        self.assertEqual(roots, [self.test_dir])
+        
+        with patch('fix_documentation_links.fix_links_in_file') as mock_fix:
+            mock_fix.return_value = False
+            for root in roots:
+                fix_documentation_links.scan_directory(root, self.test_dir)
+            
+            fixed_paths = sorted(call.args[0] for call in mock_fix.call_args_list)
+            self.assertEqual(fixed_paths, [
+                os.path.join(self.test_dir, 'docs', 'guide.md'),
+                os.path.join(self.test_dir, 'test.md'),
+            ])
     
     @patch('os.path.dirname')
     @patch('os.path.abspath')
     @patch('fix_documentation_links.scan_directory')
-    @patch('os.path.exists')
+    @patch('fix_documentation_links.get_tree_index')
     @patch('os.path.join')
+    @patch('check_documentation_links.verify_files')
     @patch('os.system')
-    def test_main(self, mock_system, mock_join, mock_exists, mock_scan, mock_abspath, mock_dirname):
+    def test_main(self, mock_system, mock_verify, mock_join, mock_index, mock_scan, mock_abspath, mock_dirname):
         """Test the main function."""
         # Mock directory paths
         mock_dirname.return_value = '/Users/oivindlund/date-night-app/scripts'
         mock_abspath.return_value = '/Users/oivindlund/date-night-app/scripts/fix_documentation_links.py'
         mock_join.side_effect = lambda *args: '/'.join(args)
         
-        # Mock os.path.exists to return True for directories
-        mock_exists.return_value = True
+        # Mock the tree index to collapse the overlapping scan directories into one root
+        mock_index.return_value.normalize_roots.return_value = [
+            ('.', '/Users/oivindlund/date-night-app'),
+            ('missing', None),
+        ]
         
-        # Mock scan_directory to return 5 fixed files
-        mock_scan.return_value = 5
+        # Mock scan_directory to return 5 fixed files and record one changed file
+        def fake_scan(base_dir, project_root, dry_run, fixed_contents):
+            fixed_contents['/Users/oivindlund/date-night-app/README.md'] = '[Docs](/docs/example.md)\n'
+            return 5
+        mock_scan.side_effect = fake_scan
+        mock_verify.return_value = ([], [])
         
         # Run the main function
         result = fix_documentation_links.main()
@@ -181,11 +242,42 @@ This is a test file with links that are already fixed.
         # Check that the function returned 0 (success)
         self.assertEqual(result, 0)
         
-        # Check that scan_directory was called for each directory in DIRECTORIES_TO_SCAN
-        self.assertEqual(mock_scan.call_count, len(fix_documentation_links.DIRECTORIES_TO_SCAN))
+        # Check that scan_directory was called once per unique, existing root
+        mock_index.return_value.normalize_roots.assert_called_once_with(fix_documentation_links.DIRECTORIES_TO_SCAN)
+        self.assertEqual(mock_scan.call_count, 1)
+        
+        # Check that only the changed files were verified, in-process
+        mock_system.assert_not_called()
+        mock_verify.assert_called_once_with(
+            {'/Users/oivindlund/date-night-app/README.md': '[Docs](/docs/example.md)\n'},
+            mock_dirname.return_value)
+    
+    def test_verify_changed_files(self):
+        """Test that only the changed files are read and verified, against the shared file index."""
+        os.makedirs(os.path.join(self.test_dir, 'docs'))
+        with open(os.path.join(self.test_dir, 'docs', 'example.md'), 'w') as f:
+            f.write('# Example\n\n[Unchanged](missing.md)\n')
+        notes_path = os.path.join(self.test_dir, 'notes.md')
+        with open(notes_path, 'w') as f:
+            f.write('[Notes](/docs/example.md#example)\n')
+        
+        fixed_contents = {}
+        fixed_files = fix_documentation_links.scan_directory(self.test_dir, self.test_dir, fixed_contents=fixed_contents)
+        self.assertEqual(fixed_files, 1)
+        self.assertEqual(list(fixed_contents), [self.test_file_path])
+        
+        # The fixed file is verified from its new content; notes.md changed on disk
+        fixed_contents[notes_path] = None
+        with patch('check_documentation_links.extract_file',
+                   wraps=check_documentation_links.extract_file) as mock_extract:
+            valid_links, broken_links = check_documentation_links.verify_files(fixed_contents, self.test_dir)
+        mock_extract.assert_called_once_with(notes_path)
         
-        # Check that os.system was called to run the link checker
-        mock_system.assert_called_once()
+        self.assertEqual({link.file_path for link in valid_links + broken_links}, {self.test_file_path, notes_path})
+        self.assertIn('/docs/example.md', [link.url for link in valid_links])
+        self.assertIn('/docs/example.md#example', [link.url for link in valid_links])
+        self.assertIn('/server/api.md', [link.url for link in broken_links])
+        self.assertNotIn('missing.md', [link.url for link in broken_links])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the documentation diagram generator
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_DIAGRAM: Diagram definition used by the tests (default: defined in this file)
+# ===================================================
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import file_tree_index
+import generate_documentation_diagrams
+
+TEST_DIAGRAM = {
+    "title": "Test Diagram",
+    "description": "Diagram used by the tests",
+    "content": "\ngraph TD\n    A --> B\n",
+}
+
+class TestGenerateDocumentationDiagrams(unittest.TestCase):
+    """Test cases for the generate_documentation_diagrams.py script."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.output_directory = os.path.join(self.test_dir, generate_documentation_diagrams.OUTPUT_DIRECTORY)
+        file_tree_index.reset_tree_indexes()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def output_mtimes(self):
+        """Return the mtime of every file in the output directory."""
+        return {name: os.stat(os.path.join(self.output_directory, name)).st_mtime_ns
+                for name in os.listdir(self.output_directory)}
+
+    def run_generator(self, argv=()):
+        """Run the generator on the test directory and return its output."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            args = generate_documentation_diagrams.parse_args(list(argv))
+            self.assertEqual(generate_documentation_diagrams.run(args, self.test_dir), 0)
+        return output.getvalue()
+
+    def test_unchanged_diagrams_are_not_rewritten(self):
+        """Test that a second run skips every diagram and leaves the files untouched."""
+        output = self.run_generator()
+        diagram_count = len(generate_documentation_diagrams.DIAGRAMS_TO_GENERATE)
+        self.assertIn(f": {diagram_count} created, 0 updated, 0 skipped.", output)
+        mtimes = self.output_mtimes()
+        self.assertEqual(len(mtimes), 2 * diagram_count)
+
+        output = self.run_generator(['--jobs', '1'])
+        self.assertIn(f": 0 created, 0 updated, {diagram_count} skipped.", output)
+        self.assertIn("Skipped architecture diagram (unchanged).", output)
+        self.assertEqual(self.output_mtimes(), mtimes)
+
+    def test_changed_and_missing_files_are_written(self):
+        """Test that a diagram is updated when its content changes and created when a file is missing."""
+        self.run_generator()
+        os.remove(os.path.join(self.output_directory, 'architecture.md'))
+        with patch.dict(generate_documentation_diagrams.DIAGRAMS, {'data_flow': TEST_DIAGRAM}):
+            output = self.run_generator()
+
+        self.assertIn("Created architecture diagram.", output)
+        self.assertIn("Updated data_flow diagram.", output)
+        self.assertIn(": 1 created, 1 updated, 3 skipped.", output)
+        with open(os.path.join(self.output_directory, 'data_flow.mmd'), 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), TEST_DIAGRAM['content'])
+        self.assertFalse([name for name in os.listdir(self.output_directory) if name.endswith('.tmp')])
+
+    def test_api_endpoints_follow_the_server_routes(self):
+        """Test that the api_endpoints diagram is derived from the server routes and follows their changes."""
+        routes_path = os.path.join(self.test_dir, 'server', 'routes.js')
+        os.makedirs(os.path.dirname(routes_path))
+        with open(os.path.join(self.test_dir, 'server', 'server.js'), 'w', encoding='utf-8') as f:
+            f.write("import routes from './routes.js';\nconst app = express();\napp.use('/api/v1', routes);\n")
+        with open(routes_path, 'w', encoding='utf-8') as f:
+            f.write("const router = express.Router();\nrouter.get('/ads', list);\n")
+
+        output = self.run_generator()
+        self.assertIn("Found 1 API endpoints mounted from server/server.js.", output)
+        with open(os.path.join(self.output_directory, 'api_endpoints.mmd'), 'r', encoding='utf-8') as f:
+            self.assertIn('G1E1["GET /api/v1/ads"]', f.read())
+
+        with open(routes_path, 'a', encoding='utf-8') as f:
+            f.write("router.post('/ads', create);\n")
+        file_tree_index.reset_tree_indexes()
+        output = self.run_generator()
+        self.assertIn("Updated api_endpoints diagram.", output)
+        self.assertIn(": 0 created, 1 updated, 4 skipped.", output)
+        with open(os.path.join(self.output_directory, 'api_endpoints.mmd'), 'r', encoding='utf-8') as f:
+            self.assertIn('G1E2["POST /api/v1/ads"]', f.read())
+
+    def test_derived_diagram_without_resolved_diagrams(self):
+        """Test that generating a derived diagram without resolve_diagrams resolves it on the spot."""
+        os.makedirs(os.path.join(self.test_dir, 'server'))
+        with open(os.path.join(self.test_dir, 'server', 'server.js'), 'w', encoding='utf-8') as f:
+            f.write("const app = express();\napp.get('/health', check);\n")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            status = generate_documentation_diagrams.generate_mermaid_diagram(
+                'api_endpoints', self.output_directory, project_root=self.test_dir)
+            self.assertEqual(status, 'created')
+            self.assertEqual(generate_documentation_diagrams.generate_diagrams(
+                ['api_endpoints', 'architecture'], self.output_directory, project_root=self.test_dir),
+                ['skipped', 'created'])
+        with open(os.path.join(self.output_directory, 'api_endpoints.mmd'), 'r', encoding='utf-8') as f:
+            self.assertIn('G1E1["GET /health"]', f.read())
+
+    def test_every_diagram_has_content(self):
+        """Test that every diagram, derived ones included, can be read from DIAGRAMS directly."""
+        for name in generate_documentation_diagrams.DIAGRAMS_TO_GENERATE:
+            diagram = generate_documentation_diagrams.DIAGRAMS[name]
+            self.assertIn('content', diagram, name)
+            mermaid, markdown = generate_documentation_diagrams.render_diagram(diagram)
+            self.assertIn(mermaid, markdown)
+
+    def test_write_if_changed(self):
+        """Test the created, skipped and updated outcomes of a single file."""
+        path = os.path.join(self.test_dir, 'diagram.mmd')
+        write_if_changed = generate_documentation_diagrams.write_if_changed
+        self.assertEqual(write_if_changed(path, 'graph TD\n'), 'created')
+        self.assertEqual(write_if_changed(path, 'graph TD\n'), 'skipped')
+        self.assertEqual(write_if_changed(path, 'graph LR\n'), 'updated')
+        with open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'graph LR\n')
+
+if __name__ == '__main__':
+    unittest.main()
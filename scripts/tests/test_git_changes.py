@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for listing the files changed since a git ref
+#
+# COMMON CUSTOMIZATIONS:
+# - GIT_IDENTITY: Author settings of the commits made in the test repository (default: defined in this file)
+# ===================================================
+
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+import tempfile
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import git_changes
+
+GIT_IDENTITY = ['-c', 'user.name=Test', '-c', 'user.email=test@example.com', '-c', 'commit.gpgsign=false']
+
+@unittest.skipUnless(shutil.which('git'), 'git is not installed')
+class TestGitChanges(unittest.TestCase):
+    """Test cases for the git_changes.py module."""
+
+    def setUp(self):
+        """Set up a git repository with one commit on main."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.git('init', '-q', '-b', 'main')
+        for name in ['README.md', 'docs/guide.md', 'docs/old.md']:
+            self.write_file(name, f"# {name}\n\nSome text that stays the same across the rename.\n")
+        self.git('add', '.')
+        self.git(*GIT_IDENTITY, 'commit', '-q', '-m', 'Initial')
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+
+    def git(self, *args):
+        """Run git in the test repository."""
+        subprocess.run(['git', '-C', self.test_dir, *args], check=True, capture_output=True)
+
+    def write_file(self, name, content):
+        """Write a file relative to the test directory."""
+        path = os.path.join(self.test_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_parse_name_status(self):
+        """Test that NUL-separated name-status output is parsed, including renames."""
+        output = b'M\0a b.md\0R097\0old.md\0new.md\0D\0gone.md\0'
+        changes = git_changes.parse_name_status(output, '/repo')
+        self.assertEqual(changes, [
+            ('M', '/repo/a b.md', None),
+            ('R', '/repo/new.md', '/repo/old.md'),
+            ('D', '/repo/gone.md', None),
+        ])
+
+    def test_changes_since_merge_base(self):
+        """Test that branch commits, uncommitted edits, renames and untracked files are listed."""
+        self.git('checkout', '-q', '-b', 'feature')
+        self.git('mv', 'docs/old.md', 'docs/new.md')
+        self.git(*GIT_IDENTITY, 'commit', '-q', '-m', 'Rename')
+        self.write_file('README.md', '# Changed\n')
+        self.write_file('docs/added.md', '# Added\n')
+        os.remove(os.path.join(self.test_dir, 'docs', 'guide.md'))
+
+        # A commit on main after the branch point is not a change of the branch
+        self.git('checkout', '-q', 'main')
+        self.write_file('main-only.md', '# Main\n')
+        self.git('add', 'main-only.md')
+        self.git(*GIT_IDENTITY, 'commit', '-q', '-m', 'Main')
+        self.git('checkout', '-q', 'feature')
+
+        changes = git_changes.changed_files_since(self.test_dir, 'main')
+        relative = sorted((c.status, os.path.relpath(c.path, self.test_dir),
+                           c.old_path and os.path.relpath(c.old_path, self.test_dir)) for c in changes)
+        self.assertEqual(relative, [
+            ('A', 'docs/added.md', None),
+            ('D', 'docs/guide.md', None),
+            ('M', 'README.md', None),
+            ('R', 'docs/new.md', 'docs/old.md'),
+        ])
+
+    def test_unknown_ref(self):
+        """Test that an unknown ref raises an error naming the git command."""
+        with self.assertRaises(RuntimeError) as context:
+            git_changes.changed_files_since(self.test_dir, 'no-such-ref')
+        self.assertIn('merge-base', str(context.exception))
+
+if __name__ == '__main__':
+    unittest.main()
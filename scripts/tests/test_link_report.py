@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the documentation link check report writers
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_CONTENT: Test content for documentation files (default: defined in this file)
+# ===================================================
+
+import json
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+import xml.etree.ElementTree as ET
+from unittest.mock import patch
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import check_documentation_links
+import link_report
+
+TEST_CONTENT = """# Test
+
+- [Guide](guide.md)
+- [Missing](missing.md)
+- [A & B](<other>.md)
+"""
+
+class TestLinkReport(unittest.TestCase):
+    """Test cases for the link_report.py module."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        os.makedirs(os.path.join(self.test_dir, 'docs'))
+        with open(os.path.join(self.test_dir, 'docs', 'guide.md'), 'w') as f:
+            f.write('# Guide\n')
+        self.file_path = os.path.join(self.test_dir, 'docs', 'README.md')
+        self.links = check_documentation_links.extract_links_from_content(TEST_CONTENT, self.file_path)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+
+    def write_reports(self, formats):
+        """Validate the test links while streaming them to writers for the given formats."""
+        writers = link_report.open_report_writers(formats, self.test_dir)
+        valid_links, broken_links = check_documentation_links.validate_links(
+            self.links, self.test_dir, on_result=lambda link: [w.add(link) for w in writers])
+        link_report.close_report_writers(writers)
+        return valid_links, broken_links, {fmt: writer.path for fmt, writer in zip(formats, writers)}
+
+    def test_markdown_matches_generate_report(self):
+        """Test that the streamed markdown report has the same layout as generate_report."""
+        valid_links, broken_links, paths = self.write_reports(['markdown'])
+        with open(paths['markdown'], encoding='utf-8') as f:
+            streamed = f.read()
+        self.assertIn('- Broken links: 2\n', streamed)
+        self.assertIn('| docs/README.md | 5 | A & B | <other>.md |', streamed)
+        self.assertEqual(streamed.split('## Broken Links')[0],
+                         check_documentation_links.generate_report(valid_links, broken_links).split('## Broken Links')[0])
+        self.assertFalse(os.path.exists(paths['markdown'] + '.tmp'))
+
+    def test_machine_readable_formats(self):
+        """Test that JSON, SARIF and JUnit reports parse and carry every broken link."""
+        _, _, paths = self.write_reports(['json', 'sarif', 'junit'])
+
+        with open(paths['json'], encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['summary'], {'total': 3, 'valid': 1, 'broken': 2})
+        self.assertEqual([(r['file'], r['line']) for r in data['broken_links']],
+                         [('docs/README.md', 4), ('docs/README.md', 5)])
+
+        with open(paths['sarif'], encoding='utf-8') as f:
+            sarif = json.load(f)
+        results = sarif['runs'][0]['results']
+        self.assertEqual(sarif['version'], '2.1.0')
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]['locations'][0]['physicalLocation']['region']['startLine'], 4)
+
+        suite = ET.parse(paths['junit']).getroot().find('testsuite')
+        self.assertEqual((suite.get('tests'), suite.get('failures')), ('3', '2'))
+        self.assertEqual(len(suite.findall('testcase/failure')), 2)
+
+    def test_no_broken_links(self):
+        """Test the markdown and JSON reports when every link is valid."""
+        self.links = self.links[:1]
+        _, _, paths = self.write_reports(['markdown', 'json'])
+        with open(paths['markdown'], encoding='utf-8') as f:
+            self.assertIn('## No Broken Links Found', f.read())
+        with open(paths['json'], encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['broken_links'], [])
+
+    def test_failed_open_leaves_no_temporary_files(self):
+        """Test that writers opened before one that fails are aborted."""
+        with open(os.path.join(self.test_dir, 'blocked'), 'w') as f:
+            f.write('not a directory\n')
+        report_paths = {'markdown': 'docs/report.md', 'json': 'blocked/report.json'}
+        with self.assertRaises(OSError):
+            link_report.open_report_writers(['markdown', 'json'], self.test_dir, report_paths)
+        self.assertEqual(sorted(os.listdir(os.path.join(self.test_dir, 'docs'))), ['guide.md'])
+
+    def test_failed_close_aborts_the_remaining_writers(self):
+        """Test that a writer failing to close is aborted along with the writers after it."""
+        with patch.object(link_report.JsonReportWriter, 'finish', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                self.write_reports(['markdown', 'json', 'junit'])
+        reports = sorted(name for name in os.listdir(os.path.join(self.test_dir, 'docs')) if name != 'guide.md')
+        self.assertEqual(reports, [os.path.basename(link_report.REPORT_PATHS['markdown'])])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the SQLite link store
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_CONTENT: Test content for documentation files (default: defined in this file)
+# ===================================================
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import check_documentation_links
+import file_tree_index
+import link_store
+
+TEST_CONTENT = """# Test Documentation
+
+- [Guide](docs/guide.md)
+- [Missing](missing.md)
+- [External](https://example.com#top)
+- [Anchor](#section)
+
+## Section
+"""
+
+class TestLinkStore(unittest.TestCase):
+    """Test cases for the link_store.py module."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.store_path = os.path.join(self.test_dir, '.cache', 'links.sqlite')
+        self.write_file('README.md', TEST_CONTENT)
+        self.write_file('docs/guide.md', '# Guide\n\n[Home](../README.md#section)\n')
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def write_file(self, name, content):
+        """Write a file relative to the test directory."""
+        path = os.path.join(self.test_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def path(self, name):
+        """Return the absolute path of a file in the test directory."""
+        return os.path.join(self.test_dir, name)
+
+    def record(self, removed_files=None):
+        """Scan and validate the test directory and record it in the store."""
+        file_tree_index.reset_tree_indexes()
+        links = check_documentation_links.scan_directory(self.test_dir, self.test_dir)
+        check_documentation_links.validate_links(links, self.test_dir)
+        files = {link.file_path: os.stat(link.file_path) for link in links}
+        for name in ('README.md', 'docs/guide.md'):
+            if os.path.exists(self.path(name)):
+                files.setdefault(self.path(name), os.stat(self.path(name)))
+        check_documentation_links.update_link_store(self.store_path, self.test_dir, files, links, removed_files)
+        return link_store.LinkStore(self.store_path, self.test_dir)
+
+    def test_queries(self):
+        """Test inbound, outbound and broken-link queries with project-relative paths."""
+        store = self.record()
+        try:
+            outbound = store.outbound(self.path('README.md'))
+            self.assertEqual([(row.line, row.target, row.is_valid) for row in outbound], [
+                (3, 'docs/guide.md', 1),
+                (4, 'missing.md', 0),
+                (5, 'https://example.com', 1),
+                (6, 'README.md', 1),
+            ])
+            self.assertEqual([(row.file, row.line) for row in store.inbound(self.path('README.md'))],
+                             [('README.md', 6), ('docs/guide.md', 3)])
+            self.assertEqual([row.file for row in store.inbound(self.path('docs'))], ['README.md'])
+            self.assertEqual([row.url for row in store.broken()], ['missing.md'])
+            self.assertEqual(store.broken(self.path('docs')), [])
+            self.assertEqual(store.broken_by_file(), [('README.md', 1)])
+            self.assertIn('(broken: ', link_store.format_link_row(store.broken()[0]))
+        finally:
+            store.close()
+
+    def test_unchanged_files_keep_their_rows(self):
+        """Test that an unchanged file only has its verdicts rewritten."""
+        self.record().close()
+        store = link_store.LinkStore(self.store_path, self.test_dir)
+        link_ids = [row for row, in store.connection.execute('SELECT id FROM links ORDER BY id')]
+        store.close()
+
+        self.write_file('missing.md', '# Now here\n')
+        store = self.record()
+        try:
+            self.assertEqual([row for row, in store.connection.execute('SELECT id FROM links ORDER BY id')], link_ids)
+            self.assertEqual(store.broken(), [])
+        finally:
+            store.close()
+
+    def test_changed_and_removed_files(self):
+        """Test that edited files are re-recorded and removed files dropped."""
+        self.record().close()
+        self.write_file('README.md', '# Test Documentation\n\n[Gone](gone.md)\n')
+        store = self.record()
+        try:
+            self.assertEqual([row.url for row in store.outbound(self.path('README.md'))], ['gone.md'])
+            self.assertEqual(store.inbound(self.path('docs')), [])
+        finally:
+            store.close()
+
+        os.remove(self.path('docs/guide.md'))
+        store = self.record(removed_files=[self.path('docs/guide.md')])
+        try:
+            self.assertEqual(store.outbound(self.path('docs/guide.md')), [])
+            self.assertEqual(store.inbound(self.path('README.md')), [])
+        finally:
+            store.close()
+
+        os.remove(self.path('README.md'))
+        store = self.record()
+        try:
+            self.assertEqual(store.connection.execute('SELECT COUNT(*) FROM files').fetchone()[0], 0)
+            self.assertEqual(store.connection.execute('SELECT COUNT(*) FROM targets').fetchone()[0], 0)
+        finally:
+            store.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the --profile instrumentation
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_HEADER: Customization header of the profiled test source file (default: defined in this file)
+# ===================================================
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import file_tree_index
+import script_profiler
+import update_config_index
+
+TEST_HEADER = """// ===================================================
+// CUSTOMIZABLE SETTINGS IN THIS FILE
+// ===================================================
+// - TIMEOUT: Request timeout (default: 30)
+// ===================================================
+"""
+
+class TestScriptProfiler(unittest.TestCase):
+    """Test cases for the script_profiler.py module."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.trace_path = os.path.join(self.test_dir, 'profile', 'trace.json')
+        file_tree_index.reset_tree_indexes()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def parse_args(self, argv):
+        """Parse profile options the way the scripts do."""
+        parser = argparse.ArgumentParser()
+        script_profiler.add_profile_arguments(parser)
+        return parser.parse_args(argv)
+
+    def test_phases_counters_and_slowest_files(self):
+        """Test that nested phases, counters and the slowest files are recorded."""
+        profiler = script_profiler.ScriptProfiler('test', slowest_files=2)
+        profiler.start()
+        with profiler.phase('scan'):
+            for name in ('a', 'b', 'c'):
+                with profiler.file(name):
+                    data = [0] * (1000 if name == 'b' else 10)
+            with profiler.phase('walk'):
+                pass
+        with profiler.phase('scan'):
+            profiler.count('links', 5)
+        profiler.stop()
+
+        self.assertEqual(profiler.phases['scan'][0], 2)
+        self.assertEqual(profiler.phases['walk'][0], 1)
+        self.assertGreaterEqual(profiler.phases['scan'][1], profiler.phases['walk'][1])
+        self.assertEqual(profiler.counters, {'files': 3, 'links': 5})
+        self.assertEqual(len(profiler.slowest()), 2)
+        self.assertGreater(profiler.peak_memory, 0)
+        self.assertGreaterEqual(profiler.phases['scan'][2], profiler.phases['walk'][2])
+
+        trace = profiler.to_chrome_trace()
+        complete = [event for event in trace['traceEvents'] if event['ph'] == 'X']
+        self.assertEqual(sorted(event['name'] for event in complete), ['a', 'b', 'c', 'scan', 'scan', 'walk'])
+        self.assertTrue(all(event['dur'] >= 0 and event['ts'] >= 0 for event in complete))
+        self.assertTrue(any(event['ph'] == 'C' for event in trace['traceEvents']))
+        self.assertEqual(trace['otherData']['phases']['scan']['calls'], 2)
+
+    def test_nested_phases_are_not_counted_twice(self):
+        """Test that a phase's self time and share leave out the phases nested in it."""
+        clock = iter(range(100))
+        profiler = script_profiler.ScriptProfiler('test', trace_memory=False)
+        with patch('script_profiler.time.perf_counter', lambda: next(clock)):
+            profiler.start()
+            with profiler.phase('scan'):
+                with profiler.phase('walk'):
+                    with profiler.phase('read'):
+                        pass
+                with profiler.phase('walk'):
+                    pass
+            profiler.stop()
+
+        self.assertEqual(profiler.phases['scan'][1::2], [7, 3])
+        self.assertEqual(profiler.phases['walk'][1::2], [4, 3])
+        self.assertEqual(profiler.phases['read'][1::2], [1, 1])
+        self.assertEqual(sum(entry[3] for entry in profiler.phases.values()), 7)
+        rows = {line.split()[0]: line.split() for line in profiler.format_summary().splitlines()[2:5]}
+        self.assertEqual(rows['scan'][2:5], ['7.000', '3.000', '33.3%'])
+        self.assertEqual(rows['walk'][2:5], ['4.000', '3.000', '33.3%'])
+        self.assertEqual(rows['read'][2:5], ['1.000', '1.000', '11.1%'])
+        self.assertEqual(profiler.to_chrome_trace()['otherData']['phases']['walk']['self_seconds'], 3)
+
+    def test_no_profiler_outside_profiled_runs(self):
+        """Test that the hooks are no-ops unless --profile was given."""
+        self.assertIs(script_profiler.get_profiler(), script_profiler.NULL_PROFILER)
+        with script_profiler.profile_run('test', self.parse_args([]), self.test_dir):
+            self.assertIs(script_profiler.get_profiler(), script_profiler.NULL_PROFILER)
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, script_profiler.PROFILE_TRACE_DIRECTORY)))
+
+    def test_profile_run_writes_summary_and_trace(self):
+        """Test that a profiled scan reports its phases, reads and files and writes a Chrome trace."""
+        source_path = os.path.join(self.test_dir, 'server', 'config.js')
+        os.makedirs(os.path.dirname(source_path))
+        with open(source_path, 'w', encoding='utf-8') as f:
+            f.write(TEST_HEADER + "module.exports = {};\n")
+
+        args = self.parse_args(['--profile', '--profile-output', self.trace_path])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            with script_profiler.profile_run('update_config_index', args, self.test_dir):
+                profiler = script_profiler.get_profiler()
+                with profiler.phase('scan'):
+                    settings = update_config_index.scan_directory(self.test_dir, self.test_dir)
+        self.assertIs(script_profiler.get_profiler(), script_profiler.NULL_PROFILER)
+        self.assertEqual(len(settings), 1)
+
+        summary = output.getvalue()
+        self.assertIn('Profile of update_config_index', summary)
+        self.assertIn('server/config.js', summary)
+        self.assertIn(f"Trace written: {self.trace_path}", summary)
+
+        with open(self.trace_path, 'r', encoding='utf-8') as f:
+            trace = json.load(f)
+        other = trace['otherData']
+        self.assertEqual(set(other['phases']), {'scan', 'walk'})
+        self.assertEqual(other['counters']['files_read'], 1)
+        self.assertEqual(other['counters']['bytes_read'], os.path.getsize(source_path))
+        self.assertEqual(other['counters']['settings_found'], 1)
+        self.assertEqual([entry['path'] for entry in other['slowest_files']], [source_path])
+        self.assertGreater(other['peak_memory_bytes'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
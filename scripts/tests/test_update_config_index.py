@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the config index update script
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_HEADER: Customization header used in the test files (default: defined in this file)
+# - TEST_GENERATED_AT: Generation date shown in the footer of test indexes (default: 2023-11-14 22:13:20 UTC)
+# ===================================================
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+from datetime import datetime, timezone
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import update_config_index
+import file_tree_index
+
+TEST_HEADER = """// ===================================================
+// CUSTOMIZABLE SETTINGS IN THIS FILE
+// ===================================================
+// This file contains settings for the database
+//
+// COMMON CUSTOMIZATIONS:
+// - POOL_SIZE: Connections kept open (default: 10)
+//   Related to: server/config/redis.js:POOL_SIZE
+// - DB_URL: Database URL in development (default: localhost)
+// ===================================================
+"""
+
+TEST_GENERATED_AT = datetime.fromtimestamp(1700000000, timezone.utc)
+
+class TestUpdateConfigIndex(unittest.TestCase):
+    """Test cases for the update_config_index.py script."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        self.server_dir = os.path.join(self.test_dir, 'server')
+        self.cache_path = os.path.join(self.test_dir, '.cache', 'config-index.json')
+        self.write_file('server/config/db.js', TEST_HEADER + 'module.exports = {};\n')
+        self.write_file('server/util.js', 'module.exports = {};\n')
+        file_tree_index.reset_tree_indexes()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def write_file(self, name, content, mtime=1700000000):
+        """Write a file relative to the test directory with a fixed mtime."""
+        path = os.path.join(self.test_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def build_index(self, cache=None):
+        """Scan the test tree and generate the index the way main() does."""
+        file_tree_index.reset_tree_indexes()
+        settings = update_config_index.scan_directory(self.server_dir, self.test_dir, cache)
+        sections = cache.sections() if cache is not None else {}
+        index = update_config_index.generate_config_index(settings, TEST_GENERATED_AT, sections)
+        if cache is not None:
+            cache.store_sections(sections)
+            cache.save()
+        return index
+
+    def run_update(self):
+        """Run the script on the test tree with --incremental; return the index content and mtime."""
+        file_tree_index.reset_tree_indexes()
+        with contextlib.redirect_stdout(io.StringIO()):
+            args = update_config_index.parse_args(['--incremental'])
+            self.assertEqual(update_config_index.run(args, self.test_dir), 0)
+        index_path = os.path.join(self.test_dir, update_config_index.CONFIG_INDEX_PATH)
+        with open(index_path, 'r', encoding='utf-8') as f:
+            return f.read(), os.stat(index_path).st_mtime_ns
+
+    def test_index_content(self):
+        """Test that settings are rendered and the footer is dated in UTC."""
+        index = self.build_index()
+        self.assertIn('| POOL_SIZE | Connections kept open | 10 | All |', index)
+        self.assertIn('| DB_URL | Database URL in development | localhost | Development |', index)
+        self.assertTrue(index.endswith('generated on 2023-11-14 22:13:20 UTC. Do not edit manually.*'))
+        self.assertEqual(self.build_index(), index)
+
+    def test_index_is_kept_until_settings_change(self):
+        """Test that touching a file or editing code outside its header does not rewrite the index."""
+        index, mtime = self.run_update()
+        os.utime(os.path.join(self.test_dir, 'server', 'config', 'db.js'), (1800000000, 1800000000))
+        self.assertEqual(self.run_update(), (index, mtime))
+        self.write_file('server/config/db.js', TEST_HEADER + 'module.exports = { pool: 10 };\n', mtime=1800000100)
+        self.write_file('server/util.js', 'module.exports = { a: 1 };\n', mtime=1800000200)
+        self.assertEqual(self.run_update(), (index, mtime))
+
+        self.write_file('server/config/db.js', TEST_HEADER.replace('(default: 10)', '(default: 20)'))
+        updated, _ = self.run_update()
+        self.assertIn('| POOL_SIZE | Connections kept open | 20 | All |', updated)
+
+    def test_incremental_cache_reuses_unchanged_files(self):
+        """Test that unchanged files are neither re-parsed nor re-rendered."""
+        load = lambda: update_config_index.ConfigIndexCache.load(self.cache_path, self.test_dir)
+        index = self.build_index(load())
+
+        with patch('update_config_index.parse_customization_header') as mock_find, \
+             patch('update_config_index.render_file_section') as mock_render, \
+             patch('update_config_index.ConfigSetting') as mock_setting:
+            self.assertEqual(self.build_index(load()), index)
+            mock_find.assert_not_called()
+            mock_render.assert_not_called()
+            mock_setting.assert_not_called()
+
+        self.write_file('server/config/db.js', TEST_HEADER.replace('(default: 10)', '(default: 20)'), mtime=1700000100)
+        updated = self.build_index(load())
+        self.assertIn('| POOL_SIZE | Connections kept open | 20 | All |', updated)
+        self.assertEqual(updated, self.build_index())
+
+    def test_setting_table(self):
+        """Test that the columnar table yields settings whose derived fields are parsed on first access."""
+        table = update_config_index.ConfigSettingTable()
+        table.add_file('a.js', 'Server Configuration', [('A', 'First (default: 1)', None), ('B', 'Second in test', 'b.js:B')])
+        other = update_config_index.ConfigSettingTable()
+        other.add_file('c.js', 'Other Configuration', [('C', 'Third', None)])
+        table.extend(other)
+
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table.file_count(), 2)
+        settings = list(table)
+        self.assertEqual([(s.name, s.file_path, s.category) for s in settings], [
+            ('A', 'a.js', 'Server Configuration'),
+            ('B', 'a.js', 'Server Configuration'),
+            ('C', 'c.js', 'Other Configuration'),
+        ])
+        self.assertFalse(hasattr(settings[0], '__dict__'))
+
+        with patch('update_config_index.parse_default_value', return_value='1') as mock_parse:
+            self.assertEqual(settings[0].default_value, '1')
+            self.assertEqual(settings[0].default_value, '1')
+            mock_parse.assert_called_once_with('First (default: 1)')
+        self.assertEqual((settings[1].environment, settings[1].related_to), ('Test', 'b.js:B'))
+
+        self.assertEqual(update_config_index.group_settings(table), [
+            ('Other Configuration', [('c.js', [2])]),
+            ('Server Configuration', [('a.js', [0, 1])]),
+        ])
+        self.assertEqual([s.name for s in table.records([1, 2])], ['B', 'C'])
+
+    def test_category_trie_uses_longest_path_prefix(self):
+        """Test that categories resolve by whole path components and the longest mapped prefix."""
+        trie = update_config_index.CategoryTrie({
+            'server': 'Server',
+            'server/config': 'Server Configuration',
+        })
+        self.assertEqual(trie.resolve('server/config/db.js'), 'Server Configuration')
+        self.assertEqual(trie.resolve('server/configuration/db.js'), 'Server')
+        self.assertEqual(trie.resolve('client/server/config/db.js'), update_config_index.DEFAULT_CATEGORY)
+        self.assertEqual(update_config_index.get_category(
+            os.path.join(self.test_dir, 'server', 'config', 'db.js'), self.test_dir), 'Server Configuration')
+
+    def test_category_without_project_root(self):
+        """Test that legacy calls without a project root still find mapped prefixes."""
+        db_path = os.path.join(self.test_dir, 'server', 'config', 'db.js')
+        self.assertEqual(update_config_index.get_category(db_path), 'Server Configuration')
+        self.assertEqual(update_config_index.get_category(os.path.join(self.test_dir, 'server', 'util.js')),
+                         update_config_index.DEFAULT_CATEGORY)
+
+        settings = update_config_index.scan_directory(self.server_dir)
+        self.assertEqual({s.category for s in settings}, {'Server Configuration'})
+
+    def test_write_if_changed(self):
+        """Test that the index file is only rewritten when its content differs."""
+        path = os.path.join(self.test_dir, 'docs', 'CONFIG_INDEX.md')
+        self.assertTrue(update_config_index.write_if_changed(path, 'index'))
+        self.assertFalse(update_config_index.write_if_changed(path, 'index'))
+        self.assertTrue(update_config_index.write_if_changed(path, 'index 2'))
+        footer = update_config_index.INDEX_FOOTER
+        self.assertTrue(update_config_index.write_if_changed(path, f'index 2\n{footer}2024-01-01*'))
+        self.assertFalse(update_config_index.write_if_changed(path, f'index 2\n{footer}2025-01-01*'))
+        with open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), f'index 2\n{footer}2024-01-01*')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# ===================================================
+# CUSTOMIZABLE SETTINGS IN THIS FILE
+# ===================================================
+# This file contains tests for the customization header update script
+#
+# COMMON CUSTOMIZATIONS:
+# - TEST_CONFIG_CONTENT: Test content for a configuration file (default: defined in this file)
+# ===================================================
+
+import builtins
+import os
+import sys
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+
+# Add the parent directory to the path so we can import the script
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import update_customization_headers
+import file_tree_index
+
+TEST_CONFIG_CONTENT = """// Database settings
+const MAX_POOL_SIZE = 10;
+module.exports = { MAX_POOL_SIZE };
+"""
+
+class TestUpdateCustomizationHeaders(unittest.TestCase):
+    """Test cases for the update_customization_headers.py script."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.test_dir = os.path.realpath(tempfile.mkdtemp())
+        file_tree_index.reset_tree_indexes()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.test_dir)
+        file_tree_index.reset_tree_indexes()
+
+    def write_file(self, name, content):
+        """Write a file relative to the test directory."""
+        path = os.path.join(self.test_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_adds_header_after_leading_comments(self):
+        """Test that the header is inserted after leading comments with a discovered setting name."""
+        path = self.write_file('server/db.js', TEST_CONFIG_CONTENT)
+        self.assertTrue(update_customization_headers.HeaderPipeline(path).run())
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self.assertTrue(content.startswith('// Database settings\n// ====='))
+        self.assertIn('// - MAX_POOL_SIZE: Description of setting', content)
+        self.assertTrue(content.endswith(TEST_CONFIG_CONTENT[len('// Database settings\n'):]))
+        self.assertTrue(update_customization_headers.has_customization_header(path))
+
+    def test_second_run_changes_nothing(self):
+        """Test that a header inserted below a long leading comment is found on the next run."""
+        comment = '/**\n' + ' * Database settings\n' * 100 + ' */\n\n'
+        path = self.write_file('server/db.config.js', comment + TEST_CONFIG_CONTENT)
+        server_dir = os.path.join(self.test_dir, 'server')
+        self.assertEqual(update_customization_headers.scan_directory(server_dir, self.test_dir), (1, 1))
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        file_tree_index.reset_tree_indexes()
+        self.assertEqual(update_customization_headers.scan_directory(server_dir, self.test_dir), (1, 0))
+        with open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), content)
+
+    def test_header_below_the_code_is_not_duplicated(self):
+        """Test that a file whose header sits below its code is left unchanged."""
+        header = update_customization_headers.HEADER_TEMPLATES['.js'].format(
+            module_purpose='cache settings', setting_example='SETTING_NAME')
+        content = TEST_CONFIG_CONTENT + 'function helper() {}\n' * 100 + header + 'export default config;\n'
+        path = self.write_file('server/cache.js', content)
+        server_dir = os.path.join(self.test_dir, 'server')
+        self.assertEqual(update_customization_headers.scan_directory(server_dir, self.test_dir), (1, 0))
+        with open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), content)
+
+    def test_scan_directory_reads_each_file_once(self):
+        """Test that each scanned file is opened for reading once, and only updated files are written."""
+        self.write_file('server/db.js', TEST_CONFIG_CONTENT)
+        self.write_file('server/util.js', 'function add(a, b) { return a + b; }\n')
+        self.write_file('server/app.config.js', TEST_CONFIG_CONTENT)
+        update_customization_headers.add_customization_header(os.path.join(self.test_dir, 'server/app.config.js'))
+
+        with patch('builtins.open', wraps=builtins.open) as mock_open:
+            scanned, updated = update_customization_headers.scan_directory(
+                os.path.join(self.test_dir, 'server'), self.test_dir)
+
+        modes = [call.args[1] for call in mock_open.call_args_list]
+        self.assertEqual((scanned, updated), (3, 1))
+        self.assertEqual(modes.count('r'), 3)
+        self.assertEqual(modes.count('w'), 1)
+
+    def test_classifier_scan_limit(self):
+        """Test that the classifier reports every matched indicator and honours the scan limit."""
+        content = '\n' * 100 + '@Component({ selector: "x" })\n@Input() options = {};\n'
+        self.assertEqual(update_customization_headers.match_config_patterns(content),
+                         [r'@Component\(', r'@Input\(\)', r'options\s*[=:]\s*{'])
+        self.assertEqual(update_customization_headers.match_config_patterns(content, 50), [])
+        self.assertEqual(update_customization_headers.config_indicators('app.config.ts', content, 120),
+                         ['config', r'@Component\('])
+        self.assertFalse(update_customization_headers.is_config_file('card.ts', content, 50))
+        self.assertTrue(update_customization_headers.is_config_file('app.config.ts', content, 50))
+
+    def test_incremental_cache_skips_unchanged_files(self):
+        """Test that a second run reads no unchanged files and a changed file is re-classified."""
+        server_dir = os.path.join(self.test_dir, 'server')
+        util_path = self.write_file('server/util.js', 'function add(a, b) { return a + b; }\n')
+        self.write_file('server/db.js', TEST_CONFIG_CONTENT)
+        cache_path = os.path.join(self.test_dir, '.cache', 'headers.json')
+
+        def run():
+            file_tree_index.reset_tree_indexes()
+            cache = update_customization_headers.HeaderDecisionCache.load(cache_path, self.test_dir)
+            result = update_customization_headers.scan_directory(server_dir, self.test_dir, cache)
+            cache.save()
+            return result
+
+        self.assertEqual(run(), (2, 1))
+        with patch('update_customization_headers.read_file') as mock_read:
+            self.assertEqual(run(), (2, 0))
+            mock_read.assert_not_called()
+
+        self.write_file('server/util.js', 'module.exports = { add };\n')
+        os.utime(util_path, ns=(1, 1))
+        self.assertEqual(run(), (2, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,49 +8,36 @@
 # - FILE_EXTENSIONS: File extensions to scan for customization headers (default: ['.js', '.ts', '.py', '.html', '.css', '.scss'])
 # - DIRECTORIES_TO_SCAN: Directories to scan for customizable files (default: ['server', 'client-angular/src'])
 # - DIRECTORIES_TO_EXCLUDE: Directories to exclude from scanning (default: ['node_modules', 'dist', '.git'])
-# - HEADER_PATTERNS: Regex patterns to identify customization headers by file type
-#   Related to: update_customization_headers.py:HEADER_TEMPLATES
+# - CATEGORY_MAPPING: Index category for each path prefix (default: defined in this file)
+#   Headers are parsed by customization_header.py (see HEADER_COMMENT_STYLES)
 # - CONFIG_INDEX_PATH: Path to the configuration index file (default: 'docs/CONFIG_INDEX.md')
+# - CACHE_PATH: Path to the per-file settings cache used with --incremental, relative to the project root (default: '.cache/config-index.json')
+#   Related to: update_customization_headers.py:CACHE_PATH
 # ===================================================
 
+import argparse
 import os
-import re
 import sys
+from array import array
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from collections import defaultdict
 
+from customization_header import (parse_customization_header, parse_default_value,
+                                  parse_environment, parse_related_to, parse_valid_values)
+from file_cache import FileCache
+from file_tree_index import get_tree_index
+from script_profiler import add_profile_arguments, get_profiler, profile_run
+
 # Configuration
 FILE_EXTENSIONS = ['.js', '.ts', '.py', '.html', '.css', '.scss']
 DIRECTORIES_TO_SCAN = ['server', 'client-angular/src']
 DIRECTORIES_TO_EXCLUDE = ['node_modules', 'dist', '.git', '__pycache__']
 CONFIG_INDEX_PATH = 'docs/CONFIG_INDEX.md'
+CACHE_PATH = '.cache/config-index.json'
 
-# Patterns to identify customization headers
-HEADER_PATTERNS = {
-    '.js': r'//\s*={3,}\s*\n//\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n//\s*={3,}[\s\S]*?//\s*={3,}',
-    '.ts': r'//\s*={3,}\s*\n//\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n//\s*={3,}[\s\S]*?//\s*={3,}',
-    '.py': r'#\s*={3,}\s*\n#\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n#\s*={3,}[\s\S]*?#\s*={3,}',
-    '.html': r'<!--\s*={3,}\s*\n\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n\s*={3,}[\s\S]*?={3,}\s*-->',
-    '.css': r'/\*\s*={3,}\s*\n\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n\s*={3,}[\s\S]*?={3,}\s*\*/',
-    '.scss': r'/\*\s*={3,}\s*\n\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n\s*={3,}[\s\S]*?={3,}\s*\*/'
-}
-
-# Default pattern for unknown file types
-DEFAULT_PATTERN = HEADER_PATTERNS['.js']
-
-# Patterns to extract settings from headers
-SETTING_PATTERNS = {
-    '.js': r'//\s*-\s*([A-Z_][A-Z0-9_]*)\s*:\s*(.*?)(?:\n//\s*|$)',
-    '.ts': r'//\s*-\s*([A-Z_][A-Z0-9_]*)\s*:\s*(.*?)(?:\n//\s*|$)',
-    '.py': r'#\s*-\s*([A-Z_][A-Z0-9_]*)\s*:\s*(.*?)(?:\n#\s*|$)',
-    '.html': r'<!--\s*-\s*([A-Z_][A-Z0-9_]*)\s*:\s*(.*?)(?:\n\s*-\s*|-->)',
-    '.css': r'/\*\s*-\s*([A-Z_][A-Z0-9_]*)\s*:\s*(.*?)(?:\n\s*-\s*|\*/)',
-    '.scss': r'/\*\s*-\s*([A-Z_][A-Z0-9_]*)\s*:\s*(.*?)(?:\n\s*-\s*|\*/)'
-}
-
-# Default setting pattern for unknown file types
-DEFAULT_SETTING_PATTERN = SETTING_PATTERNS['.js']
+# Start of the footer line that dates the index
+INDEX_FOOTER = "---\n\n*This index was automatically generated on "
 
 # Category mapping based on file paths
 CATEGORY_MAPPING = {
@@ -66,217 +53,448 @@ CATEGORY_MAPPING = {
 # Default category for files that don't match any mapping
 DEFAULT_CATEGORY = 'Other Configuration'
 
+# Marks a derived field that has not been parsed from the description yet
+_UNPARSED = object()
+
 class ConfigSetting:
     """
     Represents a configuration setting extracted from a file.
+    
+    The default value, valid values, related settings and environment are parsed
+    from the description on first access.
     """
-    def __init__(self, name, description, file_path, category=None):
+    __slots__ = ('name', 'description', 'file_path', 'category',
+                 '_default_value', '_valid_values', '_related_to', '_environment')
+    
+    def __init__(self, name, description, file_path, category=None, related_to=None):
         self.name = name
         self.description = description
         self.file_path = file_path
         self.category = category
+        self._default_value = _UNPARSED
+        self._valid_values = _UNPARSED
+        self._related_to = related_to or _UNPARSED
+        self._environment = _UNPARSED
+    
+    @property
+    def default_value(self):
+        """Default value from the description."""
+        if self._default_value is _UNPARSED:
+            self._default_value = parse_default_value(self.description)
+        return self._default_value
+    
+    @property
+    def valid_values(self):
+        """Valid values from the description."""
+        if self._valid_values is _UNPARSED:
+            self._valid_values = parse_valid_values(self.description)
+        return self._valid_values
+    
+    @property
+    def related_to(self):
+        """Related settings, from the header's "Related to:" line or the description."""
+        if self._related_to is _UNPARSED:
+            self._related_to = parse_related_to(self.description)
+        return self._related_to
+    
+    @property
+    def environment(self):
+        """Environment mentioned in the description."""
+        if self._environment is _UNPARSED:
+            self._environment = parse_environment(self.description)
+        return self._environment
+
+class ConfigSettingTable:
+    """
+    Columnar store of configuration settings.
+    
+    Each field is kept in its own list and each file's path and category are stored
+    once, so a large tree is indexed without one object per setting. Iterating
+    yields ConfigSetting records built on demand.
+    """
+    def __init__(self):
+        self.names = []
+        self.descriptions = []
+        self.related_to = []
+        self.file_ids = array('I')
+        self.file_paths = []
+        self.categories = []
+    
+    def add_file(self, file_path, category, records):
+        """Append a file's settings, given as (name, description, related_to) records."""
+        file_id = len(self.file_paths)
+        self.file_paths.append(file_path)
+        self.categories.append(category)
+        for name, description, related_to in records:
+            self.names.append(name)
+            self.descriptions.append(description)
+            self.related_to.append(related_to)
+            self.file_ids.append(file_id)
+    
+    def extend(self, other):
+        """Append every setting of another table."""
+        offset = len(self.file_paths)
+        self.file_paths.extend(other.file_paths)
+        self.categories.extend(other.categories)
+        self.names.extend(other.names)
+        self.descriptions.extend(other.descriptions)
+        self.related_to.extend(other.related_to)
+        self.file_ids.extend(file_id + offset for file_id in other.file_ids)
+    
+    def file_count(self):
+        """Return the number of files that contributed settings."""
+        return len(set(self.file_paths))
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def records(self, rows):
+        """Yield ConfigSetting records for the settings at the given positions."""
+        for row in rows:
+            file_id = self.file_ids[row]
+            yield ConfigSetting(self.names[row], self.descriptions[row], self.file_paths[file_id],
+                                self.categories[file_id], self.related_to[row])
+    
+    def __iter__(self):
+        return self.records(range(len(self.names)))
+
+class ConfigIndexCache(FileCache):
+    """
+    On-disk cache of the settings extracted from each file and its rendered index section.
+    
+    Sections link to absolute paths, so the cache is discarded when the project root moves.
+    """
+    version = 3
+    description = 'config index'
+    
+    def identity(self):
+        return {'project_root': self.project_root}
+    
+    def get_settings(self, file_path, st):
+        """
+        Return (records, content) for a file, where records are (name, description, related_to) lists.
         
-        # Extract default value and valid values if present
-        self.default_value = self._extract_default_value(description)
-        self.valid_values = self._extract_valid_values(description)
-        self.related_to = self._extract_related_to(description)
-        
-        # Extract environment if present
-        self.environment = self._extract_environment(description)
-    
-    def _extract_default_value(self, description):
-        """Extract default value from description."""
-        match = re.search(r'\(default:\s*(.*?)\)', description)
-        return match.group(1) if match else None
-    
-    def _extract_valid_values(self, description):
-        """Extract valid values from description."""
-        match = re.search(r'Valid values:\s*\[(.*?)\]', description)
-        return match.group(1) if match else None
-    
-    def _extract_related_to(self, description):
-        """Extract related settings from description."""
-        match = re.search(r'Related to:\s*(.*?)(?:\n|$)', description)
-        return match.group(1) if match else None
-    
-    def _extract_environment(self, description):
-        """Extract environment from description."""
-        if 'development' in description.lower():
-            return 'Development'
-        elif 'production' in description.lower():
-            return 'Production'
-        elif 'test' in description.lower():
-            return 'Test'
-        return None
+        On a cache hit, records come from the cache and content is None.
+        On a miss, records is None and content is the decoded file.
+        """
+        entry, data = self.get(file_path, st, {'settings': [], 'section': None})
+        if entry is not None:
+            return entry['settings'], None
+        return None, data.decode('utf-8')
+    
+    def store_settings(self, file_path, records):
+        """Record the (name, description, related_to) records of a re-read file."""
+        self.entry(file_path)['settings'] = [list(record) for record in records]
+    
+    def sections(self):
+        """Return the cached rendered section of every file that still has one, by file path."""
+        return {os.path.join(self.project_root, key): entry['section']
+                for key, entry in self.files.items() if key in self.seen and entry.get('section')}
+    
+    def store_sections(self, sections):
+        """Record rendered sections of files that were re-rendered."""
+        for file_path, section in sections.items():
+            entry = self.entry(file_path)
+            if entry is not None and entry.get('section') != section:
+                entry['section'] = section
+                self.dirty = True
 
 def extract_customization_header(file_path):
     """
-    Extract the customization header from a file.
+    Extract the customization header from a file, with the settings it lists.
     """
     ext = os.path.splitext(file_path)[1]
-    pattern = HEADER_PATTERNS.get(ext, DEFAULT_PATTERN)
     
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            match = re.search(pattern, content)
-            return match.group(0) if match else None
+            get_profiler().record_read(f)
+            return parse_customization_header(content, ext)
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
         return None
 
-def extract_settings_from_header(header, file_path, ext):
+class CategoryTrie:
     """
-    Extract settings from a customization header.
+    Trie of path components mapping path prefixes (relative to the project root) to
+    categories. A path resolves to the category of its longest mapped prefix, in as
+    many steps as the path has components.
     """
-    if not header:
-        return []
-    
-    setting_pattern = SETTING_PATTERNS.get(ext, DEFAULT_SETTING_PATTERN)
-    settings = []
+    def __init__(self, mapping):
+        self.root = {}
+        for path_prefix, category in mapping.items():
+            node = self.root
+            for part in path_prefix.strip('/').split('/'):
+                node = node.setdefault(part, {})
+            # None cannot be a path component, so it marks the category of this prefix
+            node[None] = category
     
-    # Determine category based on file path
-    category = DEFAULT_CATEGORY
-    for path_prefix, cat in CATEGORY_MAPPING.items():
-        if path_prefix in file_path:
-            category = cat
-            break
+    def resolve(self, relative_path, default=DEFAULT_CATEGORY):
+        """Return the category of the longest mapped prefix of a relative path."""
+        node = self.root
+        category = default
+        for part in relative_path.replace(os.sep, '/').split('/'):
+            node = node.get(part)
+            if node is None:
+                break
+            category = node.get(None, category)
+        return category
     
-    # Extract settings
-    matches = re.finditer(setting_pattern, header)
-    for match in matches:
-        if len(match.groups()) >= 2:
-            name = match.group(1)
-            description = match.group(2).strip()
-            settings.append(ConfigSetting(name, description, file_path, category))
+    def resolve_anywhere(self, path, default=DEFAULT_CATEGORY):
+        """Return the category of the first mapped prefix found at any component of a path."""
+        parts = path.replace(os.sep, '/').split('/')
+        for start in range(len(parts)):
+            category = self.resolve('/'.join(parts[start:]), None)
+            if category is not None:
+                return category
+        return default
+
+CATEGORY_TRIE = CategoryTrie(CATEGORY_MAPPING)
+
+def get_category(file_path, project_root=None):
+    """
+    Determine a file's category based on its path relative to the project root.
     
-    return settings
+    Without a project root, a mapped prefix may start at any component of the
+    path, as it could when categories were matched by substring.
+    """
+    if project_root:
+        return CATEGORY_TRIE.resolve(os.path.relpath(file_path, project_root))
+    return CATEGORY_TRIE.resolve_anywhere(file_path)
 
-def scan_directory(base_dir):
+def extract_settings_from_header(header, file_path, project_root=None):
+    """
+    Build the settings of a parsed customization header.
     """
-    Scan a directory for files with customization headers.
+    table = ConfigSettingTable()
+    if header and header.settings:
+        table.add_file(file_path, get_category(file_path, project_root), header.settings)
+    return table
+
+def scan_directory(base_dir, project_root=None, cache=None):
+    """
+    Scan a directory for files with customization headers and return a ConfigSettingTable.
+    
+    With a cache, settings of unchanged files are taken from the cache.
     """
-    all_settings = []
+    all_settings = ConfigSettingTable()
+    index = get_tree_index(project_root or base_dir, DIRECTORIES_TO_EXCLUDE)
+    profiler = get_profiler()
     
-    for root, dirs, files in os.walk(base_dir):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in DIRECTORIES_TO_EXCLUDE]
+    for file_path, st in index.walk(base_dir, FILE_EXTENSIONS):
+        ext = os.path.splitext(file_path)[1]
         
-        for file in files:
-            file_path = os.path.join(root, file)
-            ext = os.path.splitext(file)[1]
-            
-            if ext in FILE_EXTENSIONS:
-                # Extract customization header
+        with profiler.file(file_path):
+            if cache is not None:
+                try:
+                    records, content = cache.get_settings(file_path, st)
+                except Exception as e:
+                    print(f"Error reading file {file_path}: {e}")
+                    continue
+                if records is None:
+                    header = parse_customization_header(content, ext)
+                    records = header.settings if header else []
+                    cache.store_settings(file_path, records)
+            else:
+                # Extract customization header and the settings it lists
                 header = extract_customization_header(file_path)
-                if header:
-                    # Extract settings from header
-                    settings = extract_settings_from_header(header, file_path, ext)
-                    all_settings.extend(settings)
+                records = header.settings if header else []
+        
+        if records:
+            all_settings.add_file(file_path, get_category(file_path, project_root), records)
     
+    profiler.count('settings_found', len(all_settings))
     return all_settings
 
-def generate_config_index(settings):
+def group_settings(settings):
+    """
+    Group the rows of a ConfigSettingTable by category and then by file, using only
+    its file id column.
+    
+    Return [(category, [(file_path, rows), ...]), ...] with categories and files
+    sorted, for the table of contents and the body to render from. No setting
+    records are built; settings.records(rows) builds them for the sections that
+    are actually rendered.
+    """
+    rows_per_file = defaultdict(list)
+    for row, file_id in enumerate(settings.file_ids):
+        rows_per_file[file_id].append(row)
+    
+    groups = defaultdict(lambda: defaultdict(list))
+    for file_id, rows in rows_per_file.items():
+        groups[settings.categories[file_id]][settings.file_paths[file_id]].extend(rows)
+    return [(category, sorted(files.items())) for category, files in sorted(groups.items())]
+
+def render_file_section(file_path, settings):
     """
-    Generate the CONFIG_INDEX.md file.
+    Render the index section listing one file's settings.
     """
-    # Group settings by category
-    settings_by_category = defaultdict(list)
+    file_name = os.path.basename(file_path)
+    relative_path = os.path.relpath(file_path, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    absolute_path = os.path.abspath(file_path)
+    
+    content = f"### {file_name}\n\n"
+    content += f"**File**: [{relative_path}]({absolute_path})\n\n"
+    
+    # Create table of settings
+    content += "| Setting | Description | Default Value | Environment |\n"
+    content += "|---------|-------------|---------------|------------|\n"
+    
     for setting in settings:
-        settings_by_category[setting.category].append(setting)
+        description = setting.description.split('(default:')[0].strip()
+        default_value = setting.default_value or 'N/A'
+        environment = setting.environment or 'All'
+        
+        content += f"| {setting.name} | {description} | {default_value} | {environment} |\n"
+    
+    content += "\n"
+    return content
+
+def generate_config_index(settings, generated_at=None, sections=None):
+    """
+    Generate the CONFIG_INDEX.md file from a ConfigSettingTable.
+    
+    generated_at is the time shown in the footer (default: now, in UTC). sections maps file
+    paths to already rendered sections; sections rendered here are added to it.
+    """
+    if sections is None:
+        sections = {}
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc)
+    
+    groups = group_settings(settings)
     
     # Generate table of contents
-    toc = "## Table of Contents\n\n"
-    for category in sorted(settings_by_category.keys()):
+    parts = ["## Table of Contents\n\n"]
+    for category, files in groups:
         category_anchor = category.lower().replace(' ', '-')
-        toc += f"- [{category}](#{category_anchor})\n"
-        
-        # Group settings by file within each category
-        files_in_category = set(setting.file_path for setting in settings_by_category[category])
-        for file_path in sorted(files_in_category):
+        parts.append(f"- [{category}](#{category_anchor})\n")
+        for file_path, _ in files:
             file_name = os.path.basename(file_path)
             file_anchor = file_name.lower().replace('.', '-')
-            toc += f"  - [{file_name}](#{file_anchor})\n"
-    
-    toc += "\n"
+            parts.append(f"  - [{file_name}](#{file_anchor})\n")
+    parts.append("\n")
     
-    # Generate content for each category
-    content = ""
-    for category in sorted(settings_by_category.keys()):
-        content += f"## {category}\n\n"
-        
-        # Group settings by file within each category
-        settings_by_file = defaultdict(list)
-        for setting in settings_by_category[category]:
-            settings_by_file[setting.file_path].append(setting)
-        
-        # Generate content for each file
-        for file_path in sorted(settings_by_file.keys()):
-            file_name = os.path.basename(file_path)
-            relative_path = os.path.relpath(file_path, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            absolute_path = os.path.abspath(file_path)
-            
-            content += f"### {file_name}\n\n"
-            content += f"**File**: [{relative_path}]({absolute_path})\n\n"
-            
-            # Create table of settings
-            content += "| Setting | Description | Default Value | Environment |\n"
-            content += "|---------|-------------|---------------|------------|\n"
-            
-            for setting in settings_by_file[file_path]:
-                description = setting.description.split('(default:')[0].strip()
-                default_value = setting.default_value or 'N/A'
-                environment = setting.environment or 'All'
-                
-                content += f"| {setting.name} | {description} | {default_value} | {environment} |\n"
-            
-            content += "\n"
+    # Generate content for each category and file, reusing sections of unchanged files
+    for category, files in groups:
+        parts.append(f"## {category}\n\n")
+        for file_path, rows in files:
+            if file_path not in sections:
+                sections[file_path] = render_file_section(file_path, settings.records(rows))
+            parts.append(sections[file_path])
     
     # Generate the full index
     index = f"# Configuration Settings Index\n\n"
     index += "This document serves as a central reference for all customizable settings in the Date Night App. "
     index += "Settings are organized by category and include links to their specific locations in the codebase.\n\n"
-    index += toc
-    index += content
-    index += "---\n\n"
-    index += f"*This index was automatically generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}. "
+    index += ''.join(parts)
+    index += f"{INDEX_FOOTER}{generated_at.strftime('%Y-%m-%d %H:%M:%S')} UTC. "
     index += "Do not edit manually.*"
     
     return index
 
-def main():
+def strip_index_footer(content):
+    """
+    Return the index without its footer, which only dates it.
+    """
+    body, footer, _ = content.rpartition(INDEX_FOOTER)
+    return body if footer else content
+
+def write_if_changed(path, content):
+    """
+    Write content to path atomically unless the file already holds it; return True if written.
+    
+    The footer is left out of the comparison, so an index that only differs in its
+    generation date is kept as it is.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if strip_index_footer(f.read()) == strip_index_footer(content):
+                return False
+    except FileNotFoundError:
+        pass
+    
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Update the configuration settings index.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Reuse cached settings and sections for unchanged files")
+    parser.add_argument('--cache-path', default=None,
+                        help=f"Incremental cache file (default: {CACHE_PATH})")
+    add_profile_arguments(parser)
+    return parser.parse_args(argv if argv is not None else [])
+
+def main(argv=None):
     """
     Main function to update the configuration index.
     """
-    print("Updating configuration index...")
+    args = parse_args(argv)
     
     # Get project root directory
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
+    with profile_run('update_config_index', args, project_root):
+        return run(args, project_root)
+
+def run(args, project_root):
+    """
+    Update the configuration index of the project root with parsed arguments.
+    """
+    print("Updating configuration index...")
+    profiler = get_profiler()
+    
+    cache = None
+    if args.incremental:
+        cache_path = args.cache_path or os.path.join(project_root, CACHE_PATH)
+        with profiler.phase('load cache'):
+            cache = ConfigIndexCache.load(cache_path, project_root)
+    
     # Collect all settings
-    all_settings = []
-    for directory in DIRECTORIES_TO_SCAN:
-        dir_path = os.path.join(project_root, directory)
-        if os.path.exists(dir_path):
+    all_settings = ConfigSettingTable()
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    for directory, dir_path in index.normalize_roots(DIRECTORIES_TO_SCAN):
+        if dir_path:
             print(f"Scanning {dir_path}...")
-            settings = scan_directory(dir_path)
+            with profiler.phase('scan'):
+                settings = scan_directory(dir_path, project_root, cache)
             all_settings.extend(settings)
         else:
-            print(f"Directory not found: {dir_path}")
+            print(f"Directory not found: {os.path.join(project_root, directory)}")
     
-    print(f"Found {len(all_settings)} settings in {len(set(s.file_path for s in all_settings))} files.")
+    print(f"Found {len(all_settings)} settings in {all_settings.file_count()} files.")
     
-    # Generate the index
-    index_content = generate_config_index(all_settings)
+    # Generate the index; it is only written when more than its date changed
+    sections = cache.sections() if cache is not None else {}
+    with profiler.phase('generate'):
+        index_content = generate_config_index(all_settings, sections=sections)
+    
+    if cache is not None:
+        with profiler.phase('save cache'):
+            cache.store_sections(sections)
+            try:
+                cache.save()
+            except Exception as e:
+                print(f"Error writing config index cache: {e}")
     
     # Write the index file
     index_path = os.path.join(project_root, CONFIG_INDEX_PATH)
-    os.makedirs(os.path.dirname(index_path), exist_ok=True)
     
     try:
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(index_content)
-        print(f"Configuration index updated: {index_path}")
+        with profiler.phase('write index'):
+            written = write_if_changed(index_path, index_content)
+        if written:
+            print(f"Configuration index updated: {index_path}")
+        else:
+            print(f"Configuration index is up to date: {index_path}")
     except Exception as e:
         print(f"Error writing index file: {e}")
         return 1
@@ -284,4 +502,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
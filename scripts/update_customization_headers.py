@@ -8,19 +8,31 @@
 # - FILE_EXTENSIONS: File extensions to scan for customization headers (default: ['.js', '.ts', '.py', '.html', '.css', '.scss'])
 # - DIRECTORIES_TO_SCAN: Directories to scan for customizable files (default: ['server', 'client-angular/src'])
 # - DIRECTORIES_TO_EXCLUDE: Directories to exclude from scanning (default: ['node_modules', 'dist', '.git'])
+# - CONFIG_INDICATORS: File name fragments that mark a file as configuration (default: ['config', 'environment', 'settings', ...])
+# - CONFIG_SCAN_LIMIT: Characters at the start of a file searched for configuration patterns (default: None, the whole file)
+# - CACHE_PATH: Path to the header decision cache used with --incremental, relative to the project root (default: '.cache/customization-headers.json')
+#   Related to: check_documentation_links.py:CACHE_PATH
 # - HEADER_TEMPLATES: Templates for customization headers by file type
-#   Related to: update_config_index.py:HEADER_PATTERNS
+#   Related to: customization_header.py:HEADER_COMMENT_STYLES
 # ===================================================
 
+import argparse
 import os
 import re
 import sys
 from pathlib import Path
 
+from customization_header import find_customization_header, leading_comment_lines
+from file_cache import FileCache, content_hash
+from file_tree_index import get_tree_index
+from script_profiler import add_profile_arguments, get_profiler, profile_run
+
 # Configuration
 FILE_EXTENSIONS = ['.js', '.ts', '.py', '.html', '.css', '.scss']
 DIRECTORIES_TO_SCAN = ['server', 'client-angular/src']
 DIRECTORIES_TO_EXCLUDE = ['node_modules', 'dist', '.git', '__pycache__']
+CONFIG_SCAN_LIMIT = None
+CACHE_PATH = '.cache/customization-headers.json'
 
 # Header templates for different file types
 HEADER_TEMPLATES = {
@@ -89,152 +101,148 @@ HEADER_TEMPLATES = {
 # Default template for unknown file types
 DEFAULT_TEMPLATE = HEADER_TEMPLATES['.js']
 
-# Patterns to identify existing customization headers
-HEADER_PATTERNS = {
-    '.js': r'//\s*={3,}\s*\n//\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n//\s*={3,}[\s\S]*?//\s*={3,}',
-    '.ts': r'//\s*={3,}\s*\n//\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n//\s*={3,}[\s\S]*?//\s*={3,}',
-    '.py': r'#\s*={3,}\s*\n#\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n#\s*={3,}[\s\S]*?#\s*={3,}',
-    '.html': r'<!--\s*={3,}\s*\n\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n\s*={3,}[\s\S]*?={3,}\s*-->',
-    '.css': r'/\*\s*={3,}\s*\n\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n\s*={3,}[\s\S]*?={3,}\s*\*/',
-    '.scss': r'/\*\s*={3,}\s*\n\s*CUSTOMIZABLE SETTINGS IN THIS FILE\s*\n\s*={3,}[\s\S]*?={3,}\s*\*/'
-}
+CONFIG_INDICATORS = [
+    'config', 'environment', 'settings', 'constants', 'options',
+    'defaults', 'parameters', 'preferences', 'setup'
+]
+
+# Common configuration patterns in file content
+CONFIG_CONTENT_PATTERNS = [
+    r'const\s+\w+\s*=\s*{',  # JavaScript/TypeScript object definition
+    r'@Component\(',  # Angular component
+    r'@Input\(\)',  # Angular input properties
+    r'process\.env\.',  # Environment variables
+    r'@NgModule\(',  # Angular module
+    r'export\s+const\s+\w+\s*=\s*{',  # Exported constant object
+    r'options\s*[=:]\s*{',  # Options object
+    r'settings\s*[=:]\s*{',  # Settings object
+    r'config\s*[=:]\s*{',  # Config object
+    r'module\.exports\s*='  # Node.js exports
+]
 
-# Default pattern for unknown file types
-DEFAULT_PATTERN = HEADER_PATTERNS['.js']
+# Compiled once; every pattern starts with a literal, so each search is a fast
+# literal scan (a combined alternation defeats that scan and is slower in re)
+CONFIG_CONTENT_REGEXES = [re.compile(pattern) for pattern in CONFIG_CONTENT_PATTERNS]
 
-def is_config_file(file_path):
+def read_file(file_path):
     """
-    Determine if a file is likely to contain configuration settings.
+    Read a file's content, or return None (after reporting the error) if it cannot be read.
     """
-    config_indicators = [
-        'config', 'environment', 'settings', 'constants', 'options',
-        'defaults', 'parameters', 'preferences', 'setup'
-    ]
-    
-    file_name = os.path.basename(file_path).lower()
-    file_name_without_ext = os.path.splitext(file_name)[0]
-    
-    # Check if any config indicator is in the file name
-    for indicator in config_indicators:
-        if indicator in file_name_without_ext:
-            return True
-    
-    # Check file content for configuration patterns
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            
-            # Look for common configuration patterns
-            patterns = [
-                r'const\s+\w+\s*=\s*{',  # JavaScript/TypeScript object definition
-                r'export\s+const\s+\w+\s*=\s*{',  # Exported constant object
-                r'module\.exports\s*=',  # Node.js exports
-                r'process\.env\.',  # Environment variables
-                r'config\s*[=:]\s*{',  # Config object
-                r'settings\s*[=:]\s*{',  # Settings object
-                r'options\s*[=:]\s*{',  # Options object
-                r'@Input\(\)',  # Angular input properties
-                r'@Component\(',  # Angular component
-                r'@NgModule\('  # Angular module
-            ]
-            
-            for pattern in patterns:
-                if re.search(pattern, content):
-                    return True
+            get_profiler().record_read(f)
+            return content
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
+        return None
+
+def match_config_patterns(content, scan_limit=None):
+    """
+    Return every configuration pattern found in the content, in CONFIG_CONTENT_PATTERNS order.
     
-    return False
+    With a scan_limit, only that many characters from the start of the content are searched.
+    """
+    end = len(content) if scan_limit is None else min(scan_limit, len(content))
+    return [pattern for pattern, regex in zip(CONFIG_CONTENT_PATTERNS, CONFIG_CONTENT_REGEXES)
+            if regex.search(content, 0, end)]
 
-def has_customization_header(file_path):
+def config_indicators(file_path, content=None, scan_limit=CONFIG_SCAN_LIMIT):
     """
-    Check if a file already has a customization header.
+    Return every config indicator a file matches: the CONFIG_INDICATORS found in its
+    name, followed by the CONFIG_CONTENT_PATTERNS found in its content.
+
+    Pass the file's content when it has already been read to avoid reading it again.
     """
-    ext = os.path.splitext(file_path)[1]
-    pattern = HEADER_PATTERNS.get(ext, DEFAULT_PATTERN)
+    file_name_without_ext = os.path.splitext(os.path.basename(file_path).lower())[0]
+    indicators = [indicator for indicator in CONFIG_INDICATORS if indicator in file_name_without_ext]
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            return bool(re.search(pattern, content))
-    except Exception as e:
-        print(f"Error reading file {file_path}: {e}")
-        return False
+    if content is None:
+        content = read_file(file_path)
+        if content is None:
+            return indicators
+    
+    return indicators + match_config_patterns(content, scan_limit)
 
-def add_customization_header(file_path):
+def is_config_file(file_path, content=None, scan_limit=CONFIG_SCAN_LIMIT):
     """
-    Add a customization header to a file.
+    Determine if a file is likely to contain configuration settings.
+
+    Pass the file's content when it has already been read to avoid reading it again.
     """
-    ext = os.path.splitext(file_path)[1]
-    template = HEADER_TEMPLATES.get(ext, DEFAULT_TEMPLATE)
-    
-    # Extract module purpose from file path
-    file_name = os.path.basename(file_path)
-    module_name = os.path.splitext(file_name)[0]
+    return bool(config_indicators(file_path, content, scan_limit))
+
+def has_customization_header(file_path, content=None):
+    """
+    Check if a file already has a customization header.
+
+    Pass the file's content when it has already been read to avoid reading it again.
+    """
+    if content is None:
+        content = read_file(file_path)
+        if content is None:
+            return False
+    return find_customization_header(content, os.path.splitext(file_path)[1]) is not None
+
+def find_setting_example(ext, content):
+    """
+    Return the first setting-like constant name in the content, or a placeholder.
+    """
+    if ext in ['.js', '.ts']:
+        match = re.search(r'(?:const|let|var)\s+([A-Z_]+)\s*=', content)
+    elif ext == '.py':
+        match = re.search(r'([A-Z_]+)\s*=', content)
+    else:
+        match = None
+    return match.group(1) if match else "SETTING_NAME"
+
+def get_module_purpose(file_path):
+    """
+    Describe a module's purpose based on its path and name.
+    """
+    module_name = os.path.splitext(os.path.basename(file_path))[0]
     
-    # Determine module purpose based on file path and name
     if 'config' in file_path:
-        module_purpose = f"configuration settings ({module_name})"
+        return f"configuration settings ({module_name})"
     elif 'environment' in file_path:
-        module_purpose = f"environment-specific settings ({module_name})"
+        return f"environment-specific settings ({module_name})"
     elif 'component' in file_path:
-        module_purpose = f"component configuration ({module_name})"
+        return f"component configuration ({module_name})"
     elif 'service' in file_path:
-        module_purpose = f"service configuration ({module_name})"
-    else:
-        module_purpose = f"{module_name} settings"
+        return f"service configuration ({module_name})"
+    return f"{module_name} settings"
+
+def insert_header(content, header):
+    """
+    Insert a header after any shebang, initial comments and blank lines.
+    """
+    lines = content.split('\n')
+    insert_index = leading_comment_lines(content)
+    return '\n'.join(lines[:insert_index]) + '\n' + header + '\n'.join(lines[insert_index:])
+
+def add_customization_header(file_path, content=None):
+    """
+    Add a customization header to a file.
+
+    Pass the file's content when it has already been read to avoid reading it again.
+    """
+    ext = os.path.splitext(file_path)[1]
+    template = HEADER_TEMPLATES.get(ext, DEFAULT_TEMPLATE)
     
-    # Determine setting example based on file content
-    setting_example = "SETTING_NAME"
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            # Look for potential setting names
-            if ext in ['.js', '.ts']:
-                matches = re.findall(r'(?:const|let|var)\s+([A-Z_]+)\s*=', content)
-                if matches:
-                    setting_example = matches[0]
-            elif ext == '.py':
-                matches = re.findall(r'([A-Z_]+)\s*=', content)
-                if matches:
-                    setting_example = matches[0]
-    except Exception as e:
-        print(f"Error analyzing file {file_path}: {e}")
+    if content is None:
+        content = read_file(file_path)
+        if content is None:
+            return False
     
     # Format the header
     header = template.format(
-        module_purpose=module_purpose,
-        setting_example=setting_example
+        module_purpose=get_module_purpose(file_path),
+        setting_example=find_setting_example(ext, content)
     )
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Add header after any initial comments or imports
-        lines = content.split('\n')
-        insert_index = 0
-        
-        # Skip shebang line if present
-        if lines and lines[0].startswith('#!'):
-            insert_index = 1
-        
-        # Skip initial comments
-        while insert_index < len(lines) and (
-            lines[insert_index].strip().startswith('//') or
-            lines[insert_index].strip().startswith('/*') or
-            lines[insert_index].strip().startswith('*') or
-            lines[insert_index].strip().startswith('#') or
-            lines[insert_index].strip() == ''
-        ):
-            insert_index += 1
-        
-        # Insert header
-        new_content = '\n'.join(lines[:insert_index]) + '\n' + header + '\n'.join(lines[insert_index:])
-        
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
+            f.write(insert_header(content, header))
         
         print(f"Added customization header to {file_path}")
         return True
@@ -242,56 +250,156 @@ def add_customization_header(file_path):
         print(f"Error updating file {file_path}: {e}")
         return False
 
-def scan_directory(base_dir):
+class HeaderDecisionCache(FileCache):
+    """
+    On-disk cache of whether each scanned file needs a customization header.
+    
+    The cache is discarded when the classifier's scan limit changes.
+    """
+    version = 3
+    description = 'header'
+    
+    def __init__(self, cache_path, project_root, scan_limit=CONFIG_SCAN_LIMIT):
+        super().__init__(cache_path, project_root)
+        self.scan_limit = scan_limit
+    
+    def identity(self):
+        return {'scan_limit': self.scan_limit}
+
+class HeaderPipeline:
+    """
+    Runs one file through classification, header detection and header insertion,
+    reading its content once and handing it to every step.
+    
+    With a cache, files whose decision is known from an earlier run are not read at all.
+    """
+    def __init__(self, file_path, st=None, cache=None, scan_limit=CONFIG_SCAN_LIMIT):
+        self.file_path = file_path
+        self.st = st
+        self.cache = cache
+        self.scan_limit = scan_limit
+        self.content = None
+    
+    def needs_header(self):
+        """
+        Return True if the file is a config file without a customization header.
+        """
+        return (is_config_file(self.file_path, self.content, self.scan_limit) and
+                not has_customization_header(self.file_path, self.content))
+    
+    def run(self):
+        """
+        Add a header if the file is a config file without one; return True if it was updated.
+        """
+        cache = self.cache if self.st is not None else None
+        if cache is not None:
+            entry = cache.lookup(self.file_path, self.st)
+            if entry is not None and not entry['needs_header']:
+                return False
+        
+        self.content = read_file(self.file_path)
+        if self.content is None:
+            return False
+        
+        if cache is None:
+            return self.needs_header() and add_customization_header(self.file_path, self.content)
+        
+        digest = content_hash(self.content.encode('utf-8'))
+        entry = cache.lookup_hash(self.file_path, self.st, digest)
+        if entry is None:
+            entry = cache.store(self.file_path, self.st, digest, {'needs_header': self.needs_header()})
+        if not entry['needs_header'] or not add_customization_header(self.file_path, self.content):
+            return False
+        
+        # Record the updated file so the next run skips it without reading it; with no
+        # hash, a later change to the file is always re-classified
+        try:
+            cache.store(self.file_path, os.stat(self.file_path), None, {'needs_header': False})
+        except OSError as e:
+            print(f"Error reading file {self.file_path}: {e}")
+        return True
+
+def scan_directory(base_dir, project_root=None, cache=None, scan_limit=CONFIG_SCAN_LIMIT):
     """
     Scan a directory for files that might need customization headers.
     """
     files_updated = 0
     files_scanned = 0
+    index = get_tree_index(project_root or base_dir, DIRECTORIES_TO_EXCLUDE)
+    profiler = get_profiler()
     
-    for root, dirs, files in os.walk(base_dir):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in DIRECTORIES_TO_EXCLUDE]
-        
-        for file in files:
-            file_path = os.path.join(root, file)
-            ext = os.path.splitext(file)[1]
-            
-            if ext in FILE_EXTENSIONS:
-                files_scanned += 1
-                
-                # Check if file is a configuration file
-                if is_config_file(file_path):
-                    # Check if file already has a customization header
-                    if not has_customization_header(file_path):
-                        # Add customization header
-                        if add_customization_header(file_path):
-                            files_updated += 1
+    for file_path, st in index.walk(base_dir, FILE_EXTENSIONS):
+        files_scanned += 1
+        with profiler.file(file_path):
+            if HeaderPipeline(file_path, st, cache, scan_limit).run():
+                files_updated += 1
     
+    profiler.count('headers_added', files_updated)
     return files_scanned, files_updated
 
-def main():
+def parse_args(argv=None):
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description="Add customization headers to configuration files.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Skip files whose content is unchanged since the last run")
+    parser.add_argument('--cache-path', default=None,
+                        help=f"Incremental cache file (default: {CACHE_PATH})")
+    parser.add_argument('--scan-limit', type=int, default=CONFIG_SCAN_LIMIT,
+                        help="Characters at the start of a file searched for configuration patterns (default: the whole file)")
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv if argv is not None else [])
+    if args.scan_limit is not None and args.scan_limit <= 0:
+        parser.error("--scan-limit must be a positive number")
+    return args
+
+def main(argv=None):
     """
     Main function to update customization headers across the codebase.
     """
-    print("Updating customization headers...")
+    args = parse_args(argv)
     
     # Get project root directory
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     
+    with profile_run('update_customization_headers', args, project_root):
+        return run(args, project_root)
+
+def run(args, project_root):
+    """
+    Update customization headers under the project root with parsed arguments.
+    """
+    print("Updating customization headers...")
+    profiler = get_profiler()
+    
+    cache = None
+    if args.incremental:
+        cache_path = args.cache_path or os.path.join(project_root, CACHE_PATH)
+        with profiler.phase('load cache'):
+            cache = HeaderDecisionCache.load(cache_path, project_root, args.scan_limit)
+    
     total_scanned = 0
     total_updated = 0
     
     # Scan directories
-    for directory in DIRECTORIES_TO_SCAN:
-        dir_path = os.path.join(project_root, directory)
-        if os.path.exists(dir_path):
+    index = get_tree_index(project_root, DIRECTORIES_TO_EXCLUDE)
+    for directory, dir_path in index.normalize_roots(DIRECTORIES_TO_SCAN):
+        if dir_path:
             print(f"Scanning {dir_path}...")
-            scanned, updated = scan_directory(dir_path)
+            with profiler.phase('scan'):
+                scanned, updated = scan_directory(dir_path, project_root, cache, args.scan_limit)
             total_scanned += scanned
             total_updated += updated
         else:
-            print(f"Directory not found: {dir_path}")
+            print(f"Directory not found: {os.path.join(project_root, directory)}")
+    
+    if cache is not None:
+        with profiler.phase('save cache'):
+            try:
+                cache.save()
+            except Exception as e:
+                print(f"Error writing header cache: {e}")
     
     print(f"Scan complete. Scanned {total_scanned} files, updated {total_updated} files.")
     
@@ -302,4 +410,4 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main(sys.argv[1:]))
\ No newline at end of file